@@ -1,24 +1,27 @@
 """CronPal - A CLI tool for parsing and analyzing cron expressions."""
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from cronpal.error_handler import ErrorHandler, suggest_fix
-from cronpal.exceptions import (
-    CronPalError,
-    FieldError,
-    InvalidCronExpression,
-    ParseError,
-    ValidationError,
-)
-from cronpal.field_parser import FieldParser
-from cronpal.models import CronExpression, CronField, FieldType
-from cronpal.parser import create_parser
-from cronpal.pretty_printer import PrettyPrinter
-from cronpal.scheduler import CronScheduler
-from cronpal.special_parser import SpecialStringParser
-from cronpal.validators import validate_expression
+if TYPE_CHECKING:
+    from cronpal.error_handler import ErrorHandler, suggest_fix
+    from cronpal.exceptions import (
+        CronPalError,
+        FieldError,
+        InvalidCronExpression,
+        ParseError,
+        ValidationError,
+    )
+    from cronpal.field_parser import FieldParser
+    from cronpal.models import CronExpression, CronField, FieldType
+    from cronpal.parser import create_parser
+    from cronpal.pretty_printer import PrettyPrinter
+    from cronpal.scheduler import CronScheduler
+    from cronpal.special_parser import SpecialStringParser
+    from cronpal.validators import validate_expression
 
 __all__ = [
     "create_parser",
@@ -37,4 +40,45 @@ __all__ = [
     "FieldError",
     "ErrorHandler",
     "suggest_fix",
-]
\ No newline at end of file
+]
+
+# Submodule providing each public name. Submodules are only imported when
+# one of their names is first accessed, so `cronpal --version` does not pay
+# for loading the parser, scheduler and pytz.
+_LAZY_IMPORTS = {
+    "create_parser": "cronpal.parser",
+    "CronExpression": "cronpal.models",
+    "CronField": "cronpal.models",
+    "FieldType": "cronpal.models",
+    "FieldParser": "cronpal.field_parser",
+    "SpecialStringParser": "cronpal.special_parser",
+    "CronScheduler": "cronpal.scheduler",
+    "PrettyPrinter": "cronpal.pretty_printer",
+    "validate_expression": "cronpal.validators",
+    "CronPalError": "cronpal.exceptions",
+    "InvalidCronExpression": "cronpal.exceptions",
+    "ValidationError": "cronpal.exceptions",
+    "ParseError": "cronpal.exceptions",
+    "FieldError": "cronpal.exceptions",
+    "ErrorHandler": "cronpal.error_handler",
+    "suggest_fix": "cronpal.error_handler",
+}
+
+
+def __getattr__(name):
+    """Import public names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
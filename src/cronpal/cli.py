@@ -1,43 +1,71 @@
 #!/usr/bin/env python3
 """Main CLI entry point for CronPal."""
 
+import functools
+import itertools
+import os
 import sys
-from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 from cronpal.color_utils import (
+    TIP_SYMBOL,
     ColorConfig,
+    ColorScheme,
     format_error_message,
     format_success_message,
     get_color_config,
     set_color_config,
 )
-from cronpal.error_handler import ErrorHandler, suggest_fix
 from cronpal.exceptions import CronPalError
-from cronpal.field_parser import FieldParser
-from cronpal.models import CronExpression
-from cronpal.parser import create_parser
-from cronpal.pretty_printer import PrettyPrinter
-from cronpal.scheduler import CronScheduler
-from cronpal.special_parser import SpecialStringParser
-from cronpal.timezone_utils import (
-    format_datetime_with_timezone,
-    get_current_time,
-    get_timezone,
-    get_timezone_abbreviation,
-    get_timezone_offset,
-    list_common_timezones,
+from cronpal.parser import create_parser, parse_simple_args
+
+# The parsers, scheduler, pretty printer and timezone helpers (which pull in
+# pytz) are imported where they are used, so `--version`, `--help` and
+# `--list-timezones` don't pay for them.
+if TYPE_CHECKING:
+    from datetime import datetime, tzinfo
+
+    from cronpal.field_parser import FieldParser
+    from cronpal.models import CronExpression
+    from cronpal.special_parser import SpecialStringParser
+
+# Abbreviated names for verbose output
+_MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_DAY_NAMES = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+
+# Arguments that only apply to a single expression, so they can't be
+# combined with --file or --stdin, with how to name them in errors
+_SINGLE_EXPRESSION_ARGS = (
+    ("expression", "an expression"),
+    ("next", "--next"),
+    ("previous", "--previous"),
+    ("pretty", "--pretty"),
+    ("verbose", "--verbose"),
+    ("timezone", "--timezone"),
 )
-from cronpal.validators import validate_expression, validate_expression_format
+
+# Format for run times when no timezone was requested
+RUN_TIME_FORMAT = "%Y-%m-%d %H:%M:%S %A"
 
 
 def main(args=None):
     """Main entry point for the cronpal CLI."""
-    parser = create_parser()
-    parsed_args = parser.parse_args(args)
-
-    # Initialize color configuration
-    use_colors = not getattr(parsed_args, 'no_color', False)
-    color_config = ColorConfig(use_colors=use_colors)
+    if args is None:
+        args = sys.argv[1:]
+
+    # Plain command lines are parsed directly; anything else (help, errors,
+    # unusual option forms) goes through the full parser
+    parsed_args = parse_simple_args(args)
+    if parsed_args is None:
+        parsed_args = create_parser().parse_args(args)
+
+    # Initialize color configuration. Unless --no-color is given, colors are
+    # only used when writing to a terminal (and NO_COLOR is not set)
+    if getattr(parsed_args, 'no_color', False):
+        color_config = ColorConfig(use_colors=False)
+    else:
+        color_config = ColorConfig()
     set_color_config(color_config)
 
     # Handle version flag
@@ -48,6 +76,8 @@ def main(args=None):
 
     # Handle list timezones flag
     if parsed_args.list_timezones:
+        from cronpal.timezone_utils import list_common_timezones
+
         print(color_config.header("Available timezones:"))
         timezones = list_common_timezones()
         for tz in timezones:
@@ -55,15 +85,33 @@ def main(args=None):
         print(f"\n{color_config.info(f'Total: {len(timezones)} timezones')}")
         return 0
 
+    # Handle batch mode
+    if parsed_args.file is not None or parsed_args.stdin:
+        conflicts = [
+            name for dest, name in _SINGLE_EXPRESSION_ARGS
+            if getattr(parsed_args, dest) is not None
+            and getattr(parsed_args, dest) is not False
+        ]
+        if conflicts:
+            # Exits with a usage message
+            create_parser().error(
+                f"{', '.join(conflicts)} cannot be used with --file or --stdin"
+            )
+        return _check_expressions(parsed_args.file)
+
     # Handle cron expression
     if parsed_args.expression:
-        # Create error handler
-        error_handler = ErrorHandler(verbose=parsed_args.verbose)
-
         try:
             # Get timezone if specified
             timezone = None
             if parsed_args.timezone:
+                from cronpal.timezone_utils import (
+                    get_current_time,
+                    get_timezone,
+                    get_timezone_abbreviation,
+                    get_timezone_offset,
+                )
+
                 try:
                     timezone = get_timezone(parsed_args.timezone)
                     current_time = get_current_time(timezone)
@@ -74,108 +122,52 @@ def main(args=None):
                 except ValueError as e:
                     raise CronPalError(f"Invalid timezone: {e}")
 
-            # Validate the expression first
-            validate_expression(parsed_args.expression)
-
-            # Check if it's a special string
-            special_parser = SpecialStringParser()
-            if special_parser.is_special_string(parsed_args.expression):
-                # Parse as special string
-                cron_expr = special_parser.parse(parsed_args.expression)
-
-                if parsed_args.pretty:
-                    # Pretty print mode
-                    if cron_expr.raw_expression.lower() == "@reboot":
-                        print(format_success_message(
-                            f"Valid cron expression: {cron_expr.raw_expression}",
-                            "This expression runs at system startup/reboot only."
-                        ))
-                    else:
-                        printer = PrettyPrinter(cron_expr, use_colors=use_colors)
-                        print()
-                        print(printer.print_table())
-                        print()
-                        print(color_config.header("Summary: ") +
-                              color_config.info(printer.get_summary()))
-
-                        if parsed_args.verbose:
-                            print()
-                            print(printer.print_detailed())
-                else:
-                    # Normal output
-                    print(format_success_message(
-                        f"Valid cron expression: {cron_expr.raw_expression}"
-                    ))
-
-                    if parsed_args.verbose:
-                        print(f"  {color_config.field('Special string')}: "
-                              f"{color_config.value(cron_expr.raw_expression)}")
-                        description = special_parser.get_description(cron_expr.raw_expression)
-                        print(f"  {color_config.field('Description')}: "
-                              f"{color_config.info(description)}")
-
-                        # For @reboot, we don't have fields to show
-                        if cron_expr.raw_expression.lower() != "@reboot":
-                            _print_verbose_fields(cron_expr)
-            else:
-                # Parse the expression into fields
-                fields = validate_expression_format(parsed_args.expression)
-
-                # Create a CronExpression object
-                cron_expr = CronExpression(parsed_args.expression)
-
-                # Parse all fields
-                field_parser = FieldParser()
-                cron_expr.minute = field_parser.parse_minute(fields[0])
-                cron_expr.hour = field_parser.parse_hour(fields[1])
-                cron_expr.day_of_month = field_parser.parse_day_of_month(fields[2])
-                cron_expr.month = field_parser.parse_month(fields[3])
-                cron_expr.day_of_week = field_parser.parse_day_of_week(fields[4])
-
-                if parsed_args.pretty:
-                    # Pretty print mode
-                    printer = PrettyPrinter(cron_expr, use_colors=use_colors)
-                    print()
-                    print(printer.print_table())
-                    print()
-                    print(color_config.header("Summary: ") +
-                          color_config.info(printer.get_summary()))
-
-                    if parsed_args.verbose:
-                        print()
-                        print(printer.print_detailed())
-                else:
-                    # Normal output
-                    print(format_success_message(
-                        f"Valid cron expression: {cron_expr.raw_expression}"
-                    ))
-
-                    if parsed_args.verbose:
-                        print(f"  {color_config.field('Raw expression')}: "
-                              f"{color_config.value(cron_expr.raw_expression)}")
-                        print(f"  {color_config.field('Validation')}: "
-                              f"{color_config.success('PASSED')}")
-                        _print_verbose_fields(cron_expr)
+            # Validate and parse the expression
+            cron_expr = _parse_cached(parsed_args.expression)
+
+            # Show the expression itself
+            special_parser = _get_special_parser()
+            is_special = special_parser.is_special_string(parsed_args.expression)
+            _print_expression(
+                cron_expr,
+                parsed_args,
+                color_config,
+                special_parser if is_special else None
+            )
+
+            # Next and previous runs are measured from the same moment
+            now = None
+            if parsed_args.next is not None or parsed_args.previous is not None:
+                from cronpal.timezone_utils import get_current_time
+
+                now = get_current_time(timezone)
 
             # Show next run times if requested
             if parsed_args.next is not None:
-                _print_next_runs(cron_expr, parsed_args.next, timezone)
+                _print_next_runs(
+                    cron_expr, parsed_args.next, color_config, timezone, now,
+                    assume_valid=True
+                )
 
             # Show previous run times if requested
             if parsed_args.previous is not None:
-                _print_previous_runs(cron_expr, parsed_args.previous, timezone)
+                _print_previous_runs(
+                    cron_expr, parsed_args.previous, color_config, timezone, now,
+                    assume_valid=True
+                )
 
             return 0
 
         except CronPalError as e:
-            # Use error handler for formatting
+            # Only load the error helpers when something actually failed
+            from cronpal.error_handler import suggest_fix
+
             print(format_error_message(str(e)), file=sys.stderr)
 
             # Suggest a fix if possible
             suggestion = suggest_fix(e, parsed_args.expression)
             if suggestion:
-                color_config = get_color_config()
-                print(f"  {color_config.warning('💡 Suggestion:')} {suggestion}",
+                print(f"  {color_config.warning(f'{TIP_SYMBOL} Suggestion:')} {suggestion}",
                       file=sys.stderr)
 
             return 1
@@ -186,121 +178,505 @@ def main(args=None):
             return 2
 
     # If no arguments provided, show help
-    parser.print_help()
+    create_parser().print_help()
     return 0
 
 
-def _print_verbose_fields(cron_expr: CronExpression):
+def _print_expression(
+    cron_expr: "CronExpression",
+    parsed_args,
+    config: ColorConfig,
+    special_parser: Optional["SpecialStringParser"] = None
+):
+    """
+    Print a parsed cron expression in normal or pretty format.
+
+    Args:
+        cron_expr: The CronExpression to print.
+        parsed_args: The parsed command line arguments.
+        config: The color configuration to use.
+        special_parser: The special string parser, if the expression is a
+            special string.
+    """
+    # @reboot has no fields to show
+    is_reboot = cron_expr.raw_expression.lower() == "@reboot"
+
+    if parsed_args.pretty:
+        # Pretty print mode
+        if is_reboot:
+            print(format_success_message(
+                f"Valid cron expression: {cron_expr.raw_expression}",
+                "This expression runs at system startup/reboot only."
+            ))
+            return
+
+        from cronpal.pretty_printer import PrettyPrinter
+
+        printer = PrettyPrinter(cron_expr, use_colors=config.use_colors)
+        print()
+        print(printer.print_table())
+        print()
+        print(config.header("Summary: ") + config.info(printer.get_summary()))
+
+        if parsed_args.verbose:
+            print()
+            print(printer.print_detailed())
+        return
+
+    # Normal output
+    print(format_success_message(
+        f"Valid cron expression: {cron_expr.raw_expression}"
+    ))
+
+    if not parsed_args.verbose:
+        return
+
+    if special_parser is not None:
+        print(f"  {config.field('Special string')}: "
+              f"{config.value(cron_expr.raw_expression)}")
+        description = special_parser.get_description(cron_expr.raw_expression)
+        print(f"  {config.field('Description')}: {config.info(description)}")
+    else:
+        print(f"  {config.field('Raw expression')}: "
+              f"{config.value(cron_expr.raw_expression)}")
+        print(f"  {config.field('Validation')}: {config.success('PASSED')}")
+
+    if not is_reboot:
+        _print_verbose_fields(cron_expr, config)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_special_parser() -> "SpecialStringParser":
+    """
+    Get the shared special string parser, creating it on first use.
+
+    Returns:
+        The SpecialStringParser instance.
+    """
+    from cronpal.special_parser import SpecialStringParser
+
+    return SpecialStringParser()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_parser() -> "FieldParser":
+    """
+    Get the shared field parser, creating it on first use.
+
+    Returns:
+        The FieldParser instance.
+    """
+    from cronpal.field_parser import FieldParser
+
+    return FieldParser()
+
+
+def _check_expressions(path: Optional[str] = None) -> int:
+    """
+    Check many expressions, one per line, from a file or stdin.
+
+    Args:
+        path: File to read from. Reads stdin if not provided.
+
+    Returns:
+        0 if every expression is valid, 1 otherwise.
+    """
+    if path is None:
+        return _check_lines(sys.stdin)
+
+    try:
+        with open(path, encoding="utf-8") as source:
+            return _check_lines(source)
+    except OSError as e:
+        print(format_error_message(f"Cannot read {path}: {e.strerror}"), file=sys.stderr)
+        return 1
+
+
+def _check_lines(lines) -> int:
+    """
+    Check each expression in lines, printing a result as each is checked.
+
+    Blank lines and lines starting with '#' are skipped. Parsed expressions
+    are cached, so repeated expressions are cheap.
+
+    Args:
+        lines: Iterable of lines, one expression per line.
+
+    Returns:
+        0 if every expression is valid, 1 otherwise.
+    """
+    config = get_color_config()
+    result = 0
+
+    for line_number, line in enumerate(lines, 1):
+        expression = line.strip()
+        if not expression or expression.startswith("#"):
+            continue
+
+        try:
+            _parse_cached(expression)
+        except CronPalError as e:
+            print(format_error_message(f"Line {line_number}: {expression}: {e}",
+                                       config=config),
+                  file=sys.stderr)
+            result = 1
+        except Exception as e:
+            print(format_error_message(
+                f"Line {line_number}: {expression}: Unexpected error: {e}",
+                config=config
+            ), file=sys.stderr)
+            result = 1
+        else:
+            print(format_success_message(f"Valid cron expression: {expression}",
+                                         config=config))
+
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(expression: str) -> "CronExpression":
+    """
+    Validate and parse a cron expression or special string.
+
+    Results are cached, so repeated expressions (common in crontab files)
+    are only parsed once. Callers must not modify the returned expression.
+
+    Args:
+        expression: The expression to parse.
+
+    Returns:
+        The parsed CronExpression.
+
+    Raises:
+        CronPalError: If the expression is invalid.
+    """
+    special_parser = _get_special_parser()
+    if special_parser.is_special_string(expression):
+        from cronpal.validators import parse_and_validate
+
+        parse_and_validate(expression)
+        return special_parser.parse(expression)
+
+    return _get_field_parser().parse_all(expression)
+
+
+def _print_verbose_fields(cron_expr: "CronExpression", config: ColorConfig):
     """
     Print verbose field information.
 
+    The output is collected and written to stdout in a single call.
+
     Args:
         cron_expr: The CronExpression to print fields for.
+        config: The color configuration to use.
     """
-    config = get_color_config()
+    from cronpal.models import iter_mask
+
+    field, value = config.field, config.value
+    parts = []
 
     if cron_expr.minute:
-        print(f"  {config.field('Minute field')}: "
-              f"{config.value(cron_expr.minute.raw_value)}")
-        if cron_expr.minute.parsed_values:
-            _print_field_values("    ", cron_expr.minute.parsed_values)
+        parts.append(f"  {field('Minute field')}: "
+                     f"{value(cron_expr.minute.raw_value)}\n")
+        if cron_expr.minute.mask:
+            _add_field_values(
+                parts, "    ", tuple(iter_mask(cron_expr.minute.mask)), config
+            )
 
     if cron_expr.hour:
-        print(f"  {config.field('Hour field')}: "
-              f"{config.value(cron_expr.hour.raw_value)}")
-        if cron_expr.hour.parsed_values:
-            _print_field_values("    ", cron_expr.hour.parsed_values)
+        parts.append(f"  {field('Hour field')}: "
+                     f"{value(cron_expr.hour.raw_value)}\n")
+        if cron_expr.hour.mask:
+            _add_field_values(
+                parts, "    ", tuple(iter_mask(cron_expr.hour.mask)), config
+            )
 
     if cron_expr.day_of_month:
-        print(f"  {config.field('Day of month field')}: "
-              f"{config.value(cron_expr.day_of_month.raw_value)}")
-        if cron_expr.day_of_month.parsed_values:
-            _print_field_values("    ", cron_expr.day_of_month.parsed_values)
+        parts.append(f"  {field('Day of month field')}: "
+                     f"{value(cron_expr.day_of_month.raw_value)}\n")
+        if cron_expr.day_of_month.mask:
+            _add_field_values(
+                parts, "    ", tuple(iter_mask(cron_expr.day_of_month.mask)), config
+            )
 
     if cron_expr.month:
-        print(f"  {config.field('Month field')}: "
-              f"{config.value(cron_expr.month.raw_value)}")
-        if cron_expr.month.parsed_values:
-            _print_field_values("    ", cron_expr.month.parsed_values)
-            _print_month_names("    ", cron_expr.month.parsed_values)
+        parts.append(f"  {field('Month field')}: "
+                     f"{value(cron_expr.month.raw_value)}\n")
+        if cron_expr.month.mask:
+            values = tuple(iter_mask(cron_expr.month.mask))
+            _add_field_values(parts, "    ", values, config)
+            _add_month_names(parts, "    ", values, config)
 
     if cron_expr.day_of_week:
-        print(f"  {config.field('Day of week field')}: "
-              f"{config.value(cron_expr.day_of_week.raw_value)}")
-        if cron_expr.day_of_week.parsed_values:
-            _print_field_values("    ", cron_expr.day_of_week.parsed_values)
-            _print_day_names("    ", cron_expr.day_of_week.parsed_values)
+        parts.append(f"  {field('Day of week field')}: "
+                     f"{value(cron_expr.day_of_week.raw_value)}\n")
+        if cron_expr.day_of_week.mask:
+            values = tuple(iter_mask(cron_expr.day_of_week.mask))
+            _add_field_values(parts, "    ", values, config)
+            _add_day_names(parts, "    ", values, config)
+
+    sys.stdout.write("".join(parts))
+
+
+def _add_field_values(
+    parts: List[str],
+    prefix: str,
+    values: Tuple[int, ...],
+    config: ColorConfig
+):
+    """
+    Add field values in a nice format to the output.
+
+    Args:
+        parts: Output lines to append to.
+        prefix: Prefix for each line.
+        values: Sorted values to print.
+        config: The color configuration to use.
+    """
+    field, value = config.field, config.value
+    if len(values) <= 10:
+        values_str = _format_int_list(values)
+        parts.append(f"{prefix}{field('Values')}: {value(values_str)}\n")
+    else:
+        truncated = f"{_format_int_list(values[:5])} ... {_format_int_list(values[-5:])}"
+        parts.append(f"{prefix}{field('Values')}: {value(truncated)}\n")
+        parts.append(f"{prefix}{field('Total')}: "
+                     f"{config.highlight(f'{len(values)} values')}\n")
 
 
-def _print_field_values(prefix: str, values: set):
+def _format_int_list(values: Tuple[int, ...]) -> str:
     """
-    Print field values in a nice format.
+    Format values the way str() formats a list of ints.
 
     Args:
+        values: The values to format.
+
+    Returns:
+        The values as a string, e.g. "[1, 2, 3]".
+    """
+    return "[" + ", ".join(map(str, values)) + "]"
+
+
+def _add_month_names(
+    parts: List[str],
+    prefix: str,
+    values: Tuple[int, ...],
+    config: ColorConfig
+):
+    """
+    Add month names for month values to the output.
+
+    Args:
+        parts: Output lines to append to.
         prefix: Prefix for each line.
-        values: Set of values to print.
+        values: Sorted month numbers to convert to names.
+        config: The color configuration to use.
     """
-    config = get_color_config()
-    sorted_values = sorted(values)
-    if len(sorted_values) <= 10:
-        values_str = str(sorted_values)
-        print(f"{prefix}{config.field('Values')}: {config.value(values_str)}")
-    else:
-        truncated = f"{sorted_values[:5]} ... {sorted_values[-5:]}"
-        print(f"{prefix}{config.field('Values')}: {config.value(truncated)}")
-        print(f"{prefix}{config.field('Total')}: "
-              f"{config.highlight(f'{len(sorted_values)} values')}")
+    names = _format_month_names(values)
+
+    if names is not None:
+        parts.append(f"{prefix}{config.field('Months')}: "
+                     f"{config.info(names)}\n")
 
 
-def _print_month_names(prefix: str, values: set):
+def _add_day_names(
+    parts: List[str],
+    prefix: str,
+    values: Tuple[int, ...],
+    config: ColorConfig
+):
     """
-    Print month names for month values.
+    Add day names for day of week values to the output.
 
     Args:
+        parts: Output lines to append to.
         prefix: Prefix for each line.
-        values: Set of month numbers to convert to names.
+        values: Sorted day numbers to convert to names.
+        config: The color configuration to use.
     """
-    config = get_color_config()
-    month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    parts.append(f"{prefix}{config.field('Days')}: "
+                 f"{config.info(_format_day_names(values))}\n")
+
+
+@functools.lru_cache(maxsize=64)
+def _format_month_names(values: Tuple[int, ...]) -> Optional[str]:
+    """
+    Format the month names for sorted month numbers.
 
-    sorted_values = sorted(values)
-    names = [month_names[v - 1] for v in sorted_values if 1 <= v <= 12]
+    Args:
+        values: Sorted month numbers.
 
-    if len(names) <= 10:
-        print(f"{prefix}{config.field('Months')}: "
-              f"{config.info(', '.join(names))}")
+    Returns:
+        Comma-separated month names, or None if there are too many to show.
+    """
+    months = [v for v in values if 1 <= v <= 12]
+    if len(months) > 10:
+        return None
+    return ", ".join(_MONTH_NAMES[v - 1] for v in months)
 
 
-def _print_day_names(prefix: str, values: set):
+@functools.lru_cache(maxsize=64)
+def _format_day_names(values: Tuple[int, ...]) -> str:
     """
-    Print day names for day of week values.
+    Format the day names for sorted day of week numbers.
+
+    The field parser folds 7 (Sunday) into 0, so every value indexes
+    _DAY_NAMES directly.
 
     Args:
-        prefix: Prefix for each line.
-        values: Set of day numbers to convert to names.
+        values: Sorted day numbers.
+
+    Returns:
+        Comma-separated day names.
     """
-    config = get_color_config()
-    day_names = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+    return ", ".join(map(_DAY_NAMES.__getitem__, values))
+
+
+def _timezone_suffix(dt: "datetime") -> str:
+    """
+    Build the timezone part of a formatted run time (e.g. " EST (-05:00)").
+
+    Matches the suffix produced by format_datetime_with_timezone().
+
+    Args:
+        dt: A timezone-aware run time.
+
+    Returns:
+        The abbreviation and UTC offset, with a leading space.
+    """
+    tz_offset = dt.strftime("%z")
+    if tz_offset:
+        tz_offset = f"{tz_offset[:3]}:{tz_offset[3:]}"
+    return f" {dt.strftime('%Z')} ({tz_offset})"
+
+
+@functools.lru_cache(maxsize=256)
+def _humanize_delta(days: int, minutes: int, direction: str) -> str:
+    """
+    Describe how far away a run time is (e.g. "in 5 minutes", "yesterday").
+
+    Args:
+        days: Whole days between now and the run.
+        minutes: Remaining minutes after the whole days.
+        direction: "future" for upcoming runs, "past" for previous runs.
 
-    sorted_values = sorted(values)
-    names = [day_names[v] for v in sorted_values if 0 <= v <= 6]
+    Returns:
+        The relative time, or an empty string if it is a week or more away.
+    """
+    future = direction == "future"
+
+    if days == 0:
+        if minutes < 60:
+            amount = f"{minutes} minute{'s' if minutes != 1 else ''}"
+        else:
+            hours = minutes // 60
+            amount = f"{hours} hour{'s' if hours != 1 else ''}"
+    elif days == 1:
+        return "tomorrow" if future else "yesterday"
+    elif days < 7:
+        amount = f"{days} days"
+    else:
+        return ""
+
+    return f"in {amount}" if future else f"{amount} ago"
+
+
+def _run_row_templates(
+    config: ColorConfig,
+    time_scheme: ColorScheme,
+    relative_scheme: ColorScheme
+) -> Tuple[str, str]:
+    """
+    Build the str.format templates for run listing rows.
 
-    if len(names) <= 7:
-        print(f"{prefix}{config.field('Days')}: "
-              f"{config.info(', '.join(names))}")
+    Args:
+        config: The color configuration to use.
+        time_scheme: Color scheme for the run time.
+        relative_scheme: Color scheme for the relative time.
 
+    Returns:
+        Tuple of (row, row with relative time) templates. Fields are the
+        index, the formatted run time and the relative time.
+    """
+    value_on, value_off = config.get_codes(ColorScheme.VALUE)
+    time_on, time_off = config.get_codes(time_scheme)
+    sep_on, sep_off = config.get_codes(ColorScheme.SEPARATOR)
+    rel_on, rel_off = config.get_codes(relative_scheme)
+
+    row = f"  {value_on}{{0}}.{value_off} {time_on}{{1}}{time_off}"
+    row_relative = (
+        f"{row} {sep_on}({sep_off}({rel_on}{{2}}{rel_off}){sep_on}){sep_off}"
+    )
+    return row, row_relative
+
+
+def _add_run_rows(
+    lines: List[str],
+    runs: Iterable["datetime"],
+    now: "datetime",
+    timezone,
+    templates: Tuple[str, str],
+    direction: str
+):
+    """
+    Add one formatted row per run time to the output.
 
-def _print_next_runs(cron_expr: CronExpression, count: int, timezone=None):
+    Args:
+        lines: Output lines to append to.
+        runs: The run times to list.
+        now: The time the runs were calculated from.
+        timezone: The requested timezone, if any.
+        templates: Row templates from _run_row_templates().
+        direction: "future" for next runs, "past" for previous runs.
+    """
+    row, row_relative = templates
+    future = direction == "future"
+    suffixes: Dict[Optional["tzinfo"], str] = {}
+
+    for i, run_time in enumerate(runs, 1):
+        # Format the datetime with timezone info
+        formatted = run_time.strftime(RUN_TIME_FORMAT)
+        if timezone:
+            # Runs share a handful of offsets, so build each suffix once
+            suffix = suffixes.get(run_time.tzinfo)
+            if suffix is None:
+                suffix = suffixes[run_time.tzinfo] = _timezone_suffix(run_time)
+            formatted += suffix
+
+        # Add relative time for first few entries
+        if i <= 3:
+            delta = run_time - now if future else now - run_time
+            relative = _humanize_delta(delta.days, delta.seconds // 60, direction)
+
+            if relative:
+                lines.append(row_relative.format(i, formatted, relative))
+                continue
+
+        lines.append(row.format(i, formatted))
+
+
+def _print_next_runs(
+    cron_expr: "CronExpression",
+    count: int,
+    config: ColorConfig,
+    timezone=None,
+    now: Optional["datetime"] = None,
+    assume_valid: bool = False
+):
     """
     Print the next run times for a cron expression.
 
+    The output is collected and written to stdout in a single call.
+
     Args:
         cron_expr: The CronExpression to calculate runs for.
         count: Number of next runs to show.
+        config: The color configuration to use.
         timezone: Optional timezone for calculations.
+        now: Time to list runs from. Defaults to the current time.
+        assume_valid: Skip the completeness check for an expression that
+            was just parsed.
     """
-    config = get_color_config()
 
     # Don't show next runs for @reboot
     if cron_expr.raw_expression.lower() == "@reboot":
@@ -308,64 +684,66 @@ def _print_next_runs(cron_expr: CronExpression, count: int, timezone=None):
         return
 
     # Make sure we have parsed fields
-    if not cron_expr.is_valid():
+    if not assume_valid and not cron_expr.is_valid():
         print(f"\n{config.error('Next runs: Cannot calculate - incomplete expression')}")
         return
 
+    from cronpal.scheduler import CronScheduler
+
+    lines = []
+
     try:
         scheduler = CronScheduler(cron_expr, timezone)
-        next_runs = scheduler.get_next_runs(count)
-
-        print(f"\n{config.header(f'Next {count} run')}{'s' if count != 1 else ''}:")
-        for i, run_time in enumerate(next_runs, 1):
-            # Format the datetime with timezone info
-            if timezone:
-                formatted = format_datetime_with_timezone(run_time, timezone)
-            else:
-                formatted = run_time.strftime("%Y-%m-%d %H:%M:%S %A")
-
-            # Add relative time for first few entries
-            if i <= 3:
-                now = get_current_time(timezone)
-                delta = run_time - now
-
-                if delta.days == 0:
-                    if delta.seconds < 3600:
-                        minutes = delta.seconds // 60
-                        relative = f"in {minutes} minute{'s' if minutes != 1 else ''}"
-                    else:
-                        hours = delta.seconds // 3600
-                        relative = f"in {hours} hour{'s' if hours != 1 else ''}"
-                elif delta.days == 1:
-                    relative = "tomorrow"
-                elif delta.days < 7:
-                    relative = f"in {delta.days} days"
-                else:
-                    relative = ""
-
-                if relative:
-                    print(f"  {config.value(f'{i}.')} "
-                          f"{config.highlight(formatted)} "
-                          f"{config.separator('(')}({config.info(relative)}){config.separator(')')}")
-                else:
-                    print(f"  {config.value(f'{i}.')} {config.highlight(formatted)}")
-            else:
-                print(f"  {config.value(f'{i}.')} {config.highlight(formatted)}")
+        if now is None:
+            from cronpal.timezone_utils import get_current_time
+
+            now = get_current_time(timezone)
+        next_runs = scheduler.iter_next_runs(count, now)
+
+        # Find the first run before printing anything, so schedules that
+        # never run only show the error
+        first_run = next(next_runs)
+
+        templates = _run_row_templates(config, ColorScheme.HIGHLIGHT, ColorScheme.INFO)
+
+        lines.append(f"\n{config.header(f'Next {count} run')}{'s' if count != 1 else ''}:")
+        _add_run_rows(
+            lines,
+            itertools.chain((first_run,), next_runs),
+            now,
+            timezone,
+            templates,
+            "future"
+        )
 
     except Exception as e:
-        print(f"\n{config.error(f'Next runs: Error calculating - {e}')}")
+        lines.append(f"\n{config.error(f'Next runs: Error calculating - {e}')}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def _print_previous_runs(cron_expr: CronExpression, count: int, timezone=None):
+def _print_previous_runs(
+    cron_expr: "CronExpression",
+    count: int,
+    config: ColorConfig,
+    timezone=None,
+    now: Optional["datetime"] = None,
+    assume_valid: bool = False
+):
     """
     Print the previous run times for a cron expression.
 
+    The output is collected and written to stdout in a single call.
+
     Args:
         cron_expr: The CronExpression to calculate runs for.
         count: Number of previous runs to show.
+        config: The color configuration to use.
         timezone: Optional timezone for calculations.
+        now: Time to list runs from. Defaults to the current time.
+        assume_valid: Skip the completeness check for an expression that
+            was just parsed.
     """
-    config = get_color_config()
 
     # Don't show previous runs for @reboot
     if cron_expr.raw_expression.lower() == "@reboot":
@@ -373,54 +751,62 @@ def _print_previous_runs(cron_expr: CronExpression, count: int, timezone=None):
         return
 
     # Make sure we have parsed fields
-    if not cron_expr.is_valid():
+    if not assume_valid and not cron_expr.is_valid():
         print(f"\n{config.error('Previous runs: Cannot calculate - incomplete expression')}")
         return
 
+    from cronpal.scheduler import CronScheduler
+
+    lines = []
+
     try:
         scheduler = CronScheduler(cron_expr, timezone)
-        previous_runs = scheduler.get_previous_runs(count)
-
-        print(f"\n{config.header(f'Previous {count} run')}{'s' if count != 1 else ''} "
-              f"{config.info('(most recent first)')}:")
-        for i, run_time in enumerate(previous_runs, 1):
-            # Format the datetime with timezone info
-            if timezone:
-                formatted = format_datetime_with_timezone(run_time, timezone)
-            else:
-                formatted = run_time.strftime("%Y-%m-%d %H:%M:%S %A")
-
-            # Add relative time for first few entries
-            if i <= 3:
-                now = get_current_time(timezone)
-                delta = now - run_time
-
-                if delta.days == 0:
-                    if delta.seconds < 3600:
-                        minutes = delta.seconds // 60
-                        relative = f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-                    else:
-                        hours = delta.seconds // 3600
-                        relative = f"{hours} hour{'s' if hours != 1 else ''} ago"
-                elif delta.days == 1:
-                    relative = "yesterday"
-                elif delta.days < 7:
-                    relative = f"{delta.days} days ago"
-                else:
-                    relative = ""
-
-                if relative:
-                    print(f"  {config.value(f'{i}.')} "
-                          f"{config.info(formatted)} "
-                          f"{config.separator('(')}({config.warning(relative)}){config.separator(')')}")
-                else:
-                    print(f"  {config.value(f'{i}.')} {config.info(formatted)}")
-            else:
-                print(f"  {config.value(f'{i}.')} {config.info(formatted)}")
+        if now is None:
+            from cronpal.timezone_utils import get_current_time
+
+            now = get_current_time(timezone)
+        previous_runs = scheduler.iter_previous_runs(count, now)
+
+        # Find the first run before printing anything, so schedules that
+        # never run only show the error
+        first_run = next(previous_runs)
+
+        templates = _run_row_templates(config, ColorScheme.INFO, ColorScheme.WARNING)
+
+        lines.append(f"\n{config.header(f'Previous {count} run')}{'s' if count != 1 else ''} "
+                     f"{config.info('(most recent first)')}:")
+        _add_run_rows(
+            lines,
+            itertools.chain((first_run,), previous_runs),
+            now,
+            timezone,
+            templates,
+            "past"
+        )
 
     except Exception as e:
-        print(f"\n{config.error(f'Previous runs: Error calculating - {e}')}")
+        lines.append(f"\n{config.error(f'Previous runs: Error calculating - {e}')}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _exit(code: int):
+    """
+    Exit the process with the given code.
+
+    With CRONPAL_FAST_EXIT=1 the output streams are flushed and the process
+    exits immediately, skipping interpreter teardown. atexit handlers do not
+    run in that case, so it is opt-in.
+
+    Args:
+        code: The exit code.
+    """
+    if os.environ.get("CRONPAL_FAST_EXIT") == "1":
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    _exit(main())
\ No newline at end of file
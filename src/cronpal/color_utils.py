@@ -1,9 +1,12 @@
 """Color utilities for terminal output."""
 
+import codecs
+import functools
 import os
 import sys
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 try:
     import colorama
@@ -32,6 +35,46 @@ except ImportError:
         DIM = NORMAL = BRIGHT = RESET_ALL = ""
 
 
+def _supports_unicode(stream) -> bool:
+    """
+    Check if a stream can encode the status symbols.
+
+    Args:
+        stream: The stream to check.
+
+    Returns:
+        True if the stream has no encoding (e.g. StringIO) or a UTF one.
+    """
+    encoding = getattr(stream, "encoding", None)
+    if not encoding:
+        return True
+
+    try:
+        return codecs.lookup(encoding).name.startswith("utf")
+    except LookupError:
+        return False
+
+
+# Status symbols, with ASCII fallbacks for non-UTF-8 terminals (e.g. LANG=C)
+if _supports_unicode(sys.stdout):
+    SUCCESS_SYMBOL, ERROR_SYMBOL, TIP_SYMBOL = "✓", "✗", "💡"
+else:
+    SUCCESS_SYMBOL, ERROR_SYMBOL, TIP_SYMBOL = "[OK]", "[ERR]", "[TIP]"
+
+
+def _colors_forced() -> bool:
+    """
+    Check if colors are forced on by FORCE_COLOR or CLICOLOR_FORCE.
+
+    Returns:
+        True if FORCE_COLOR is set to any non-empty value, or
+        CLICOLOR_FORCE is set to anything other than "0".
+    """
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    return os.environ.get("CLICOLOR_FORCE", "0") not in ("", "0")
+
+
 class ColorScheme(Enum):
     """Color schemes for different output types."""
 
@@ -54,12 +97,30 @@ class ColorConfig:
         Initialize color configuration.
 
         Args:
-            use_colors: Whether to use colors. If None, auto-detect.
+            use_colors: Whether to use colors. If None, auto-detect: off if
+                NO_COLOR is set, on if FORCE_COLOR or CLICOLOR_FORCE is set,
+                otherwise on only when stdout is a terminal.
         """
+        # Define color mappings
+        self._colors: Dict[ColorScheme, str] = {
+            ColorScheme.SUCCESS: Fore.GREEN,
+            ColorScheme.ERROR: Fore.RED,
+            ColorScheme.WARNING: Fore.YELLOW,
+            ColorScheme.INFO: Fore.CYAN,
+            ColorScheme.HEADER: Fore.BLUE + Style.BRIGHT,
+            ColorScheme.FIELD: Fore.MAGENTA,
+            ColorScheme.VALUE: Fore.GREEN,
+            ColorScheme.SEPARATOR: Fore.LIGHTBLACK_EX,
+            ColorScheme.HIGHLIGHT: Fore.YELLOW + Style.BRIGHT,
+        }
+
         if use_colors is None:
             # Check NO_COLOR environment variable
             if os.environ.get("NO_COLOR"):
                 self.use_colors = False
+            # Colors forced on; no need to check the terminal
+            elif _colors_forced():
+                self.use_colors = COLORS_AVAILABLE
             # Check if output is to a terminal
             elif not sys.stdout.isatty():
                 self.use_colors = False
@@ -68,18 +129,59 @@ class ColorConfig:
         else:
             self.use_colors = use_colors and COLORS_AVAILABLE
 
-        # Define color mappings
-        self.colors = {
-            ColorScheme.SUCCESS: Fore.GREEN,
-            ColorScheme.ERROR: Fore.RED,
-            ColorScheme.WARNING: Fore.YELLOW,
-            ColorScheme.INFO: Fore.CYAN,
-            ColorScheme.HEADER: Fore.BLUE + Style.BRIGHT,
-            ColorScheme.FIELD: Fore.MAGENTA,
-            ColorScheme.VALUE: Fore.GREEN,
-            ColorScheme.SEPARATOR: Fore.LIGHTBLACK_EX,
-            ColorScheme.HIGHLIGHT: Fore.YELLOW + Style.BRIGHT,
+    @property
+    def use_colors(self) -> bool:
+        """Whether output is colored."""
+        return self._use_colors
+
+    @use_colors.setter
+    def use_colors(self, use_colors: bool) -> None:
+        self._use_colors = use_colors
+        self._bind_codes()
+
+    @property
+    def colors(self) -> Mapping[ColorScheme, str]:
+        """
+        Color code for each scheme.
+
+        Read-only, since the format methods use codes bound when it is
+        assigned; assign a new mapping to change colors.
+        """
+        return MappingProxyType(self._colors)
+
+    @colors.setter
+    def colors(self, colors: Mapping[ColorScheme, str]) -> None:
+        self._colors = dict(colors)
+        self._bind_codes()
+
+    def _bind_codes(self) -> None:
+        """
+        Bind each scheme's codes to attributes.
+
+        The format methods read these attributes instead of looking up
+        ColorScheme keys on every call, so they are rebound whenever
+        use_colors or colors is assigned. With colors disabled every code
+        is empty, so the format methods return text as is.
+        """
+        colors = self._colors if self._use_colors else {}
+        self._reset = Style.RESET_ALL if self._use_colors else ""
+
+        # Start and end codes for each scheme with a color; empty when
+        # colors are disabled
+        self._wrap = {
+            scheme: (color, self._reset)
+            for scheme, color in colors.items()
+            if color
         }
+        self._success = colors.get(ColorScheme.SUCCESS, "")
+        self._error = colors.get(ColorScheme.ERROR, "")
+        self._warning = colors.get(ColorScheme.WARNING, "")
+        self._info = colors.get(ColorScheme.INFO, "")
+        self._header = colors.get(ColorScheme.HEADER, "")
+        self._field = colors.get(ColorScheme.FIELD, "")
+        self._value = colors.get(ColorScheme.VALUE, "")
+        self._separator = colors.get(ColorScheme.SEPARATOR, "")
+        self._highlight = colors.get(ColorScheme.HIGHLIGHT, "")
 
     def get_color(self, scheme: ColorScheme) -> str:
         """
@@ -95,6 +197,21 @@ class ColorConfig:
             return ""
         return self.colors.get(scheme, "")
 
+    def get_codes(self, scheme: ColorScheme) -> Tuple[str, str]:
+        """
+        Get the codes that start and end text in a scheme.
+
+        Useful for building format templates once instead of colorizing
+        each piece of text separately.
+
+        Args:
+            scheme: The color scheme to get.
+
+        Returns:
+            Tuple of (start, end) codes, both empty if colors are disabled.
+        """
+        return self._wrap.get(scheme, ("", ""))
+
     def colorize(self, text: str, scheme: ColorScheme) -> str:
         """
         Colorize text with the specified scheme.
@@ -106,54 +223,63 @@ class ColorConfig:
         Returns:
             Colored text or original text if colors disabled.
         """
-        if not self.use_colors:
+        codes = self._wrap.get(scheme)
+        if codes is None:
             return text
-        color = self.get_color(scheme)
-        if color:
-            return f"{color}{text}{Style.RESET_ALL}"
-        return text
+        return f"{codes[0]}{text}{codes[1]}"
 
     def success(self, text: str) -> str:
         """Format success message."""
-        return self.colorize(text, ColorScheme.SUCCESS)
+        return f"{self._success}{text}{self._reset}" if self._success else text
 
     def error(self, text: str) -> str:
         """Format error message."""
-        return self.colorize(text, ColorScheme.ERROR)
+        return f"{self._error}{text}{self._reset}" if self._error else text
 
     def warning(self, text: str) -> str:
         """Format warning message."""
-        return self.colorize(text, ColorScheme.WARNING)
+        return f"{self._warning}{text}{self._reset}" if self._warning else text
 
     def info(self, text: str) -> str:
         """Format info message."""
-        return self.colorize(text, ColorScheme.INFO)
+        return f"{self._info}{text}{self._reset}" if self._info else text
 
     def header(self, text: str) -> str:
         """Format header text."""
-        return self.colorize(text, ColorScheme.HEADER)
+        return f"{self._header}{text}{self._reset}" if self._header else text
 
     def field(self, text: str) -> str:
         """Format field name."""
-        return self.colorize(text, ColorScheme.FIELD)
+        return f"{self._field}{text}{self._reset}" if self._field else text
 
     def value(self, text: str) -> str:
         """Format field value."""
-        return self.colorize(text, ColorScheme.VALUE)
+        return f"{self._value}{text}{self._reset}" if self._value else text
 
     def separator(self, text: str) -> str:
         """Format separator."""
-        return self.colorize(text, ColorScheme.SEPARATOR)
+        return f"{self._separator}{text}{self._reset}" if self._separator else text
 
     def highlight(self, text: str) -> str:
         """Format highlighted text."""
-        return self.colorize(text, ColorScheme.HIGHLIGHT)
+        return f"{self._highlight}{text}{self._reset}" if self._highlight else text
 
 
-# Global color config instance
+# Color config set with set_color_config, used instead of the default
 _color_config: Optional[ColorConfig] = None
 
 
+@functools.lru_cache(maxsize=None)
+def _default_color_config() -> ColorConfig:
+    """
+    Create the default color configuration once.
+
+    Returns:
+        The default ColorConfig instance.
+    """
+    return ColorConfig()
+
+
 def get_color_config() -> ColorConfig:
     """
     Get the global color configuration.
@@ -161,10 +287,10 @@ def get_color_config() -> ColorConfig:
     Returns:
         The global ColorConfig instance.
     """
-    global _color_config
-    if _color_config is None:
-        _color_config = ColorConfig()
-    return _color_config
+    config = _color_config
+    if config is None:
+        return _default_color_config()
+    return config
 
 
 def set_color_config(config: ColorConfig) -> None:
@@ -182,10 +308,12 @@ def reset_color_config() -> None:
     """Reset the global color configuration."""
     global _color_config
     _color_config = None
+    _default_color_config.cache_clear()
 
 
 def format_cron_field(field_name: str, field_value: str,
-                      description: Optional[str] = None) -> str:
+                      description: Optional[str] = None,
+                      config: Optional[ColorConfig] = None) -> str:
     """
     Format a cron field with colors.
 
@@ -193,86 +321,103 @@ def format_cron_field(field_name: str, field_value: str,
         field_name: Name of the field.
         field_value: Value of the field.
         description: Optional description.
+        config: Color configuration to use. Defaults to the global one.
 
     Returns:
         Formatted string with colors.
     """
-    config = get_color_config()
+    if config is None:
+        config = get_color_config()
 
-    result = f"{config.field(field_name)}: {config.value(field_value)}"
     if description:
-        result += f" {config.separator('-')} {config.info(description)}"
-
-    return result
+        return (
+            f"{config.field(field_name)}: {config.value(field_value)} "
+            f"{config.separator('-')} {config.info(description)}"
+        )
+    return f"{config.field(field_name)}: {config.value(field_value)}"
 
 
-def format_error_message(message: str, suggestion: Optional[str] = None) -> str:
+def format_error_message(message: str, suggestion: Optional[str] = None,
+                         config: Optional[ColorConfig] = None) -> str:
     """
     Format an error message with colors.
 
     Args:
         message: Error message.
         suggestion: Optional suggestion for fixing.
+        config: Color configuration to use. Defaults to the global one.
 
     Returns:
         Formatted error message.
     """
-    config = get_color_config()
+    if config is None:
+        config = get_color_config()
 
-    result = config.error(f"✗ {message}")
     if suggestion:
-        result += f"\n  {config.warning('💡 Suggestion:')} {suggestion}"
+        return (
+            f"{config.error(f'{ERROR_SYMBOL} {message}')}\n"
+            f"  {config.warning(f'{TIP_SYMBOL} Suggestion:')} {suggestion}"
+        )
+    return config.error(f"{ERROR_SYMBOL} {message}")
 
-    return result
 
-
-def format_success_message(message: str, details: Optional[str] = None) -> str:
+def format_success_message(message: str, details: Optional[str] = None,
+                           config: Optional[ColorConfig] = None) -> str:
     """
     Format a success message with colors.
 
     Args:
         message: Success message.
         details: Optional additional details.
+        config: Color configuration to use. Defaults to the global one.
 
     Returns:
         Formatted success message.
     """
-    config = get_color_config()
+    if config is None:
+        config = get_color_config()
 
-    result = config.success(f"✓ {message}")
     if details:
-        result += f"\n  {config.info(details)}"
-
-    return result
+        return (
+            f"{config.success(f'{SUCCESS_SYMBOL} {message}')}\n"
+            f"  {config.info(details)}"
+        )
+    return config.success(f"{SUCCESS_SYMBOL} {message}")
 
 
-def format_table_border(char: str, width: int = 1) -> str:
+def format_table_border(char: str, width: int = 1,
+                        config: Optional[ColorConfig] = None) -> str:
     """
     Format table border characters.
 
     Args:
         char: Border character.
         width: Number of times to repeat.
+        config: Color configuration to use. Defaults to the global one.
 
     Returns:
         Formatted border string.
     """
-    config = get_color_config()
+    if config is None:
+        config = get_color_config()
     return config.separator(char * width)
 
 
-def format_schedule_time(time_str: str, is_next: bool = True) -> str:
+def format_schedule_time(time_str: str, is_next: bool = True,
+                         config: Optional[ColorConfig] = None) -> str:
     """
     Format a scheduled run time.
 
     Args:
         time_str: Time string to format.
         is_next: Whether this is a future time.
+        config: Color configuration to use. Defaults to the global one.
 
     Returns:
         Formatted time string.
     """
-    config = get_color_config()
+    if config is None:
+        config = get_color_config()
 
     if is_next:
         return config.highlight(time_str)
@@ -1,16 +1,22 @@
 """Constants for cron expression parsing."""
 
-# Special strings in cron
-SPECIAL_STRINGS = {
-    "@yearly": "0 0 1 1 *",
-    "@annually": "0 0 1 1 *",
+from types import MappingProxyType
+
+# Expansions shared by aliases
+_YEARLY = "0 0 1 1 *"
+_DAILY = "0 0 * * *"
+
+# Special strings in cron (read-only)
+SPECIAL_STRINGS = MappingProxyType({
+    "@yearly": _YEARLY,
+    "@annually": _YEARLY,
     "@monthly": "0 0 1 * *",
     "@weekly": "0 0 * * 0",
-    "@daily": "0 0 * * *",
-    "@midnight": "0 0 * * *",
+    "@daily": _DAILY,
+    "@midnight": _DAILY,
     "@hourly": "0 * * * *",
     "@reboot": "@reboot",  # Special case, handled differently
-}
+})
 
 # Month names mapping
 MONTH_NAMES = {
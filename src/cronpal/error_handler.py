@@ -1,8 +1,10 @@
 """Error handling utilities for CronPal."""
 
+import re
 import sys
 from typing import Optional
 
+from cronpal.color_utils import ERROR_SYMBOL
 from cronpal.exceptions import (
     CronPalError,
     FieldError,
@@ -12,6 +14,38 @@ from cronpal.exceptions import (
 )
 
 
+# Error message phrases that have a suggested fix, in order of priority.
+# Each alternative looks ahead through the whole message, so the first
+# listed phrase wins no matter where it appears.
+_SUGGESTION_RE = re.compile(
+    r"(?=.*(?P<fields>invalid number of fields))"
+    r"|(?=.*(?P<characters>invalid character))"
+    r"|(?=.*(?P<empty>empty))"
+    r"|(?=.*(?P<special>unknown special string))",
+    re.IGNORECASE | re.DOTALL
+)
+
+_SUGGESTIONS = {
+    "characters": "Use only numbers, wildcards (*), ranges (-), lists (,), and steps (/)",
+    "empty": "Provide a cron expression. Example: '0 0 * * *' for daily at midnight",
+    "special": "Valid special strings: @yearly, @monthly, @weekly, @daily, @hourly, @reboot",
+}
+
+# Message template and whether verbose output adds the expected format,
+# by exception class
+_MESSAGE_TEMPLATES = {
+    InvalidCronExpression: (f"{ERROR_SYMBOL} Invalid cron expression: {{error}}", True),
+    FieldError: (f"{ERROR_SYMBOL} Field error in {{error.field_name}}: {{error}}", False),
+    ValidationError: (f"{ERROR_SYMBOL} Validation failed: {{error}}", False),
+    ParseError: (f"{ERROR_SYMBOL} Parse error: {{error}}", False),
+    CronPalError: (f"{ERROR_SYMBOL} Error: {{error}}", False),
+}
+
+# Lines added to verbose messages
+_EXPRESSION_LINE = "\n  Expression: '{}'"
+_FORMAT_HINT_LINE = "\n  Expected format: <minute> <hour> <day> <month> <weekday>"
+
+
 class ErrorHandler:
     """Centralized error handling for CronPal."""
 
@@ -38,82 +72,41 @@ class ErrorHandler:
         """
         self.error_count += 1
 
-        if isinstance(error, InvalidCronExpression):
-            return self._handle_invalid_expression(error, expression)
-        elif isinstance(error, FieldError):
-            return self._handle_field_error(error, expression)
-        elif isinstance(error, ValidationError):
-            return self._handle_validation_error(error, expression)
-        elif isinstance(error, ParseError):
-            return self._handle_parse_error(error, expression)
-        elif isinstance(error, CronPalError):
-            return self._handle_generic_cronpal_error(error, expression)
-        else:
-            return self._handle_unexpected_error(error, expression)
-
-    def _handle_invalid_expression(
-            self,
-            error: InvalidCronExpression,
-            expression: Optional[str]
-    ) -> str:
-        """Handle InvalidCronExpression."""
-        message = f"✗ Invalid cron expression: {error}"
-
-        if self.verbose and expression:
-            message += f"\n  Expression: '{expression}'"
-            message += "\n  Expected format: <minute> <hour> <day> <month> <weekday>"
-
-        return message
-
-    def _handle_field_error(
-            self,
-            error: FieldError,
-            expression: Optional[str]
-    ) -> str:
-        """Handle FieldError."""
-        message = f"✗ Field error in {error.field_name}: {str(error)}"
-
-        if self.verbose and expression:
-            message += f"\n  Expression: '{expression}'"
+        # Walk the error's MRO so subclasses use the message of their
+        # nearest listed base
+        for cls in type(error).__mro__:
+            template = _MESSAGE_TEMPLATES.get(cls)
+            if template is not None:
+                return self._format_error(error, expression, *template)
 
-        return message
+        return self._handle_unexpected_error(error, expression)
 
-    def _handle_validation_error(
+    def _format_error(
             self,
-            error: ValidationError,
-            expression: Optional[str]
-    ) -> str:
-        """Handle ValidationError."""
-        message = f"✗ Validation failed: {error}"
-
-        if self.verbose and expression:
-            message += f"\n  Expression: '{expression}'"
-
-        return message
-
-    def _handle_parse_error(
-            self,
-            error: ParseError,
-            expression: Optional[str]
+            error: CronPalError,
+            expression: Optional[str],
+            template: str,
+            format_hint: bool
     ) -> str:
-        """Handle ParseError."""
-        message = f"✗ Parse error: {error}"
-
-        if self.verbose and expression:
-            message += f"\n  Expression: '{expression}'"
+        """
+        Format a CronPal error from its message template.
 
-        return message
+        Args:
+            error: The error to format.
+            expression: Optional cron expression being processed.
+            template: Message template, formatted with ``error``.
+            format_hint: Whether verbose output shows the expected format.
 
-    def _handle_generic_cronpal_error(
-            self,
-            error: CronPalError,
-            expression: Optional[str]
-    ) -> str:
-        """Handle generic CronPalError."""
-        message = f"✗ Error: {error}"
+        Returns:
+            Formatted error message.
+        """
+        message = template.format(error=error)
 
         if self.verbose and expression:
-            message += f"\n  Expression: '{expression}'"
+            expression_line = _EXPRESSION_LINE.format(expression)
+            if format_hint:
+                return f"{message}{expression_line}{_FORMAT_HINT_LINE}"
+            return f"{message}{expression_line}"
 
         return message
 
@@ -123,12 +116,12 @@ class ErrorHandler:
             expression: Optional[str]
     ) -> str:
         """Handle unexpected errors."""
-        message = f"✗ Unexpected error: {error}"
+        message = f"{ERROR_SYMBOL} Unexpected error: {error}"
 
         if self.verbose:
             message += f"\n  Error type: {type(error).__name__}"
             if expression:
-                message += f"\n  Expression: '{expression}'"
+                message += _EXPRESSION_LINE.format(expression)
 
         return message
 
@@ -168,22 +161,17 @@ def suggest_fix(error: Exception, expression: str) -> Optional[str]:
     Returns:
         Suggestion string or None.
     """
-    error_str = str(error).lower()
-
-    if "invalid number of fields" in error_str:
-        fields = expression.split()
-        if len(fields) < 5:
+    match = _SUGGESTION_RE.match(str(error))
+    if match is None:
+        return None
+
+    kind = match.lastgroup
+    if kind == "fields":
+        field_count = len(expression.split())
+        if field_count < 5:
             return "Add missing fields. Example: '0 0 * * *' for daily at midnight"
-        elif len(fields) > 5:
+        elif field_count > 5:
             return "Remove extra fields. Standard cron uses 5 fields"
+        return None
 
-    elif "invalid character" in error_str:
-        return "Use only numbers, wildcards (*), ranges (-), lists (,), and steps (/)"
-
-    elif "empty" in error_str:
-        return "Provide a cron expression. Example: '0 0 * * *' for daily at midnight"
-
-    elif "unknown special string" in error_str:
-        return "Valid special strings: @yearly, @monthly, @weekly, @daily, @hourly, @reboot"
-
-    return None
\ No newline at end of file
+    return _SUGGESTIONS[kind]
@@ -1,89 +1,106 @@
 """Field parsing logic for cron expressions."""
 
-from typing import List, Set
+import functools
+import re
+from typing import List, Optional, Tuple
 
 from cronpal.constants import DAY_NAMES, MONTH_NAMES, WILDCARD
 from cronpal.exceptions import FieldError, ParseError
-from cronpal.models import CronField, FieldRange, FieldType, FIELD_RANGES
+from cronpal.models import (
+    CronExpression,
+    CronField,
+    FieldRange,
+    FieldType,
+    FIELD_RANGES,
+    WILDCARD_MASKS,
+    range_mask,
+    step_mask,
+)
+from cronpal.validators import parse_and_validate
 
+# Month and day names with the numbers that replace them
+_MONTH_NUMBERS = {name: str(number) for name, number in MONTH_NAMES.items()}
+_DAY_NUMBERS = {name: str(number) for name, number in DAY_NAMES.items()}
 
-class FieldParser:
-    """Parser for individual cron fields."""
+# Patterns matching any month or day name, so all names are replaced in one pass
+_MONTH_NAME_RE = re.compile("|".join(MONTH_NAMES))
+_DAY_NAME_RE = re.compile("|".join(DAY_NAMES))
 
-    def parse_minute(self, field_value: str) -> CronField:
-        """
-        Parse the minute field of a cron expression.
 
-        Args:
-            field_value: The minute field string (e.g., "0", "*/5", "0-30").
+def _month_number(match: "re.Match") -> str:
+    """Get the number for a matched month name."""
+    return _MONTH_NUMBERS[match.group()]
 
-        Returns:
-            CronField object with parsed values.
 
-        Raises:
-            FieldError: If the field value is invalid.
-        """
-        field_type = FieldType.MINUTE
-        field_range = FIELD_RANGES[field_type]
+def _day_number(match: "re.Match") -> str:
+    """Get the number for a matched day name."""
+    return _DAY_NUMBERS[match.group()]
 
-        try:
-            parsed_values = self._parse_field(
-                field_value,
-                field_range,
-                "minute"
-            )
 
-            field = CronField(
-                raw_value=field_value,
-                field_type=field_type,
-                field_range=field_range
-            )
-            field.parsed_values = parsed_values
-            return field
+# Strings int() accepts: optional sign, digits with single underscores
+# between them, and surrounding whitespace
+_INT_RE = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*\Z")
 
-        except (ParseError, ValueError) as e:
-            raise FieldError("minute", str(e))
 
-    def parse_hour(self, field_value: str) -> CronField:
-        """
-        Parse the hour field of a cron expression.
+# A list part in one of the usual forms: "5", "0-30", "*/5", "0-30/5" or
+# "5/15". The groups are the wildcard, range start, range end and step.
+_PART_RE = re.compile(r"(?:(\*)|(\d+)(?:-(\d+))?)(?:/(\d+))?\Z")
 
-        Args:
-            field_value: The hour field string (e.g., "0", "*/2", "9-17").
 
-        Returns:
-            CronField object with parsed values.
+def _to_int(value_str: str) -> Optional[int]:
+    """
+    Convert a string to an int, without raising for non-numbers.
 
-        Raises:
-            FieldError: If the field value is invalid.
-        """
-        field_type = FieldType.HOUR
-        field_range = FIELD_RANGES[field_type]
+    Args:
+        value_str: The string to convert.
 
-        try:
-            parsed_values = self._parse_field(
-                field_value,
-                field_range,
-                "hour"
-            )
+    Returns:
+        The integer value, or None if the string is not a number.
+    """
+    if value_str.isdecimal() or _INT_RE.match(value_str):
+        return int(value_str)
+    return None
 
-            field = CronField(
-                raw_value=field_value,
-                field_type=field_type,
-                field_range=field_range
-            )
-            field.parsed_values = parsed_values
-            return field
 
-        except (ParseError, ValueError) as e:
-            raise FieldError("hour", str(e))
+# Field names used in error messages
+_FIELD_NAMES = {
+    FieldType.MINUTE: "minute",
+    FieldType.HOUR: "hour",
+    FieldType.DAY_OF_MONTH: "day of month",
+    FieldType.MONTH: "month",
+    FieldType.DAY_OF_WEEK: "day of week",
+}
+
+# Valid range and error message name for each field type
+_FIELD_INFO = {
+    field_type: (FIELD_RANGES[field_type], field_name)
+    for field_type, field_name in _FIELD_NAMES.items()
+}
 
-    def parse_day_of_month(self, field_value: str) -> CronField:
-        """
-        Parse the day of month field of a cron expression.
+
+def _typed_parser(field_type: FieldType, examples: str):
+    """
+    Build a public FieldParser.parse_* method for one field type.
+
+    Args:
+        field_type: The type of field the method parses.
+        examples: Example field values for the docstring.
+
+    Returns:
+        Method taking a field value and returning a parsed CronField.
+    """
+    field_name = _FIELD_NAMES[field_type]
+
+    def parse(self, field_value: str) -> CronField:
+        return self.parse(field_type, field_value)
+
+    parse.__name__ = f"parse_{field_type.value}"
+    parse.__qualname__ = f"FieldParser.{parse.__name__}"
+    parse.__doc__ = f"""
+        Parse the {field_name} field of a cron expression.
 
         Args:
-            field_value: The day field string (e.g., "1", "*/2", "1-15").
+            field_value: The {field_name} field string (e.g., {examples}).
 
         Returns:
             CronField object with parsed values.
@@ -91,70 +108,50 @@ class FieldParser:
         Raises:
             FieldError: If the field value is invalid.
         """
-        field_type = FieldType.DAY_OF_MONTH
-        field_range = FIELD_RANGES[field_type]
+    return parse
 
-        try:
-            parsed_values = self._parse_field(
-                field_value,
-                field_range,
-                "day of month"
-            )
 
-            field = CronField(
-                raw_value=field_value,
-                field_type=field_type,
-                field_range=field_range
-            )
-            field.parsed_values = parsed_values
-            return field
-
-        except (ParseError, ValueError) as e:
-            raise FieldError("day of month", str(e))
+class FieldParser:
+    """Parser for individual cron fields."""
 
-    def parse_month(self, field_value: str) -> CronField:
+    def parse_all(self, expression: str) -> CronExpression:
         """
-        Parse the month field of a cron expression.
+        Validate and parse a complete cron expression.
+
+        The expression is split and validated once, then each field is
+        parsed. Special strings are parsed from their expansion; @reboot has
+        no time fields.
 
         Args:
-            field_value: The month field string (e.g., "1", "JAN", "JAN-MAR").
+            expression: The cron expression (e.g., "*/15 9-17 * * MON-FRI").
 
         Returns:
-            CronField object with parsed values.
+            CronExpression with all fields parsed.
 
         Raises:
-            FieldError: If the field value is invalid.
+            InvalidCronExpression: If the expression format is invalid.
+            ValidationError: If a field contains invalid characters.
+            FieldError: If a field value is invalid.
         """
-        field_type = FieldType.MONTH
-        field_range = FIELD_RANGES[field_type]
+        fields = parse_and_validate(expression)
+        cron_expr = CronExpression(expression)
 
-        try:
-            # Replace month names with numbers
-            normalized = self._normalize_month_names(field_value)
+        if len(fields) == 5:
+            cron_expr.minute = self.parse_minute(fields[0])
+            cron_expr.hour = self.parse_hour(fields[1])
+            cron_expr.day_of_month = self.parse_day_of_month(fields[2])
+            cron_expr.month = self.parse_month(fields[3])
+            cron_expr.day_of_week = self.parse_day_of_week(fields[4])
 
-            parsed_values = self._parse_field(
-                normalized,
-                field_range,
-                "month"
-            )
-
-            field = CronField(
-                raw_value=field_value,
-                field_type=field_type,
-                field_range=field_range
-            )
-            field.parsed_values = parsed_values
-            return field
+        return cron_expr
 
-        except (ParseError, ValueError) as e:
-            raise FieldError("month", str(e))
-
-    def parse_day_of_week(self, field_value: str) -> CronField:
+    def parse(self, field_type: FieldType, field_value: str) -> CronField:
         """
-        Parse the day of week field of a cron expression.
+        Parse a field of the given type.
 
         Args:
-            field_value: The day field string (e.g., "0", "MON", "MON-FRI").
+            field_type: The type of the field.
+            field_value: The field as written in the expression.
 
         Returns:
             CronField object with parsed values.
@@ -162,34 +159,24 @@ class FieldParser:
         Raises:
             FieldError: If the field value is invalid.
         """
-        field_type = FieldType.DAY_OF_WEEK
-        field_range = FIELD_RANGES[field_type]
+        field_range, field_name = _FIELD_INFO[field_type]
 
         try:
-            # Replace day names with numbers
-            normalized = self._normalize_day_names(field_value)
-
-            parsed_values = self._parse_field(
-                normalized,
-                field_range,
-                "day of week"
-            )
-
-            # Handle Sunday as both 0 and 7
-            if 7 in parsed_values:
-                parsed_values.add(0)
-                parsed_values.remove(7)
+            mask = _parse_typed_field(field_type, field_value)
+        except (ParseError, ValueError) as e:
+            raise FieldError(field_name, str(e))
 
-            field = CronField(
-                raw_value=field_value,
-                field_type=field_type,
-                field_range=field_range
-            )
-            field.parsed_values = parsed_values
-            return field
+        return CronField(field_value, field_type, field_range, mask=mask)
 
-        except (ParseError, ValueError) as e:
-            raise FieldError("day of week", str(e))
+    parse_minute = _typed_parser(FieldType.MINUTE, '"0", "*/5", "0-30"')
+    parse_hour = _typed_parser(FieldType.HOUR, '"0", "*/2", "9-17"')
+    parse_day_of_month = _typed_parser(
+        FieldType.DAY_OF_MONTH, '"1", "*/2", "1-15"'
+    )
+    parse_month = _typed_parser(FieldType.MONTH, '"1", "JAN", "JAN-MAR"')
+    parse_day_of_week = _typed_parser(
+        FieldType.DAY_OF_WEEK, '"0", "MON", "MON-FRI"'
+    )
 
     def _normalize_month_names(self, field_value: str) -> str:
         """
@@ -201,13 +188,7 @@ class FieldParser:
         Returns:
             Field value with month names replaced by numbers.
         """
-        normalized = field_value.upper()
-
-        # Replace month names with numbers
-        for name, number in MONTH_NAMES.items():
-            normalized = normalized.replace(name, str(number))
-
-        return normalized
+        return _MONTH_NAME_RE.sub(_month_number, field_value.upper())
 
     def _normalize_day_names(self, field_value: str) -> str:
         """
@@ -219,22 +200,16 @@ class FieldParser:
         Returns:
             Field value with day names replaced by numbers.
         """
-        normalized = field_value.upper()
-
-        # Replace day names with numbers
-        for name, number in DAY_NAMES.items():
-            normalized = normalized.replace(name, str(number))
-
-        return normalized
+        return _DAY_NAME_RE.sub(_day_number, field_value.upper())
 
     def _parse_field(
         self,
         field_value: str,
         field_range: FieldRange,
         field_name: str
-    ) -> Set[int]:
+    ) -> int:
         """
-        Parse a field value into a set of integers.
+        Parse a field value into a bitmask of valid values.
 
         Args:
             field_value: The field value to parse.
@@ -242,7 +217,7 @@ class FieldParser:
             field_name: The name of the field for error messages.
 
         Returns:
-            Set of valid integer values.
+            Bitmask with bit n set for each valid value n.
 
         Raises:
             ParseError: If parsing fails.
@@ -250,11 +225,18 @@ class FieldParser:
         if not field_value:
             raise ParseError(f"Empty {field_name} field")
 
+        # Every value in the field's range
+        full_mask = range_mask(field_range.min_value, field_range.max_value)
+
         # Handle wildcard
         if field_value == WILDCARD:
-            return set(range(field_range.min_value, field_range.max_value + 1))
+            return full_mask
+
+        # Handle a lone number without splitting it into parts
+        if field_value.isdecimal():
+            return 1 << self._parse_single(field_value, field_range, field_name)
 
-        values = set()
+        mask = 0
 
         # Split by comma for lists
         for part in field_value.split(","):
@@ -266,20 +248,85 @@ class FieldParser:
 
             # Handle wildcards in lists (e.g., "*,*")
             if part == WILDCARD:
-                return set(range(field_range.min_value, field_range.max_value + 1))
+                return full_mask
+
+            # Well-formed parts are classified by a single match
+            match = _PART_RE.match(part)
+            if match is not None:
+                mask |= self._parse_part_match(match, field_range, field_name)
+                continue
+
+            # Anything else takes the general checks, which also report errors.
+            # A leading "-" is a range only if the rest isn't a number
+            # (e.g. "-1" is a negative number, "-1-5" is a broken range)
+            dash = part.find("-")
 
             if "/" in part:
                 # Handle step values (e.g., "*/5" or "0-30/5")
-                values.update(self._parse_step(part, field_range, field_name))
-            elif "-" in part and not self._is_negative_number(part):
+                mask |= self._parse_step_mask(part, field_range, field_name)
+            elif dash > 0 or (dash == 0 and not part[1:].isdecimal()):
                 # Handle ranges (e.g., "0-30")
-                values.update(self._parse_range(part, field_range, field_name))
+                mask |= range_mask(
+                    *self._parse_range_bounds(part, field_range, field_name)
+                )
             else:
                 # Handle single values (including negative numbers)
                 value = self._parse_single(part, field_range, field_name)
-                values.add(value)
+                mask |= 1 << value
 
-        return values
+        return mask
+
+    def _parse_part_match(
+        self,
+        match: "re.Match",
+        field_range: FieldRange,
+        field_name: str
+    ) -> int:
+        """
+        Convert a part matched by _PART_RE into a bitmask.
+
+        Args:
+            match: The match of a single list part.
+            field_range: The valid range for this field.
+            field_name: The name of the field for error messages.
+
+        Returns:
+            Bitmask of the values matched by the part.
+
+        Raises:
+            ParseError: If a value is out of range or the step is invalid.
+        """
+        star, start_str, end_str, step_str = match.groups()
+
+        step = None
+        if step_str is not None:
+            step = int(step_str)
+            if step <= 0:
+                raise ParseError(
+                    f"Step value must be positive in {field_name}: {step}"
+                )
+
+        if star is not None:
+            start = field_range.min_value
+            end = field_range.max_value
+        else:
+            start = self._parse_single(start_str, field_range, field_name)
+            if end_str is not None:
+                end = self._parse_single(end_str, field_range, field_name)
+                if start > end:
+                    raise ParseError(
+                        f"Invalid range in {field_name}: "
+                        f"start ({start}) > end ({end})"
+                    )
+            elif step is not None:
+                # "5/15" steps from 5 to the end of the field
+                end = field_range.max_value
+            else:
+                return 1 << start
+
+        if step is None:
+            return range_mask(start, end)
+        return step_mask(start, end, step)
 
     def _is_negative_number(self, value_str: str) -> bool:
         """
@@ -292,13 +339,7 @@ class FieldParser:
             True if the string is a negative number like "-1".
         """
         # Check if it starts with minus and the rest is a number
-        if value_str.startswith("-") and len(value_str) > 1:
-            try:
-                int(value_str)
-                return True
-            except ValueError:
-                return False
-        return False
+        return value_str[:1] == "-" and value_str[1:].isdecimal()
 
     def _parse_single(
         self,
@@ -320,9 +361,8 @@ class FieldParser:
         Raises:
             ParseError: If the value is invalid.
         """
-        try:
-            value = int(value_str)
-        except ValueError:
+        value = _to_int(value_str)
+        if value is None:
             raise ParseError(
                 f"Invalid {field_name} value: '{value_str}' is not a number"
             )
@@ -335,14 +375,14 @@ class FieldParser:
 
         return value
 
-    def _parse_range(
+    def _parse_range_bounds(
         self,
         range_str: str,
         field_range: FieldRange,
         field_name: str
-    ) -> Set[int]:
+    ) -> Tuple[int, int]:
         """
-        Parse a range expression (e.g., "0-30").
+        Parse a range expression (e.g., "0-30") into its bounds.
 
         Args:
             range_str: The range string to parse.
@@ -350,36 +390,36 @@ class FieldParser:
             field_name: The name of the field for error messages.
 
         Returns:
-            Set of values in the range.
+            Tuple of (start, end), both inclusive.
 
         Raises:
             ParseError: If the range is invalid.
         """
-        parts = range_str.split("-")
+        start_str, sep, end_str = range_str.partition("-")
 
-        if len(parts) != 2:
+        if not sep or "-" in end_str:
             raise ParseError(
                 f"Invalid range in {field_name}: '{range_str}'"
             )
 
-        start = self._parse_single(parts[0], field_range, field_name)
-        end = self._parse_single(parts[1], field_range, field_name)
+        start = self._parse_single(start_str, field_range, field_name)
+        end = self._parse_single(end_str, field_range, field_name)
 
         if start > end:
             raise ParseError(
                 f"Invalid range in {field_name}: start ({start}) > end ({end})"
             )
 
-        return set(range(start, end + 1))
+        return start, end
 
-    def _parse_step(
+    def _parse_step_mask(
         self,
         step_str: str,
         field_range: FieldRange,
         field_name: str
-    ) -> Set[int]:
+    ) -> int:
         """
-        Parse a step expression (e.g., "*/5" or "0-30/5").
+        Parse a step expression (e.g., "*/5" or "0-30/5") into a bitmask.
 
         Args:
             step_str: The step string to parse.
@@ -387,24 +427,23 @@ class FieldParser:
             field_name: The name of the field for error messages.
 
         Returns:
-            Set of values according to the step.
+            Bitmask of the values according to the step.
 
         Raises:
             ParseError: If the step is invalid.
         """
-        parts = step_str.split("/")
+        base, sep, step_value = step_str.partition("/")
 
-        if len(parts) != 2:
+        if not sep or "/" in step_value:
             raise ParseError(
                 f"Invalid step in {field_name}: '{step_str}'"
             )
 
         # Parse the step value
-        try:
-            step = int(parts[1])
-        except ValueError:
+        step = _to_int(step_value)
+        if step is None:
             raise ParseError(
-                f"Invalid step value in {field_name}: '{parts[1]}'"
+                f"Invalid step value in {field_name}: '{step_value}'"
             )
 
         if step <= 0:
@@ -413,23 +452,59 @@ class FieldParser:
             )
 
         # Parse the base range
-        base = parts[0]
         if base == WILDCARD:
             start = field_range.min_value
             end = field_range.max_value
         elif "-" in base:
-            range_values = self._parse_range(base, field_range, field_name)
-            start = min(range_values)
-            end = max(range_values)
+            start, end = self._parse_range_bounds(base, field_range, field_name)
         else:
             start = self._parse_single(base, field_range, field_name)
             end = field_range.max_value
 
-        # Generate values with step
-        values = set()
-        current = start
-        while current <= end:
-            values.add(current)
-            current += step
+        return step_mask(start, end, step)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_typed_field(field_type: FieldType, field_value: str) -> int:
+    """
+    Parse a field of a standard type into a bitmask (cached).
+
+    This is the only cache on the parsing path; FieldParser._parse_field
+    always expands the value.
+
+    Month and day names are replaced with numbers first, and day of week 7
+    is folded into 0 (both mean Sunday). Caching on the raw value means a
+    repeated field such as "MON-FRI" is a single lookup.
+
+    Args:
+        field_type: The type of the field.
+        field_value: The field as written in the expression.
+
+    Returns:
+        Bitmask with bit n set for each valid value n.
+
+    Raises:
+        ParseError: If parsing fails.
+    """
+    if field_value == WILDCARD:
+        # The most common field needs no normalizing or parsing
+        mask = WILDCARD_MASKS[field_type]
+    else:
+        if field_type is FieldType.MONTH:
+            # Replace month names with numbers
+            field_value = _PARSER._normalize_month_names(field_value)
+        elif field_type is FieldType.DAY_OF_WEEK:
+            # Replace day names with numbers
+            field_value = _PARSER._normalize_day_names(field_value)
+
+        mask = _PARSER._parse_field(field_value, *_FIELD_INFO[field_type])
+
+    # Handle Sunday as both 0 and 7
+    if field_type is FieldType.DAY_OF_WEEK and mask & (1 << 7):
+        mask = (mask | 1) & ~(1 << 7)
+
+    return mask
+
 
-        return values
\ No newline at end of file
+# Parser instance used to fill the caches
+_PARSER = FieldParser()
@@ -1,8 +1,8 @@
 """Data models for cron expressions."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Set
+from typing import ClassVar, FrozenSet, Iterable, Iterator, Optional, Tuple
 
 
 class FieldType(Enum):
@@ -15,23 +15,307 @@ class FieldType(Enum):
     DAY_OF_WEEK = "day_of_week"
 
 
-@dataclass
+class PatternKind(Enum):
+    """Enum for the shapes a field's values can take."""
+
+    WILDCARD = "wildcard"
+    STEP = "step"
+    STEP_FROM = "step_from"
+    RANGE = "range"
+    SINGLE = "single"
+    LIST = "list"
+
+
+# A field's pattern kind and its parameters; see CronField.pattern
+FieldPattern = Tuple[PatternKind, Tuple[int, ...]]
+
+
+@dataclass(frozen=True)
 class FieldRange:
     """Represents the valid range for a cron field."""
 
+    __slots__ = ("min_value", "max_value", "field_type")
+
     min_value: int
     max_value: int
     field_type: FieldType
 
+    def __reduce__(self) -> tuple:
+        """Pickle through __init__, since frozen slots can't be set later."""
+        return self.__class__, (self.min_value, self.max_value, self.field_type)
+
+    def __copy__(self) -> "FieldRange":
+        """Ranges are immutable, so copies can share the instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FieldRange":
+        """Ranges are immutable, so copies can share the instance."""
+        return self
+
+
+def values_to_mask(values: Iterable[int]) -> int:
+    """
+    Convert values to a bitmask with bit ``n`` set for each value ``n``.
+
+    Args:
+        values: The values to convert.
+
+    Returns:
+        The bitmask.
+    """
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask
+
+
+def range_mask(start: int, end: int) -> int:
+    """
+    Build a bitmask with every value from start to end (inclusive) set.
+
+    Args:
+        start: The first value.
+        end: The last value.
+
+    Returns:
+        The bitmask, or 0 if start > end.
+    """
+    if start > end:
+        return 0
+    return ((1 << (end + 1)) - 1) ^ ((1 << start) - 1)
+
+
+def step_mask(start: int, end: int, step: int) -> int:
+    """
+    Build a bitmask with start, start + step, ... up to end (inclusive) set.
+
+    The bits form a geometric series, so the mask is computed with a
+    single division instead of setting each bit in a loop.
+
+    Args:
+        start: The first value.
+        end: The last allowed value.
+        step: The distance between values. Must be positive.
+
+    Returns:
+        The bitmask, or 0 if start > end.
+    """
+    if start > end:
+        return 0
+    count = (end - start) // step + 1
+    return ((1 << (step * count)) - 1) // ((1 << step) - 1) << start
+
+
+def iter_mask(mask: int) -> Iterator[int]:
+    """
+    Iterate over the values set in a bitmask in ascending order.
+
+    Args:
+        mask: The bitmask to iterate over.
+
+    Yields:
+        Each value whose bit is set.
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def next_set_bit(mask: int, start: int) -> Optional[int]:
+    """
+    Find the smallest value set in a bitmask that is >= start.
+
+    Args:
+        mask: The bitmask to search.
+        start: The lowest value to consider.
+
+    Returns:
+        The matching value, or None if there is none.
+    """
+    if start < 0:
+        start = 0
+    remaining = mask >> start << start
+    if not remaining:
+        return None
+    return (remaining & -remaining).bit_length() - 1
+
+
+def prev_set_bit(mask: int, start: int) -> Optional[int]:
+    """
+    Find the largest value set in a bitmask that is <= start.
+
+    Args:
+        mask: The bitmask to search.
+        start: The highest value to consider.
+
+    Returns:
+        The matching value, or None if there is none.
+    """
+    if start < 0:
+        return None
+    remaining = mask & ((2 << start) - 1)
+    if not remaining:
+        return None
+    return remaining.bit_length() - 1
+
 
-@dataclass
 class CronField:
-    """Represents a single field in a cron expression."""
+    """
+    Represents a single field in a cron expression.
 
-    raw_value: str
-    field_type: FieldType
-    field_range: FieldRange
-    parsed_values: Optional[Set[int]] = field(default=None)
+    Matching values are stored in ``mask``, an integer bitmask with bit ``n``
+    set when value ``n`` matches. ``parsed_values`` exposes the same values as
+    a frozenset and ``sorted_values`` as an ascending tuple, and
+    ``match_count`` gives how many there are. ``pattern`` classifies the
+    field for descriptions.
+    """
+
+    __slots__ = (
+        "raw_value", "field_type", "field_range",
+        "_mask", "_values", "_sorted", "_count", "_pattern",
+    )
+
+    def __init__(
+        self,
+        raw_value: str,
+        field_type: FieldType,
+        field_range: FieldRange,
+        parsed_values: Optional[Iterable[int]] = None,
+        mask: Optional[int] = None
+    ):
+        """
+        Initialize the field.
+
+        Args:
+            raw_value: The field as written in the expression.
+            field_type: The type of the field.
+            field_range: The valid range for the field.
+            parsed_values: Optional values matched by the field.
+            mask: Optional bitmask of the values matched by the field,
+                used instead of parsed_values.
+        """
+        self.raw_value = raw_value
+        self.field_type = field_type
+        self.field_range = field_range
+        self._values: Optional[FrozenSet[int]] = None
+        self._sorted: Optional[Tuple[int, ...]] = None
+        self._count: Optional[int] = None
+        # (raw_value it was worked out for, pattern); see pattern
+        self._pattern: Optional[Tuple[str, Optional[FieldPattern]]] = None
+        if mask is None and parsed_values is not None:
+            mask = values_to_mask(parsed_values)
+        self._mask = mask
+
+    @property
+    def mask(self) -> Optional[int]:
+        """Bitmask of matching values, or None if not parsed."""
+        return self._mask
+
+    @mask.setter
+    def mask(self, mask: Optional[int]) -> None:
+        self._mask = mask
+        self._values = None
+        self._sorted = None
+        self._count = None
+        self._pattern = None
+
+    @property
+    def match_count(self) -> Optional[int]:
+        """Number of matching values, or None if not parsed."""
+        if self._count is None and self._mask is not None:
+            self._count = bin(self._mask).count("1")
+        return self._count
+
+    @property
+    def parsed_values(self) -> Optional[FrozenSet[int]]:
+        """Matching values as a frozenset, or None if not parsed."""
+        if self._mask is None:
+            return None
+        if self._values is None:
+            self._values = frozenset(iter_mask(self._mask))
+        return self._values
+
+    @parsed_values.setter
+    def parsed_values(self, values: Optional[Iterable[int]]) -> None:
+        self.mask = None if values is None else values_to_mask(values)
+
+    @property
+    def sorted_values(self) -> Optional[Tuple[int, ...]]:
+        """Matching values in ascending order, or None if not parsed."""
+        if self._mask is None:
+            return None
+        if self._sorted is None:
+            self._sorted = tuple(iter_mask(self._mask))
+        return self._sorted
+
+    @property
+    def pattern(self) -> Optional[FieldPattern]:
+        """
+        The kind of pattern the field uses and its parameters.
+
+        The parameters are (step,) for STEP, (step, start) for STEP_FROM,
+        (start, end) for RANGE, (value,) for SINGLE and () otherwise. The
+        result is worked out once and kept until the value or mask changes.
+
+        Returns:
+            Tuple of the kind and its parameters, or None if the field
+            isn't a wildcard and matches no values.
+        """
+        cached = self._pattern
+        if cached is None or cached[0] is not self.raw_value:
+            cached = self._pattern = (self.raw_value, self._classify())
+        return cached[1]
+
+    def _classify(self) -> Optional[FieldPattern]:
+        """Work out the pattern returned by the pattern property."""
+        raw_value = self.raw_value
+        if raw_value == "*":
+            return PatternKind.WILDCARD, ()
+
+        mask = self._mask
+        if not mask:
+            return None
+
+        low = (mask & -mask).bit_length() - 1
+        rest = mask ^ (1 << low)
+
+        if "/" in raw_value:
+            step = (rest & -rest).bit_length() - 1 - low if rest else 1
+            if "*/" in raw_value:
+                return PatternKind.STEP, (step,)
+            return PatternKind.STEP_FROM, (step, low)
+
+        if not rest:
+            return PatternKind.SINGLE, (low,)
+
+        high = mask.bit_length() - 1
+        if "-" in raw_value and mask == range_mask(low, high):
+            return PatternKind.RANGE, (low, high)
+
+        return PatternKind.LIST, ()
+
+    def __repr__(self) -> str:
+        """Debug representation of the field."""
+        return (
+            f"CronField(raw_value={self.raw_value!r}, "
+            f"field_type={self.field_type!r}, "
+            f"field_range={self.field_range!r}, "
+            f"parsed_values={self.parsed_values!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare fields by value."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.raw_value == other.raw_value
+            and self.field_type == other.field_type
+            and self.field_range == other.field_range
+            and self._mask == other._mask
+        )
+
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
 
     def __str__(self) -> str:
         """String representation of the field."""
@@ -51,21 +335,70 @@ class CronField:
         Returns:
             True if the value matches this field.
         """
-        if self.parsed_values is None:
+        if self._mask is None or value < 0:
             return False
-        return value in self.parsed_values
+        return bool((self._mask >> value) & 1)
 
 
-@dataclass
 class CronExpression:
     """Represents a complete cron expression."""
 
-    raw_expression: str
-    minute: Optional[CronField] = None
-    hour: Optional[CronField] = None
-    day_of_month: Optional[CronField] = None
-    month: Optional[CronField] = None
-    day_of_week: Optional[CronField] = None
+    __slots__ = ("raw_expression", "minute", "hour", "day_of_month", "month", "day_of_week")
+
+    def __init__(
+        self,
+        raw_expression: str,
+        minute: Optional[CronField] = None,
+        hour: Optional[CronField] = None,
+        day_of_month: Optional[CronField] = None,
+        month: Optional[CronField] = None,
+        day_of_week: Optional[CronField] = None
+    ):
+        """
+        Initialize the expression.
+
+        Args:
+            raw_expression: The expression as written.
+            minute: The parsed minute field.
+            hour: The parsed hour field.
+            day_of_month: The parsed day of month field.
+            month: The parsed month field.
+            day_of_week: The parsed day of week field.
+        """
+        self.raw_expression = raw_expression
+        self.minute = minute
+        self.hour = hour
+        self.day_of_month = day_of_month
+        self.month = month
+        self.day_of_week = day_of_week
+
+    def _astuple(self) -> tuple:
+        """Get the expression's attributes as a tuple."""
+        return (
+            self.raw_expression,
+            self.minute,
+            self.hour,
+            self.day_of_month,
+            self.month,
+            self.day_of_week
+        )
+
+    def __repr__(self) -> str:
+        """Debug representation of the expression."""
+        return (
+            f"CronExpression(raw_expression={self.raw_expression!r}, "
+            f"minute={self.minute!r}, hour={self.hour!r}, "
+            f"day_of_month={self.day_of_month!r}, month={self.month!r}, "
+            f"day_of_week={self.day_of_week!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare expressions by value."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
 
     def __str__(self) -> str:
         """String representation of the cron expression."""
@@ -73,13 +406,13 @@ class CronExpression:
 
     def is_valid(self) -> bool:
         """Check if all required fields are present."""
-        return all([
-            self.minute is not None,
-            self.hour is not None,
-            self.day_of_month is not None,
-            self.month is not None,
-            self.day_of_week is not None
-        ])
+        return (
+            self.minute is not None
+            and self.hour is not None
+            and self.day_of_month is not None
+            and self.month is not None
+            and self.day_of_week is not None
+        )
 
     def matches_time(
         self,
@@ -100,21 +433,20 @@ class CronExpression:
         Returns:
             True if the time matches.
         """
-        if self.minute is None:
+        # Return on the first field that doesn't match
+        if self.minute is None or not self.minute.matches(minute):
             return False
 
-        matches = self.minute.matches(minute)
-
-        if hour is not None and self.hour is not None:
-            matches = matches and self.hour.matches(hour)
+        if hour is not None and self.hour is not None and not self.hour.matches(hour):
+            return False
 
-        if day is not None and self.day_of_month is not None:
-            matches = matches and self.day_of_month.matches(day)
+        if day is not None and self.day_of_month is not None and not self.day_of_month.matches(day):
+            return False
 
-        if month is not None and self.month is not None:
-            matches = matches and self.month.matches(month)
+        if month is not None and self.month is not None and not self.month.matches(month):
+            return False
 
-        return matches
+        return True
 
 
 # Define valid ranges for each field type
@@ -124,4 +456,10 @@ FIELD_RANGES = {
     FieldType.DAY_OF_MONTH: FieldRange(1, 31, FieldType.DAY_OF_MONTH),
     FieldType.MONTH: FieldRange(1, 12, FieldType.MONTH),
     FieldType.DAY_OF_WEEK: FieldRange(0, 7, FieldType.DAY_OF_WEEK),
-}
\ No newline at end of file
+}
+
+# Bitmask matched by a wildcard for each field type
+WILDCARD_MASKS = {
+    field_type: range_mask(field_range.min_value, field_range.max_value)
+    for field_type, field_range in FIELD_RANGES.items()
+}
@@ -1,94 +1,251 @@
 """Argument parser for CronPal CLI."""
 
-import argparse
-from textwrap import dedent
+import functools
+import sys
+from types import SimpleNamespace
+from typing import List, Optional
 
-from cronpal import __version__
+# Flags that don't take a value, mapped to their destination
+_FLAG_OPTIONS = {
+    "-v": "version",
+    "--version": "version",
+    "--verbose": "verbose",
+    "--list-timezones": "list_timezones",
+    "--pretty": "pretty",
+    "--no-color": "no_color",
+    "--stdin": "stdin",
+}
+
+# Options that take a single value, mapped to their destination and type
+_VALUE_OPTIONS = {
+    "-n": ("next", int),
+    "--next": ("next", int),
+    "-p": ("previous", int),
+    "--previous": ("previous", int),
+    "-t": ("timezone", str),
+    "--timezone": ("timezone", str),
+    "-f": ("file", str),
+    "--file": ("file", str),
+}
+
+# Values of every destination when not given on the command line
+_DEFAULTS = {
+    "expression": None,
+    "version": False,
+    "verbose": False,
+    "next": None,
+    "previous": None,
+    "timezone": None,
+    "list_timezones": False,
+    "pretty": False,
+    "no_color": False,
+    "file": None,
+    "stdin": False,
+}
+
+
+def parse_simple_args(args: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse arguments that only use the plain forms of the options.
+
+    This covers nearly every invocation and doesn't need argparse.
+
+    Args:
+        args: The arguments to parse.
+
+    Returns:
+        Namespace with the parsed arguments, or None if argparse is needed.
+    """
+    values = dict(_DEFAULTS)
+    has_expression = False
+    tokens = iter(args)
+
+    for arg in tokens:
+        if not arg.startswith("-"):
+            if has_expression:
+                return None
+            values["expression"] = arg
+            has_expression = True
+        elif arg in _FLAG_OPTIONS:
+            values[_FLAG_OPTIONS[arg]] = True
+        elif arg in _VALUE_OPTIONS:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+
+            dest, value_type = _VALUE_OPTIONS[arg]
+            try:
+                values[dest] = value_type(value)
+            except ValueError:
+                return None
+        else:
+            return None
+
+    return SimpleNamespace(**values)
+
+
+class CronPalArgumentParser:
+    """
+    Lightweight argument parser for the CronPal CLI.
+
+    Plain flags, options and the expression are parsed by hand so the
+    common invocations don't need to import argparse. Anything else (help,
+    errors, ``--option=value``, abbreviations) is handed to the full
+    argparse parser so its behaviour and messages stay the same. Other
+    attributes (format_help, print_help, ...) are also delegated to it.
+    """
+
+    prog = "cronpal"
+
+    def __init__(self):
+        """Initialize the parser."""
+        self._argparse_parser = None
+
+    def parse_args(self, args: Optional[List[str]] = None):
+        """
+        Parse command line arguments.
+
+        Once the argparse parser has been built (e.g. to add arguments
+        through this wrapper), it parses every call so changes apply.
+
+        Args:
+            args: The arguments to parse. Defaults to sys.argv[1:].
+
+        Returns:
+            Namespace with the parsed arguments.
+        """
+        if args is None:
+            args = sys.argv[1:]
+
+        if self._argparse_parser is None:
+            namespace = parse_simple_args(args)
+            if namespace is not None:
+                return namespace
+
+        return self._get_argparse_parser().parse_args(args)
+
+    def _get_argparse_parser(self):
+        """Get the full argparse parser, building it on first use."""
+        if self._argparse_parser is None:
+            self._argparse_parser = _create_argparse_parser()
+        return self._argparse_parser
+
+    def __getattr__(self, name):
+        """Delegate everything else to the argparse parser."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._get_argparse_parser(), name)
 
 
 def create_parser():
     """Create and configure the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="cronpal",
-        description="Parse and analyze cron expressions",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=dedent("""
-            Examples:
-              cronpal "0 0 * * *"              # Parse a cron expression
-              cronpal --version                 # Show version
-              cronpal --help                    # Show this help message
-              cronpal "0 0 * * *" --timezone "US/Eastern"  # Use specific timezone
-              cronpal "0 0 * * *" --pretty     # Pretty print the expression
-              cronpal "0 0 * * *" --no-color   # Disable colored output
-
-            Cron Expression Format:
-              ┌───────────── minute (0-59)
-              │ ┌───────────── hour (0-23)
-              │ │ ┌───────────── day of month (1-31)
-              │ │ │ ┌───────────── month (1-12)
-              │ │ │ │ ┌───────────── day of week (0-7)
-              │ │ │ │ │
-              * * * * *
-        """)
-    )
+    return CronPalArgumentParser()
 
-    # Positional argument for cron expression
-    parser.add_argument(
-        "expression",
-        nargs="?",
-        help="Cron expression to parse (e.g., '0 0 * * *')"
-    )
 
-    # Optional arguments
-    parser.add_argument(
-        "-v", "--version",
-        action="store_true",
-        help="Show version information"
-    )
+@functools.lru_cache(maxsize=None)
+def _argparse_spec():
+    """
+    Get the epilog and arguments of the full argparse parser.
 
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Enable verbose output"
-    )
+    These never change, so they are built once per process and every
+    argparse parser is created from them.
 
-    parser.add_argument(
-        "-n", "--next",
-        type=int,
-        metavar="N",
-        help="Show next N execution times (default: 5)"
-    )
+    Returns:
+        Tuple of (epilog, arguments), where each argument is a tuple of
+        (names, add_argument keyword arguments).
+    """
+    from textwrap import dedent
 
-    parser.add_argument(
-        "-p", "--previous",
-        type=int,
-        metavar="N",
-        help="Show previous N execution times"
-    )
+    epilog = dedent("""
+        Examples:
+          cronpal "0 0 * * *"              # Parse a cron expression
+          cronpal --version                 # Show version
+          cronpal --help                    # Show this help message
+          cronpal "0 0 * * *" --timezone "US/Eastern"  # Use specific timezone
+          cronpal "0 0 * * *" --pretty     # Pretty print the expression
+          cronpal "0 0 * * *" --no-color   # Disable colored output
+          cronpal --file expressions.txt    # Check one expression per line
+          cat expressions.txt | cronpal --stdin  # Check expressions from stdin
 
-    parser.add_argument(
-        "-t", "--timezone",
-        type=str,
-        metavar="TZ",
-        help="Timezone for cron execution (e.g., 'US/Eastern', 'Europe/London')"
-    )
+        Cron Expression Format:
+          ┌───────────── minute (0-59)
+          │ ┌───────────── hour (0-23)
+          │ │ ┌───────────── day of month (1-31)
+          │ │ │ ┌───────────── month (1-12)
+          │ │ │ │ ┌───────────── day of week (0-7)
+          │ │ │ │ │
+          * * * * *
+    """)
 
-    parser.add_argument(
-        "--list-timezones",
-        action="store_true",
-        help="List all available timezone names"
+    arguments = (
+        # Positional argument for cron expression
+        (("expression",), dict(
+            nargs="?",
+            help="Cron expression to parse (e.g., '0 0 * * *')"
+        )),
+        # Optional arguments
+        (("-v", "--version"), dict(
+            action="store_true",
+            help="Show version information"
+        )),
+        (("--verbose",), dict(
+            action="store_true",
+            help="Enable verbose output"
+        )),
+        (("-n", "--next"), dict(
+            type=int,
+            metavar="N",
+            help="Show next N execution times (default: 5)"
+        )),
+        (("-p", "--previous"), dict(
+            type=int,
+            metavar="N",
+            help="Show previous N execution times"
+        )),
+        (("-t", "--timezone"), dict(
+            type=str,
+            metavar="TZ",
+            help="Timezone for cron execution (e.g., 'US/Eastern', 'Europe/London')"
+        )),
+        (("--list-timezones",), dict(
+            action="store_true",
+            help="List all available timezone names"
+        )),
+        (("--pretty",), dict(
+            action="store_true",
+            help="Pretty print the cron expression with formatted output"
+        )),
+        (("--no-color",), dict(
+            action="store_true",
+            help="Disable colored output"
+        )),
+        (("-f", "--file"), dict(
+            type=str,
+            metavar="PATH",
+            help="Check every expression in a file (one per line)"
+        )),
+        (("--stdin",), dict(
+            action="store_true",
+            help="Check every expression read from standard input (one per line)"
+        )),
     )
 
-    parser.add_argument(
-        "--pretty",
-        action="store_true",
-        help="Pretty print the cron expression with formatted output"
-    )
+    return epilog, arguments
+
+
+def _create_argparse_parser():
+    """Create the full argparse parser, used for help and error reporting."""
+    import argparse
 
-    parser.add_argument(
-        "--no-color",
-        action="store_true",
-        help="Disable colored output"
+    epilog, arguments = _argparse_spec()
+    parser = argparse.ArgumentParser(
+        prog="cronpal",
+        description="Parse and analyze cron expressions",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog,
     )
 
-    return parser
\ No newline at end of file
+    for names, options in arguments:
+        parser.add_argument(*names, **options)
+
+    return parser
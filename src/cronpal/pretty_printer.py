@@ -1,14 +1,151 @@
 """Pretty printer for cron expressions."""
 
-from typing import List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from cronpal.color_utils import ColorConfig, get_color_config
-from cronpal.models import CronExpression, CronField, FieldType
+from cronpal.models import (
+    CronExpression,
+    CronField,
+    FieldType,
+    PatternKind,
+    next_set_bit,
+    range_mask,
+    step_mask,
+    values_to_mask,
+)
+
+# Table borders and rules, built once
+_TABLE_TOP = "┌" + "─" * 78 + "┐"
+_TABLE_RULE = "├" + "─" * 78 + "┤"
+_TABLE_COLUMNS_TOP = "├" + "─" * 17 + "┬" + "─" * 15 + "┬" + "─" * 44 + "┤"
+_TABLE_COLUMNS_RULE = "├" + "─" * 17 + "┼" + "─" * 15 + "┼" + "─" * 44 + "┤"
+_TABLE_BOTTOM = "└" + "─" * 17 + "┴" + "─" * 15 + "┴" + "─" * 44 + "┘"
+_SIMPLE_RULE = "-" * 50
+_DETAILED_BAR = "═" * 80
+_DETAILED_RULE = "─" * 76
+
+# Names used in descriptions, indexed by cron value
+_MONTHS = ("", "January", "February", "March", "April", "May", "June",
+           "July", "August", "September", "October", "November", "December")
+_WEEKDAYS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+# "value (name)" labels for the detailed value list, indexed by value over
+# each field's range. Out-of-range values show the number as their name.
+_MONTH_LABELS = tuple(f"{v} ({_MONTHS[v] if v else v})" for v in range(13))
+_WEEKDAY_LABELS = tuple(f"{v} ({_WEEKDAYS[v] if v < 7 else v})" for v in range(8))
+_VALUE_LABELS = {
+    FieldType.MONTH: _MONTH_LABELS,
+    FieldType.DAY_OF_WEEK: _WEEKDAY_LABELS,
+}
+
+_FIELD_NAMES = {
+    FieldType.MINUTE: "minute",
+    FieldType.HOUR: "hour",
+    FieldType.DAY_OF_MONTH: "day",
+    FieldType.MONTH: "month",
+    FieldType.DAY_OF_WEEK: "day_of_week"
+}
+_FIELD_NAMES_PLURAL = {
+    FieldType.MINUTE: "minutes",
+    FieldType.HOUR: "hours",
+    FieldType.DAY_OF_MONTH: "days",
+    FieldType.MONTH: "months",
+    FieldType.DAY_OF_WEEK: "days_of_week"
+}
+
+# Two-bit codes for how a field looks; anything else (or a missing field)
+# is 0. A signature packs the codes of the minute, hour, day of month,
+# month and day of week fields into one int, two bits per field.
+_WILDCARD = 1
+_SINGLE = 2
+
+
+def _signature(*codes: int) -> int:
+    """
+    Pack per-field codes into a signature.
+
+    Args:
+        codes: The code of each field, starting with the minute.
+
+    Returns:
+        The signature.
+    """
+    signature = 0
+    for index, code in enumerate(codes):
+        signature |= code << (2 * index)
+    return signature
+
+
+def _field_code(signature: int, index: int) -> int:
+    """
+    Get the code of one field from a signature.
+
+    Args:
+        signature: The signature.
+        index: Position of the field, starting with the minute at 0.
+
+    Returns:
+        The field's code.
+    """
+    return (signature >> (2 * index)) & 3
+
+
+def _mask_bounds(mask: int) -> Tuple[int, int]:
+    """
+    Get the lowest and highest values set in a non-empty bitmask.
+
+    Args:
+        mask: The bitmask.
+
+    Returns:
+        Tuple of the lowest and highest values.
+    """
+    return (mask & -mask).bit_length() - 1, mask.bit_length() - 1
+
+
+def _mask_is_range(mask: int) -> bool:
+    """
+    Check if a bitmask holds two or more continuous values.
+
+    Args:
+        mask: The bitmask.
+
+    Returns:
+        True if the set bits form one unbroken run of at least two.
+    """
+    if mask & (mask - 1) == 0:
+        return False
+    low, high = _mask_bounds(mask)
+    return mask == range_mask(low, high)
+
+
+def _mask_step(mask: int) -> int:
+    """
+    Get the distance between the two lowest values in a bitmask.
+
+    Args:
+        mask: The bitmask.
+
+    Returns:
+        The distance, or 1 if fewer than two values are set.
+    """
+    if mask & (mask - 1) == 0:
+        return 1
+    low = (mask & -mask).bit_length() - 1
+    return next_set_bit(mask, low + 1) - low
+
+
+# Rendered outputs by (mode, color codes, expression snapshot); cleared
+# when it reaches _RENDER_CACHE_SIZE entries
+_RENDER_CACHE: Dict[tuple, str] = {}
+_RENDER_CACHE_SIZE = 1024
 
 
 class PrettyPrinter:
     """Pretty printer for cron expressions."""
 
+    __slots__ = ("expression", "color_config")
+
     def __init__(self, expression: CronExpression, use_colors: bool = True):
         """
         Initialize the pretty printer.
@@ -20,6 +157,44 @@ class PrettyPrinter:
         self.expression = expression
         self.color_config = ColorConfig(use_colors=use_colors) if use_colors else get_color_config()
 
+    def _render(self, mode: str, build: Callable[[], str]) -> str:
+        """
+        Get an output from the shared cache, building it on a miss.
+
+        Outputs depend only on the expression's fields and the color codes
+        used, so printers for equal expressions share cache entries.
+
+        Args:
+            mode: The kind of output (e.g. "table").
+            build: Function that builds the output.
+
+        Returns:
+            The output string.
+        """
+        expr = self.expression
+        config = self.color_config
+        key = (
+            mode,
+            type(self),
+            type(config),
+            tuple(config.colors.items()) if config.use_colors else None,
+            expr.raw_expression,
+            tuple(
+                None if field is None
+                else (field.raw_value, field.field_type, field.field_range, field.mask)
+                for field in (expr.minute, expr.hour, expr.day_of_month,
+                              expr.month, expr.day_of_week)
+            ),
+        )
+
+        output = _RENDER_CACHE.get(key)
+        if output is None:
+            output = build()
+            if len(_RENDER_CACHE) >= _RENDER_CACHE_SIZE:
+                _RENDER_CACHE.clear()
+            _RENDER_CACHE[key] = output
+        return output
+
     def print_table(self) -> str:
         """
         Generate a formatted table of the cron expression.
@@ -27,19 +202,24 @@ class PrettyPrinter:
         Returns:
             A string containing the formatted table.
         """
-        lines = []
+        return self._render("table", self._print_table)
+
+    def _print_table(self) -> str:
+        """Build the output of print_table without the cache."""
         c = self.color_config  # Shorthand
 
         # Header
-        lines.append(c.separator("┌" + "─" * 78 + "┐"))
-        lines.append(c.separator("│") + c.header(f" {'Cron Expression Analysis':^76} ") + c.separator("│"))
-        lines.append(c.separator("├" + "─" * 78 + "┤"))
-        lines.append(c.separator("│") + f" Expression: {c.value(self.expression.raw_expression):<63} " + c.separator("│"))
-        lines.append(c.separator("├" + "─" * 17 + "┬" + "─" * 15 + "┬" + "─" * 44 + "┤"))
-        lines.append(c.separator("│") + c.header(" Field           ") + c.separator("│") +
-                    c.header(" Value         ") + c.separator("│") +
-                    c.header(" Description                                ") + c.separator("│"))
-        lines.append(c.separator("├" + "─" * 17 + "┼" + "─" * 15 + "┼" + "─" * 44 + "┤"))
+        lines = [
+            c.separator(_TABLE_TOP),
+            c.separator("│") + c.header(f" {'Cron Expression Analysis':^76} ") + c.separator("│"),
+            c.separator(_TABLE_RULE),
+            c.separator("│") + f" Expression: {c.value(self.expression.raw_expression):<63} " + c.separator("│"),
+            c.separator(_TABLE_COLUMNS_TOP),
+            c.separator("│") + c.header(" Field           ") + c.separator("│") +
+            c.header(" Value         ") + c.separator("│") +
+            c.header(" Description                                ") + c.separator("│"),
+            c.separator(_TABLE_COLUMNS_RULE),
+        ]
 
         # Fields
         if self.expression.minute:
@@ -58,7 +238,7 @@ class PrettyPrinter:
             lines.append(self._format_field_row("Day of Week", self.expression.day_of_week))
 
         # Footer
-        lines.append(self.color_config.separator("└" + "─" * 17 + "┴" + "─" * 15 + "┴" + "─" * 44 + "┘"))
+        lines.append(c.separator(_TABLE_BOTTOM))
 
         return "\n".join(lines)
 
@@ -69,11 +249,16 @@ class PrettyPrinter:
         Returns:
             A string containing the simple formatted output.
         """
-        lines = []
+        return self._render("simple", self._print_simple)
+
+    def _print_simple(self) -> str:
+        """Build the output of print_simple without the cache."""
         c = self.color_config
 
-        lines.append(c.header("Cron Expression: ") + c.value(self.expression.raw_expression))
-        lines.append(c.separator("-" * 50))
+        lines = [
+            c.header("Cron Expression: ") + c.value(self.expression.raw_expression),
+            c.separator(_SIMPLE_RULE),
+        ]
 
         if self.expression.minute:
             lines.append(c.field("Minute:       ") +
@@ -109,12 +294,17 @@ class PrettyPrinter:
         Returns:
             A string containing the detailed output.
         """
-        lines = []
+        return self._render("detailed", self._print_detailed)
+
+    def _print_detailed(self) -> str:
+        """Build the output of print_detailed without the cache."""
         c = self.color_config
 
-        lines.append(c.separator("═" * 80))
-        lines.append(c.header(f" CRON EXPRESSION: {self.expression.raw_expression}"))
-        lines.append(c.separator("═" * 80))
+        lines = [
+            c.separator(_DETAILED_BAR),
+            c.header(f" CRON EXPRESSION: {self.expression.raw_expression}"),
+            c.separator(_DETAILED_BAR),
+        ]
 
         if self.expression.minute:
             lines.extend(self._format_detailed_field("MINUTE", self.expression.minute))
@@ -131,7 +321,7 @@ class PrettyPrinter:
         if self.expression.day_of_week:
             lines.extend(self._format_detailed_field("DAY OF WEEK", self.expression.day_of_week))
 
-        lines.append(c.separator("═" * 80))
+        lines.append(c.separator(_DETAILED_BAR))
 
         return "\n".join(lines)
 
@@ -142,44 +332,19 @@ class PrettyPrinter:
         Returns:
             A string with a human-readable description.
         """
-        parts = []
+        return self._render("summary", self._get_summary)
 
+    def _get_summary(self) -> str:
+        """Build the output of get_summary without the cache."""
         # Check for common patterns
-        if self._is_every_minute():
-            return "Runs every minute"
-
-        if self._is_hourly():
-            minute = list(self.expression.minute.parsed_values)[0] if self.expression.minute else 0
-            return f"Runs every hour at minute {minute:02d}"
-
-        if self._is_daily():
-            hour = list(self.expression.hour.parsed_values)[0] if self.expression.hour else 0
-            minute = list(self.expression.minute.parsed_values)[0] if self.expression.minute else 0
-            return f"Runs daily at {hour:02d}:{minute:02d}"
-
-        if self._is_weekly():
-            day = self._get_single_weekday_name()
-            hour = list(self.expression.hour.parsed_values)[0] if self.expression.hour else 0
-            minute = list(self.expression.minute.parsed_values)[0] if self.expression.minute else 0
-            return f"Runs every {day} at {hour:02d}:{minute:02d}"
-
-        if self._is_monthly():
-            day = list(self.expression.day_of_month.parsed_values)[0] if self.expression.day_of_month else 1
-            hour = list(self.expression.hour.parsed_values)[0] if self.expression.hour else 0
-            minute = list(self.expression.minute.parsed_values)[0] if self.expression.minute else 0
-            return f"Runs on day {day} of every month at {hour:02d}:{minute:02d}"
-
-        if self._is_yearly():
-            month = list(self.expression.month.parsed_values)[0] if self.expression.month else 1
-            day = list(self.expression.day_of_month.parsed_values)[0] if self.expression.day_of_month else 1
-            hour = list(self.expression.hour.parsed_values)[0] if self.expression.hour else 0
-            minute = list(self.expression.minute.parsed_values)[0] if self.expression.minute else 0
-            month_name = self._get_month_name(month)
-            return f"Runs on {month_name} {day} at {hour:02d}:{minute:02d}"
+        signature = self._get_signature()
+        handler = _SUMMARY_HANDLERS.get(signature)
+        if handler is not None:
+            return handler(self)
 
         # Complex expression - build description from parts
-        time_part = self._describe_time()
-        date_part = self._describe_date()
+        time_part = self._describe_time(signature)
+        date_part = self._describe_date(signature)
 
         if time_part and date_part:
             return f"Runs {time_part} {date_part}"
@@ -190,152 +355,207 @@ class PrettyPrinter:
         else:
             return "Complex schedule"
 
+    # Summaries of the common schedules. Each one is only used when the
+    # signature guarantees the fields it reads hold exactly one value.
+
+    def _summarize_every_minute(self) -> str:
+        """Summarize a schedule that runs every minute."""
+        return "Runs every minute"
+
+    def _summarize_hourly(self) -> str:
+        """Summarize a schedule that runs once an hour."""
+        minute = next(iter(self.expression.minute.parsed_values))
+        return f"Runs every hour at minute {minute:02d}"
+
+    def _summarize_daily(self) -> str:
+        """Summarize a schedule that runs once a day."""
+        expr = self.expression
+        hour = next(iter(expr.hour.parsed_values))
+        minute = next(iter(expr.minute.parsed_values))
+        return f"Runs daily at {hour:02d}:{minute:02d}"
+
+    def _summarize_weekly(self) -> str:
+        """Summarize a schedule that runs once a week."""
+        expr = self.expression
+        day = self._get_single_weekday_name()
+        hour = next(iter(expr.hour.parsed_values))
+        minute = next(iter(expr.minute.parsed_values))
+        return f"Runs every {day} at {hour:02d}:{minute:02d}"
+
+    def _summarize_monthly(self) -> str:
+        """Summarize a schedule that runs once a month."""
+        expr = self.expression
+        day = next(iter(expr.day_of_month.parsed_values))
+        hour = next(iter(expr.hour.parsed_values))
+        minute = next(iter(expr.minute.parsed_values))
+        return f"Runs on day {day} of every month at {hour:02d}:{minute:02d}"
+
+    def _summarize_yearly(self) -> str:
+        """Summarize a schedule that runs once a year."""
+        expr = self.expression
+        month_name = self._get_month_name(next(iter(expr.month.parsed_values)))
+        day = next(iter(expr.day_of_month.parsed_values))
+        hour = next(iter(expr.hour.parsed_values))
+        minute = next(iter(expr.minute.parsed_values))
+        return f"Runs on {month_name} {day} at {hour:02d}:{minute:02d}"
+
     def _format_field_row(self, name: str, field: CronField) -> str:
         """Format a single field row for the table."""
         c = self.color_config
         description = self._describe_field(field)
-        # Truncate description if too long
-        if len(description) > 42:
-            description = description[:39] + "..."
+        # Fit the description to the 42-character column: long ones are
+        # truncated to exactly 42 characters, short ones padded
+        description = description[:39] + "..." if len(description) > 42 else description.ljust(42)
 
-        return (c.separator("│") + " " + c.field(f"{name:<15}") + " " + c.separator("│") + " " +
-                c.value(f"{field.raw_value:<13}") + " " + c.separator("│") + " " +
-                c.info(f"{description:<42}") + " " + c.separator("│"))
+        bar = c.separator("│")
+        return (bar + " " + c.field(name.ljust(15)) + " " + bar + " " +
+                c.value(field.raw_value.ljust(13)) + " " + bar + " " +
+                c.info(description) + " " + bar)
 
     def _format_detailed_field(self, name: str, field: CronField) -> List[str]:
         """Format detailed field information."""
-        lines = []
         c = self.color_config
 
-        lines.append("")
-        lines.append(c.header(f"▸ {name}"))
-        lines.append("  " + c.separator("─" * 76))
-        lines.append(f"  {c.field('Raw Value:'):12} {c.value(field.raw_value)}")
-        lines.append(f"  {c.field('Range:'):12} {c.info(f'{field.field_range.min_value}-{field.field_range.max_value}')}")
-        lines.append(f"  {c.field('Description:'):12} {c.info(self._describe_field(field))}")
+        lines = [
+            "",
+            c.header(f"▸ {name}"),
+            "  " + c.separator(_DETAILED_RULE),
+            f"  {c.field('Raw Value:'):12} {c.value(field.raw_value)}",
+            f"  {c.field('Range:'):12} {c.info(f'{field.field_range.min_value}-{field.field_range.max_value}')}",
+            f"  {c.field('Description:'):12} {c.info(self._describe_field(field))}",
+        ]
 
         if field.parsed_values:
-            values_str = self._format_value_list(field.parsed_values, field.field_type)
+            values_str = self._format_sorted_value_list(field.sorted_values, field.field_type)
             lines.append(f"  {c.field('Values:'):12} {c.highlight(values_str)}")
 
         return lines
 
-    def _format_value_list(self, values: Set[int], field_type: FieldType) -> str:
+    def _format_value_list(self, values: Iterable[int], field_type: FieldType) -> str:
         """Format a list of values for display."""
-        sorted_values = sorted(values)
+        return self._format_sorted_value_list(sorted(values), field_type)
 
+    def _format_sorted_value_list(self, sorted_values: Sequence[int], field_type: FieldType) -> str:
+        """Format a list of values, already in ascending order, for display."""
         if len(sorted_values) > 20:
             # Show first 10 and last 5 with ellipsis
             first_part = sorted_values[:10]
             last_part = sorted_values[-5:]
 
-            first_str = ", ".join(str(v) for v in first_part)
-            last_str = ", ".join(str(v) for v in last_part)
+            first_str = ", ".join(map(str, first_part))
+            last_str = ", ".join(map(str, last_part))
             return f"{first_str} ... {last_str} ({len(sorted_values)} values)"
         else:
-            if field_type == FieldType.MONTH:
-                return ", ".join(f"{v} ({self._get_month_name(v)})" for v in sorted_values)
-            elif field_type == FieldType.DAY_OF_WEEK:
-                return ", ".join(f"{v} ({self._get_weekday_name(v)})" for v in sorted_values)
-            else:
-                return ", ".join(str(v) for v in sorted_values)
+            labels = _VALUE_LABELS.get(field_type)
+            if labels is None:
+                return ", ".join(map(str, sorted_values))
+            if sorted_values and (sorted_values[0] < 0 or sorted_values[-1] >= len(labels)):
+                name = self._get_month_name if field_type == FieldType.MONTH else self._get_weekday_name
+                return ", ".join(f"{v} ({name(v)})" for v in sorted_values)
+            return ", ".join(map(labels.__getitem__, sorted_values))
 
     def _describe_field(self, field: CronField) -> str:
         """Generate a human-readable description of a field."""
-        if field.is_wildcard():
-            return f"Every {self._get_field_name(field.field_type)}"
-
-        if not field.parsed_values:
+        pattern = field.pattern
+        if pattern is None:
             return field.raw_value
 
-        values = field.parsed_values
+        kind, params = pattern
+        field_type = field.field_type
+        name = self._get_field_name(field_type)
+        plural = self._get_field_name_plural(field_type)
 
-        # Check for special patterns
-        # Check if it's an actual step pattern from the raw value
-        if "/" in field.raw_value:
-            step = self._get_step_value(values)
-            if "*/" in field.raw_value:
-                return f"Every {step} {self._get_field_name_plural(field.field_type)}"
-            else:
-                return f"Every {step} {self._get_field_name_plural(field.field_type)} from {min(values)}"
+        if kind is PatternKind.WILDCARD:
+            return f"Every {name}"
+
+        if kind is PatternKind.STEP:
+            return f"Every {params[0]} {plural}"
 
-        if self._is_range(values) and "-" in field.raw_value and "/" not in field.raw_value:
-            min_val = min(values)
-            max_val = max(values)
-            return f"From {min_val} to {max_val}"
+        if kind is PatternKind.STEP_FROM:
+            return f"Every {params[0]} {plural} from {params[1]}"
 
-        if len(values) == 1:
-            val = list(values)[0]
-            if field.field_type == FieldType.MONTH:
+        if kind is PatternKind.RANGE:
+            return f"From {params[0]} to {params[1]}"
+
+        if kind is PatternKind.SINGLE:
+            val = params[0]
+            if field_type == FieldType.MONTH:
                 return self._get_month_name(val)
-            elif field.field_type == FieldType.DAY_OF_WEEK:
+            elif field_type == FieldType.DAY_OF_WEEK:
                 return self._get_weekday_name(val)
             else:
-                return f"At {self._get_field_name(field.field_type)} {val}"
-
-        if len(values) <= 5:
-            if field.field_type == FieldType.MONTH:
-                names = [self._get_month_name(v) for v in sorted(values)]
-                return ", ".join(names)
-            elif field.field_type == FieldType.DAY_OF_WEEK:
-                names = [self._get_weekday_name(v) for v in sorted(values)]
-                return ", ".join(names)
+                return f"At {name} {val}"
+
+        count = field.match_count
+        if count <= 5:
+            values = field.sorted_values
+            if field_type == FieldType.MONTH:
+                return ", ".join(map(self._get_month_name, values))
+            elif field_type == FieldType.DAY_OF_WEEK:
+                return ", ".join(map(self._get_weekday_name, values))
             else:
-                return f"At {self._get_field_name_plural(field.field_type)} " + ", ".join(str(v) for v in sorted(values))
+                return f"At {plural} " + ", ".join(map(str, values))
 
-        return f"{len(values)} selected {self._get_field_name_plural(field.field_type)}"
+        return f"{count} selected {plural}"
 
-    def _describe_time(self) -> str:
+    def _describe_time(self, signature: Optional[int] = None) -> str:
         """Describe the time portion of the cron expression."""
         if not self.expression.minute or not self.expression.hour:
             return ""
 
-        minute_vals = self.expression.minute.parsed_values
-        hour_vals = self.expression.hour.parsed_values
+        if signature is None:
+            signature = self._get_signature()
+        single_minute = _field_code(signature, 0) == _SINGLE
+        single_hour = _field_code(signature, 1) == _SINGLE
 
-        if len(minute_vals) == 1 and len(hour_vals) == 1:
-            minute = list(minute_vals)[0]
-            hour = list(hour_vals)[0]
+        if single_minute and single_hour:
+            minute = next(iter(self.expression.minute.parsed_values))
+            hour = next(iter(self.expression.hour.parsed_values))
             return f"at {hour:02d}:{minute:02d}"
 
-        if len(minute_vals) == 1:
-            minute = list(minute_vals)[0]
+        if single_minute:
+            minute = next(iter(self.expression.minute.parsed_values))
             return f"at minute {minute:02d} of selected hours"
 
-        if len(hour_vals) == 1:
-            hour = list(hour_vals)[0]
+        if single_hour:
+            hour = next(iter(self.expression.hour.parsed_values))
             return f"at selected minutes of hour {hour}"
 
         return "at selected times"
 
-    def _describe_date(self) -> str:
+    def _describe_date(self, signature: Optional[int] = None) -> str:
         """Describe the date portion of the cron expression."""
+        if signature is None:
+            signature = self._get_signature()
+        day_of_month = _field_code(signature, 2)
+        month = _field_code(signature, 3)
+        day_of_week = _field_code(signature, 4)
         parts = []
 
-        if self.expression.day_of_month and not self.expression.day_of_month.is_wildcard():
-            days = self.expression.day_of_month.parsed_values
-            if len(days) == 1:
-                parts.append(f"on day {list(days)[0]}")
+        if self.expression.day_of_month and day_of_month != _WILDCARD:
+            days = self.expression.day_of_month.sorted_values
+            if day_of_month == _SINGLE:
+                parts.append(f"on day {days[0]}")
             else:
-                parts.append(f"on days {self._format_short_list(days)}")
+                parts.append(f"on days {self._format_sorted_short_list(days)}")
 
-        if self.expression.month and not self.expression.month.is_wildcard():
-            months = self.expression.month.parsed_values
-            if len(months) == 1:
-                parts.append(f"in {self._get_month_name(list(months)[0])}")
+        if self.expression.month and month != _WILDCARD:
+            months = self.expression.month.sorted_values
+            if month == _SINGLE:
+                parts.append(f"in {self._get_month_name(months[0])}")
             else:
-                month_names = [self._get_month_name(m) for m in sorted(months)[:3]]
+                month_names = [self._get_month_name(m) for m in months[:3]]
                 if len(months) > 3:
                     parts.append(f"in {', '.join(month_names)}...")
                 else:
                     parts.append(f"in {', '.join(month_names)}")
 
-        if self.expression.day_of_week and not self.expression.day_of_week.is_wildcard():
-            weekdays = self.expression.day_of_week.parsed_values
-            if len(weekdays) == 1:
-                parts.append(f"on {self._get_weekday_name(list(weekdays)[0])}")
+        if self.expression.day_of_week and day_of_week != _WILDCARD:
+            weekdays = self.expression.day_of_week.sorted_values
+            if day_of_week == _SINGLE:
+                parts.append(f"on {self._get_weekday_name(weekdays[0])}")
             else:
-                day_names = [self._get_weekday_name(d) for d in sorted(weekdays)[:3]]
+                day_names = [self._get_weekday_name(d) for d in weekdays[:3]]
                 if len(weekdays) > 3:
                     parts.append(f"on {', '.join(day_names)}...")
                 else:
@@ -343,130 +563,80 @@ class PrettyPrinter:
 
         return " ".join(parts)
 
-    def _format_short_list(self, values: Set[int]) -> str:
-        """Format a short list of values."""
-        sorted_vals = sorted(values)
+    def _format_sorted_short_list(self, sorted_vals: Sequence[int]) -> str:
+        """Format a short list of values already in ascending order."""
         if len(sorted_vals) <= 5:
             return ", ".join(str(v) for v in sorted_vals)
         else:
             return f"{sorted_vals[0]}, {sorted_vals[1]}, ... {sorted_vals[-1]}"
 
-    def _is_range(self, values: Set[int]) -> bool:
+    def _is_range(self, values: Iterable[int]) -> bool:
         """Check if values form a continuous range."""
-        if len(values) < 2:
-            return False
-        sorted_vals = sorted(values)
-        return sorted_vals == list(range(sorted_vals[0], sorted_vals[-1] + 1))
+        return _mask_is_range(values_to_mask(values))
 
-    def _is_step(self, values: Set[int], min_val: int, max_val: int) -> bool:
+    def _is_step(self, values: Iterable[int], min_val: int, max_val: int) -> bool:
         """Check if values form a step pattern."""
-        if len(values) < 2:
+        mask = values_to_mask(values)
+        if mask & (mask - 1) == 0:
             return False
-        sorted_vals = sorted(values)
-        if len(sorted_vals) < 2:
-            return False
-
-        step = sorted_vals[1] - sorted_vals[0]
-        if step <= 0:
-            return False
-
-        for i in range(1, len(sorted_vals)):
-            if sorted_vals[i] - sorted_vals[i-1] != step:
-                return False
-
-        return True
+        # Evenly spaced values are exactly the step mask between the ends
+        low, high = _mask_bounds(mask)
+        return mask == step_mask(low, high, _mask_step(mask))
 
-    def _get_step_value(self, values: Set[int]) -> int:
+    def _get_step_value(self, values: Iterable[int]) -> int:
         """Get the step value from a set of values."""
-        sorted_vals = sorted(values)
-        if len(sorted_vals) >= 2:
-            return sorted_vals[1] - sorted_vals[0]
-        return 1
+        return _mask_step(values_to_mask(values))
+
+    def _get_signature(self) -> int:
+        """
+        Classify each field once as a wildcard, a single value or neither.
 
-    def _is_every_minute(self) -> bool:
-        """Check if expression runs every minute."""
-        return (self.expression.minute and self.expression.minute.is_wildcard() and
-                self.expression.hour and self.expression.hour.is_wildcard() and
-                self.expression.day_of_month and self.expression.day_of_month.is_wildcard() and
-                self.expression.month and self.expression.month.is_wildcard() and
-                self.expression.day_of_week and self.expression.day_of_week.is_wildcard())
-
-    def _is_hourly(self) -> bool:
-        """Check if expression runs hourly."""
-        return (self.expression.minute and len(self.expression.minute.parsed_values) == 1 and
-                self.expression.hour and self.expression.hour.is_wildcard() and
-                self.expression.day_of_month and self.expression.day_of_month.is_wildcard() and
-                self.expression.month and self.expression.month.is_wildcard() and
-                self.expression.day_of_week and self.expression.day_of_week.is_wildcard())
-
-    def _is_daily(self) -> bool:
-        """Check if expression runs daily."""
-        return (self.expression.minute and len(self.expression.minute.parsed_values) == 1 and
-                self.expression.hour and len(self.expression.hour.parsed_values) == 1 and
-                self.expression.day_of_month and self.expression.day_of_month.is_wildcard() and
-                self.expression.month and self.expression.month.is_wildcard() and
-                self.expression.day_of_week and self.expression.day_of_week.is_wildcard())
-
-    def _is_weekly(self) -> bool:
-        """Check if expression runs weekly."""
-        return (self.expression.minute and len(self.expression.minute.parsed_values) == 1 and
-                self.expression.hour and len(self.expression.hour.parsed_values) == 1 and
-                self.expression.day_of_month and self.expression.day_of_month.is_wildcard() and
-                self.expression.month and self.expression.month.is_wildcard() and
-                self.expression.day_of_week and len(self.expression.day_of_week.parsed_values) == 1)
-
-    def _is_monthly(self) -> bool:
-        """Check if expression runs monthly."""
-        return (self.expression.minute and len(self.expression.minute.parsed_values) == 1 and
-                self.expression.hour and len(self.expression.hour.parsed_values) == 1 and
-                self.expression.day_of_month and len(self.expression.day_of_month.parsed_values) == 1 and
-                self.expression.month and self.expression.month.is_wildcard() and
-                self.expression.day_of_week and self.expression.day_of_week.is_wildcard())
-
-    def _is_yearly(self) -> bool:
-        """Check if expression runs yearly."""
-        return (self.expression.minute and len(self.expression.minute.parsed_values) == 1 and
-                self.expression.hour and len(self.expression.hour.parsed_values) == 1 and
-                self.expression.day_of_month and len(self.expression.day_of_month.parsed_values) == 1 and
-                self.expression.month and len(self.expression.month.parsed_values) == 1 and
-                self.expression.day_of_week and self.expression.day_of_week.is_wildcard())
+        Returns:
+            The fields' codes packed into a signature.
+        """
+        signature = 0
+        shift = 0
+        for field in (self.expression.minute, self.expression.hour,
+                      self.expression.day_of_month, self.expression.month,
+                      self.expression.day_of_week):
+            if field is not None:
+                if field.is_wildcard():
+                    signature |= _WILDCARD << shift
+                elif field.match_count == 1:
+                    signature |= _SINGLE << shift
+            shift += 2
+        return signature
 
     def _get_field_name(self, field_type: FieldType) -> str:
         """Get human-readable field name."""
-        names = {
-            FieldType.MINUTE: "minute",
-            FieldType.HOUR: "hour",
-            FieldType.DAY_OF_MONTH: "day",
-            FieldType.MONTH: "month",
-            FieldType.DAY_OF_WEEK: "day_of_week"
-        }
-        return names.get(field_type, field_type.value)
+        return _FIELD_NAMES.get(field_type, field_type.value)
 
     def _get_field_name_plural(self, field_type: FieldType) -> str:
         """Get human-readable plural field name."""
-        names = {
-            FieldType.MINUTE: "minutes",
-            FieldType.HOUR: "hours",
-            FieldType.DAY_OF_MONTH: "days",
-            FieldType.MONTH: "months",
-            FieldType.DAY_OF_WEEK: "days_of_week"
-        }
-        return names.get(field_type, field_type.value + "s")
+        return _FIELD_NAMES_PLURAL.get(field_type, field_type.value + "s")
 
     def _get_month_name(self, month: int) -> str:
         """Get month name from number."""
-        months = ["", "January", "February", "March", "April", "May", "June",
-                  "July", "August", "September", "October", "November", "December"]
-        return months[month] if 0 < month <= 12 else str(month)
+        return _MONTHS[month] if 0 < month <= 12 else str(month)
 
     def _get_weekday_name(self, day: int) -> str:
         """Get weekday name from number."""
-        days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-        return days[day] if 0 <= day <= 6 else str(day)
+        return _WEEKDAYS[day] if 0 <= day <= 6 else str(day)
 
     def _get_single_weekday_name(self) -> str:
         """Get the single weekday name if only one is selected."""
-        if self.expression.day_of_week and len(self.expression.day_of_week.parsed_values) == 1:
-            day = list(self.expression.day_of_week.parsed_values)[0]
+        if self.expression.day_of_week and self.expression.day_of_week.match_count == 1:
+            day = next(iter(self.expression.day_of_week.parsed_values))
             return self._get_weekday_name(day)
-        return ""
\ No newline at end of file
+        return ""
+
+
+# Summary builders for the common schedules, by signature
+_SUMMARY_HANDLERS: Dict[int, Callable[[PrettyPrinter], str]] = {
+    _signature(_WILDCARD, _WILDCARD, _WILDCARD, _WILDCARD, _WILDCARD): PrettyPrinter._summarize_every_minute,
+    _signature(_SINGLE, _WILDCARD, _WILDCARD, _WILDCARD, _WILDCARD): PrettyPrinter._summarize_hourly,
+    _signature(_SINGLE, _SINGLE, _WILDCARD, _WILDCARD, _WILDCARD): PrettyPrinter._summarize_daily,
+    _signature(_SINGLE, _SINGLE, _WILDCARD, _WILDCARD, _SINGLE): PrettyPrinter._summarize_weekly,
+    _signature(_SINGLE, _SINGLE, _SINGLE, _WILDCARD, _WILDCARD): PrettyPrinter._summarize_monthly,
+    _signature(_SINGLE, _SINGLE, _SINGLE, _SINGLE, _WILDCARD): PrettyPrinter._summarize_yearly,
+}
@@ -1,28 +1,49 @@
 """Scheduler for calculating cron expression run times."""
 
+import calendar
+import functools
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 import pytz
 
 from cronpal.exceptions import CronPalError
-from cronpal.models import CronExpression
+from cronpal.models import CronExpression, next_set_bit, prev_set_bit
 from cronpal.time_utils import (
-    get_next_day,
-    get_next_hour,
-    get_next_minute,
-    get_next_month,
-    get_previous_day,
-    get_previous_hour,
-    get_previous_minute,
-    get_previous_month,
-    get_weekday,
-    is_valid_day_in_month,
     round_to_next_minute,
     round_to_previous_minute,
 )
 from cronpal.timezone_utils import convert_to_timezone, get_current_time, get_timezone
 
+# How many years to search before giving up on an expression
+# (e.g. "0 0 30 2 *" never runs)
+MAX_SEARCH_YEARS = 10
+
+# Maximum number of candidates to try when skipping wall-clock times
+# that don't exist in the scheduler's timezone (DST gaps)
+MAX_ITERATIONS = 10000
+
+
+@functools.lru_cache(maxsize=512)
+def _month_layout(year: int, month: int) -> Tuple[int, int]:
+    """
+    Get the days and starting weekday of a month (cached).
+
+    Listing many runs visits the same few months over and over, so this
+    is only worked out once per month.
+
+    Args:
+        year: The year.
+        month: The month (1-12).
+
+    Returns:
+        Tuple of (bitmask with bits 1 to the last day set, cron weekday
+        of the 1st with 0=Sunday).
+    """
+    first_weekday, days_in_month = calendar.monthrange(year, month)
+    # monthrange counts weekdays from Monday=0
+    return (2 << days_in_month) - 2, (first_weekday + 1) % 7
+
 
 class CronScheduler:
     """Calculator for cron expression run times."""
@@ -74,19 +95,18 @@ class CronScheduler:
         # Round up to next minute if needed
         current = round_to_next_minute(after)
 
-        # Maximum iterations to prevent infinite loops
-        max_iterations = 10000
-        iterations = 0
-
-        while iterations < max_iterations:
-            iterations += 1
+        # Search on wall-clock time; only DST gaps make us go round again
+        wall_time = current.replace(tzinfo=None)
+        for _ in range(MAX_ITERATIONS):
+            candidate = self._find_next_wall_time(wall_time)
+            if candidate is None:
+                break
 
-            # Check if current time matches the cron expression
-            if self._matches_time(current):
-                return current
+            run = self._localize(candidate)
+            if run is not None and run >= current:
+                return run
 
-            # Move to next possible time
-            current = self._advance_to_next_possible(current)
+            wall_time = candidate + timedelta(minutes=1)
 
         raise CronPalError("Could not find next run time within reasonable limits")
 
@@ -103,6 +123,26 @@ class CronScheduler:
         Returns:
             List of next run times (all timezone-aware).
 
+        Raises:
+            ValueError: If count is less than 1.
+        """
+        return list(self.iter_next_runs(count, after))
+
+    def iter_next_runs(self, count: int, after: Optional[datetime] = None) -> Iterator[datetime]:
+        """
+        Iterate over the next run times for the cron expression.
+
+        Each run is only calculated when it is requested.
+
+        Args:
+            count: Number of next run times to yield.
+            after: The datetime to start searching from.
+                   Can be naive (will use scheduler's timezone) or aware.
+                   Defaults to current time if not provided.
+
+        Returns:
+            Iterator over the next run times (all timezone-aware).
+
         Raises:
             ValueError: If count is less than 1.
         """
@@ -114,17 +154,16 @@ class CronScheduler:
         else:
             after = convert_to_timezone(after, self.timezone)
 
-        runs = []
-        current = after
+        return self._generate_next_runs(count, after)
 
+    def _generate_next_runs(self, count: int, current: datetime) -> Iterator[datetime]:
+        """Yield count next run times starting from current."""
         for _ in range(count):
             next_run = self.get_next_run(current)
-            runs.append(next_run)
+            yield next_run
             # Start next search 1 minute after the found time
             current = next_run + timedelta(minutes=1)
 
-        return runs
-
     def get_previous_run(self, before: Optional[datetime] = None) -> datetime:
         """
         Calculate the previous run time for the cron expression.
@@ -146,19 +185,18 @@ class CronScheduler:
         # Round down to previous minute if needed
         current = round_to_previous_minute(before)
 
-        # Maximum iterations to prevent infinite loops
-        max_iterations = 10000
-        iterations = 0
-
-        while iterations < max_iterations:
-            iterations += 1
+        # Search on wall-clock time; only DST gaps make us go round again
+        wall_time = current.replace(tzinfo=None)
+        for _ in range(MAX_ITERATIONS):
+            candidate = self._find_previous_wall_time(wall_time)
+            if candidate is None:
+                break
 
-            # Check if current time matches the cron expression
-            if self._matches_time(current):
-                return current
+            run = self._localize(candidate)
+            if run is not None and run <= current:
+                return run
 
-            # Move to previous possible time
-            current = self._retreat_to_previous_possible(current)
+            wall_time = candidate - timedelta(minutes=1)
 
         raise CronPalError("Could not find previous run time within reasonable limits")
 
@@ -175,6 +213,26 @@ class CronScheduler:
         Returns:
             List of previous run times (most recent first, all timezone-aware).
 
+        Raises:
+            ValueError: If count is less than 1.
+        """
+        return list(self.iter_previous_runs(count, before))
+
+    def iter_previous_runs(self, count: int, before: Optional[datetime] = None) -> Iterator[datetime]:
+        """
+        Iterate over the previous run times for the cron expression.
+
+        Each run is only calculated when it is requested.
+
+        Args:
+            count: Number of previous run times to yield.
+            before: The datetime to start searching from.
+                    Can be naive (will use scheduler's timezone) or aware.
+                    Defaults to current time if not provided.
+
+        Returns:
+            Iterator over the previous run times (most recent first, all timezone-aware).
+
         Raises:
             ValueError: If count is less than 1.
         """
@@ -186,17 +244,16 @@ class CronScheduler:
         else:
             before = convert_to_timezone(before, self.timezone)
 
-        runs = []
-        current = before
+        return self._generate_previous_runs(count, before)
 
+    def _generate_previous_runs(self, count: int, current: datetime) -> Iterator[datetime]:
+        """Yield count previous run times starting from current."""
         for _ in range(count):
             previous_run = self.get_previous_run(current)
-            runs.append(previous_run)
+            yield previous_run
             # Start next search 1 minute before the found time
             current = previous_run - timedelta(minutes=1)
 
-        return runs
-
     def _matches_time(self, dt: datetime) -> bool:
         """
         Check if a datetime matches the cron expression.
@@ -211,366 +268,165 @@ class CronScheduler:
         if dt.tzinfo != self.timezone:
             dt = convert_to_timezone(dt, self.timezone)
 
-        # Check minute
-        if dt.minute not in self.cron_expr.minute.parsed_values:
-            return False
-
-        # Check hour
-        if dt.hour not in self.cron_expr.hour.parsed_values:
-            return False
-
-        # Check month
-        if dt.month not in self.cron_expr.month.parsed_values:
-            return False
-
-        # Check day of month - but only if it's valid for this month
-        if not is_valid_day_in_month(dt.year, dt.month, dt.day):
-            return False
-
-        # For day fields, we need to check if EITHER day of month OR day of week matches
-        # This is the standard cron behavior
-        day_of_month_match = dt.day in self.cron_expr.day_of_month.parsed_values
-        day_of_week_match = get_weekday(dt) in self.cron_expr.day_of_week.parsed_values
-
-        # If both day of month and day of week are restricted (not wildcards),
-        # then we match if EITHER matches (OR logic)
-        if not self.cron_expr.day_of_month.is_wildcard() and not self.cron_expr.day_of_week.is_wildcard():
-            return day_of_month_match or day_of_week_match
-
-        # Otherwise both must match
-        return day_of_month_match and day_of_week_match
-
-    def _advance_to_next_possible(self, dt: datetime) -> datetime:
-        """
-        Advance datetime to the next possible matching time.
-
-        Args:
-            dt: The current datetime (in scheduler's timezone).
-
-        Returns:
-            The next datetime that could potentially match.
-        """
-        # Try to advance minute first
-        next_minute = self._get_next_minute(dt)
-        if next_minute is not None:
-            return next_minute
-
-        # If no valid minute in this hour, try next hour
-        next_hour = self._get_next_hour(dt)
-        if next_hour is not None:
-            return next_hour
-
-        # If no valid hour today, try next day
-        next_day = self._get_next_day(dt)
-        if next_day is not None:
-            return next_day
+        # Test each field's bit; the day mask already applies the month
+        # length and the day of month / day of week OR rule
+        cron_expr = self.cron_expr
+        return bool(
+            (cron_expr.minute.mask >> dt.minute) & 1
+            and (cron_expr.hour.mask >> dt.hour) & 1
+            and (cron_expr.month.mask >> dt.month) & 1
+            and (self._get_day_mask(dt.year, dt.month) >> dt.day) & 1
+        )
 
-        # If no valid day this month, try next month
-        return self._get_next_month(dt)
-
-    def _retreat_to_previous_possible(self, dt: datetime) -> datetime:
+    def _localize(self, wall_time: datetime) -> Optional[datetime]:
         """
-        Retreat datetime to the previous possible matching time.
+        Attach the scheduler's timezone to a naive wall-clock time.
 
         Args:
-            dt: The current datetime (in scheduler's timezone).
+            wall_time: The naive datetime to localize.
 
         Returns:
-            The previous datetime that could potentially match.
+            The timezone-aware datetime, or None if the wall-clock time
+            doesn't exist in the scheduler's timezone (skipped by DST).
         """
-        # Try to retreat minute first
-        prev_minute = self._get_previous_minute(dt)
-        if prev_minute is not None:
-            return prev_minute
-
-        # If no valid minute in this hour, try previous hour
-        prev_hour = self._get_previous_hour(dt)
-        if prev_hour is not None:
-            return prev_hour
+        dt = convert_to_timezone(wall_time, self.timezone)
 
-        # If no valid hour today, try previous day
-        prev_day = self._get_previous_day(dt)
-        if prev_day is not None:
-            return prev_day
+        # Non-existent times come back shifted once normalized
+        if dt.astimezone(self.timezone).replace(tzinfo=None) != wall_time:
+            return None
 
-        # If no valid day this month, try previous month
-        return self._get_previous_month(dt)
+        return dt
 
-    def _get_next_minute(self, dt: datetime) -> Optional[datetime]:
+    def _get_day_mask(self, year: int, month: int) -> int:
         """
-        Get the next valid minute after the current time.
+        Get a bitmask of the days in a month that match the day fields.
 
         Args:
-            dt: The current datetime.
+            year: The year.
+            month: The month (1-12).
 
         Returns:
-            Next valid minute in the same hour, or None if no valid minute.
+            Bitmask with bit ``n`` set when day ``n`` of the month matches.
         """
-        current_minute = dt.minute
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values)
+        valid_days, first_weekday = _month_layout(year, month)
 
-        for minute in valid_minutes:
-            if minute > current_minute:
-                return dt.replace(minute=minute, second=0, microsecond=0)
+        day_of_month = self.cron_expr.day_of_month
+        day_of_week = self.cron_expr.day_of_week
 
-        return None
+        # Rotate the weekday mask so bit 0 is the weekday of the 1st,
+        # then repeat it across the five weeks a month can touch
+        weekdays = day_of_week.mask
+        week = ((weekdays >> first_weekday) | (weekdays << (7 - first_weekday))) & 0x7F
+        week_days = (week | week << 7 | week << 14 | week << 21 | week << 28) << 1
 
-    def _get_previous_minute(self, dt: datetime) -> Optional[datetime]:
-        """
-        Get the previous valid minute before the current time.
+        # Apply OR logic for day fields if both are restricted
+        if not day_of_month.is_wildcard() and not day_of_week.is_wildcard():
+            return (day_of_month.mask | week_days) & valid_days
 
-        Args:
-            dt: The current datetime.
+        return day_of_month.mask & week_days & valid_days
 
-        Returns:
-            Previous valid minute in the same hour, or None if no valid minute.
+    def _find_next_wall_time(self, start: datetime) -> Optional[datetime]:
         """
-        current_minute = dt.minute
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values, reverse=True)
-
-        for minute in valid_minutes:
-            if minute < current_minute:
-                return dt.replace(minute=minute, second=0, microsecond=0)
+        Find the first matching wall-clock time at or after start.
 
-        return None
-
-    def _get_next_hour(self, dt: datetime) -> Optional[datetime]:
-        """
-        Get the next valid hour after the current time.
+        Works down from month to minute, using the field bitmasks to jump
+        straight to the next allowed value at each level.
 
         Args:
-            dt: The current datetime.
+            start: The naive datetime to start from (minute precision).
 
         Returns:
-            Next valid hour in the same day, or None if no valid hour.
-        """
-        current_hour = dt.hour
-        valid_hours = sorted(self.cron_expr.hour.parsed_values)
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values)
-
-        # First minute of the next valid hour
-        first_minute = valid_minutes[0] if valid_minutes else 0
-
-        for hour in valid_hours:
-            if hour > current_hour:
-                return dt.replace(hour=hour, minute=first_minute, second=0, microsecond=0)
+            The next matching naive datetime, or None if there is none
+            within the search window.
+        """
+        month_mask = self.cron_expr.month.mask
+        hour_mask = self.cron_expr.hour.mask
+        minute_mask = self.cron_expr.minute.mask
+
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+        last_year = year + MAX_SEARCH_YEARS
+
+        while year <= last_year:
+            next_month = next_set_bit(month_mask, month)
+            if next_month is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if next_month != month:
+                month, day, hour, minute = next_month, 1, 0, 0
+
+            next_day = next_set_bit(self._get_day_mask(year, month), day)
+            if next_day is None:
+                month, day, hour, minute = month + 1, 1, 0, 0
+                continue
+            if next_day != day:
+                day, hour, minute = next_day, 0, 0
+
+            next_hour = next_set_bit(hour_mask, hour)
+            if next_hour is None:
+                day, hour, minute = day + 1, 0, 0
+                continue
+            if next_hour != hour:
+                hour, minute = next_hour, 0
+
+            next_minute = next_set_bit(minute_mask, minute)
+            if next_minute is None:
+                hour, minute = hour + 1, 0
+                continue
+
+            return datetime(year, month, day, hour, next_minute)
 
         return None
 
-    def _get_previous_hour(self, dt: datetime) -> Optional[datetime]:
-        """
-        Get the previous valid hour before the current time.
-
-        Args:
-            dt: The current datetime.
-
-        Returns:
-            Previous valid hour in the same day, or None if no valid hour.
-        """
-        current_hour = dt.hour
-        valid_hours = sorted(self.cron_expr.hour.parsed_values, reverse=True)
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values, reverse=True)
-
-        # Last minute of the previous valid hour
-        last_minute = valid_minutes[0] if valid_minutes else 59
-
-        for hour in valid_hours:
-            if hour < current_hour:
-                return dt.replace(hour=hour, minute=last_minute, second=0, microsecond=0)
-
-        return None
-
-    def _get_next_day(self, dt: datetime) -> Optional[datetime]:
-        """
-        Get the next valid day after the current time.
-
-        Args:
-            dt: The current datetime.
-
-        Returns:
-            Next valid day in the same month, or None if no valid day.
+    def _find_previous_wall_time(self, start: datetime) -> Optional[datetime]:
         """
-        current_day = dt.day
-        valid_hours = sorted(self.cron_expr.hour.parsed_values)
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values)
-
-        # First time of the day
-        first_hour = valid_hours[0] if valid_hours else 0
-        first_minute = valid_minutes[0] if valid_minutes else 0
-
-        # Check remaining days in the month
-        for day in range(current_day + 1, 32):
-            if not is_valid_day_in_month(dt.year, dt.month, day):
-                break
+        Find the last matching wall-clock time at or before start.
 
-            test_dt = dt.replace(day=day, hour=first_hour, minute=first_minute,
-                                second=0, microsecond=0)
-
-            # Check if this day matches day constraints
-            day_of_month_match = day in self.cron_expr.day_of_month.parsed_values
-            day_of_week_match = get_weekday(test_dt) in self.cron_expr.day_of_week.parsed_values
-
-            # Apply OR logic for day fields if both are restricted
-            if not self.cron_expr.day_of_month.is_wildcard() and not self.cron_expr.day_of_week.is_wildcard():
-                if day_of_month_match or day_of_week_match:
-                    return test_dt
-            else:
-                if day_of_month_match and day_of_week_match:
-                    return test_dt
-
-        return None
-
-    def _get_previous_day(self, dt: datetime) -> Optional[datetime]:
-        """
-        Get the previous valid day before the current time.
+        Works down from month to minute, using the field bitmasks to jump
+        straight to the previous allowed value at each level.
 
         Args:
-            dt: The current datetime.
+            start: The naive datetime to start from (minute precision).
 
         Returns:
-            Previous valid day in the same month, or None if no valid day.
-        """
-        current_day = dt.day
-        valid_hours = sorted(self.cron_expr.hour.parsed_values, reverse=True)
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values, reverse=True)
-
-        # Last time of the day
-        last_hour = valid_hours[0] if valid_hours else 23
-        last_minute = valid_minutes[0] if valid_minutes else 59
-
-        # Check previous days in the month
-        for day in range(current_day - 1, 0, -1):
-            test_dt = dt.replace(day=day, hour=last_hour, minute=last_minute,
-                                second=0, microsecond=0)
-
-            # Check if this day matches day constraints
-            day_of_month_match = day in self.cron_expr.day_of_month.parsed_values
-            day_of_week_match = get_weekday(test_dt) in self.cron_expr.day_of_week.parsed_values
-
-            # Apply OR logic for day fields if both are restricted
-            if not self.cron_expr.day_of_month.is_wildcard() and not self.cron_expr.day_of_week.is_wildcard():
-                if day_of_month_match or day_of_week_match:
-                    return test_dt
-            else:
-                if day_of_month_match and day_of_week_match:
-                    return test_dt
+            The previous matching naive datetime, or None if there is none
+            within the search window.
+        """
+        month_mask = self.cron_expr.month.mask
+        hour_mask = self.cron_expr.hour.mask
+        minute_mask = self.cron_expr.minute.mask
+
+        year, month, day = start.year, start.month, start.day
+        hour, minute = start.hour, start.minute
+        first_year = year - MAX_SEARCH_YEARS
+
+        while year >= first_year:
+            prev_month = prev_set_bit(month_mask, month)
+            if prev_month is None:
+                year, month, day, hour, minute = year - 1, 12, 31, 23, 59
+                continue
+            if prev_month != month:
+                month, day, hour, minute = prev_month, 31, 23, 59
+
+            prev_day = prev_set_bit(self._get_day_mask(year, month), day)
+            if prev_day is None:
+                month, day, hour, minute = month - 1, 31, 23, 59
+                continue
+            if prev_day != day:
+                day, hour, minute = prev_day, 23, 59
+
+            prev_hour = prev_set_bit(hour_mask, hour)
+            if prev_hour is None:
+                day, hour, minute = day - 1, 23, 59
+                continue
+            if prev_hour != hour:
+                hour, minute = prev_hour, 59
+
+            prev_minute = prev_set_bit(minute_mask, minute)
+            if prev_minute is None:
+                hour, minute = hour - 1, 59
+                continue
+
+            return datetime(year, month, day, hour, prev_minute)
 
         return None
-
-    def _get_next_month(self, dt: datetime) -> datetime:
-        """
-        Get the first valid time in the next valid month.
-
-        Args:
-            dt: The current datetime.
-
-        Returns:
-            First valid time in the next valid month.
-        """
-        valid_months = sorted(self.cron_expr.month.parsed_values)
-        valid_hours = sorted(self.cron_expr.hour.parsed_values)
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values)
-
-        # First time of any day
-        first_hour = valid_hours[0] if valid_hours else 0
-        first_minute = valid_minutes[0] if valid_minutes else 0
-
-        # Start searching from current year
-        current_year = dt.year
-        current_month = dt.month
-
-        # Search for up to 10 years to handle February 29th cases
-        for year_offset in range(10):
-            search_year = current_year + year_offset
-
-            # Determine which months to check this year
-            if year_offset == 0:
-                # For current year, only check months after current month
-                months_to_check = [m for m in valid_months if m > current_month]
-            else:
-                # For future years, check all valid months
-                months_to_check = valid_months
-
-            for month in months_to_check:
-                # Find first valid day in this month
-                for day in range(1, 32):
-                    if not is_valid_day_in_month(search_year, month, day):
-                        continue
-
-                    # Create datetime in the scheduler's timezone
-                    test_dt = self.timezone.localize(
-                        datetime(search_year, month, day, first_hour, first_minute, 0, 0)
-                    )
-
-                    # Check day constraints
-                    day_of_month_match = day in self.cron_expr.day_of_month.parsed_values
-                    day_of_week_match = get_weekday(test_dt) in self.cron_expr.day_of_week.parsed_values
-
-                    if not self.cron_expr.day_of_month.is_wildcard() and not self.cron_expr.day_of_week.is_wildcard():
-                        if day_of_month_match or day_of_week_match:
-                            return test_dt
-                    else:
-                        if day_of_month_match and day_of_week_match:
-                            return test_dt
-
-        # This should rarely happen unless the cron expression is very restrictive
-        raise CronPalError("Could not find valid next month")
-
-    def _get_previous_month(self, dt: datetime) -> datetime:
-        """
-        Get the last valid time in the previous valid month.
-
-        Args:
-            dt: The current datetime.
-
-        Returns:
-            Last valid time in the previous valid month.
-        """
-        valid_months = sorted(self.cron_expr.month.parsed_values, reverse=True)
-        valid_hours = sorted(self.cron_expr.hour.parsed_values, reverse=True)
-        valid_minutes = sorted(self.cron_expr.minute.parsed_values, reverse=True)
-
-        # Last time of any day
-        last_hour = valid_hours[0] if valid_hours else 23
-        last_minute = valid_minutes[0] if valid_minutes else 59
-
-        # Start searching from current year
-        current_year = dt.year
-        current_month = dt.month
-
-        # Search for up to 10 years back
-        for year_offset in range(10):
-            search_year = current_year - year_offset
-
-            # Determine which months to check this year
-            if year_offset == 0:
-                # For current year, only check months before current month
-                months_to_check = [m for m in valid_months if m < current_month]
-            else:
-                # For past years, check all valid months
-                months_to_check = valid_months
-
-            for month in months_to_check:
-                # Find last valid day in this month
-                for day in range(31, 0, -1):
-                    if not is_valid_day_in_month(search_year, month, day):
-                        continue
-
-                    # Create datetime in the scheduler's timezone
-                    test_dt = self.timezone.localize(
-                        datetime(search_year, month, day, last_hour, last_minute, 0, 0)
-                    )
-
-                    # Check day constraints
-                    day_of_month_match = day in self.cron_expr.day_of_month.parsed_values
-                    day_of_week_match = get_weekday(test_dt) in self.cron_expr.day_of_week.parsed_values
-
-                    if not self.cron_expr.day_of_month.is_wildcard() and not self.cron_expr.day_of_week.is_wildcard():
-                        if day_of_month_match or day_of_week_match:
-                            return test_dt
-                    else:
-                        if day_of_month_match and day_of_week_match:
-                            return test_dt
-
-        # This should rarely happen unless the cron expression is very restrictive
-        raise CronPalError("Could not find valid previous month")
\ No newline at end of file
@@ -1,10 +1,61 @@
 """Special string parser for cron expressions."""
 
+import copy
+from typing import Dict
+
 from cronpal.constants import SPECIAL_STRINGS
 from cronpal.exceptions import InvalidCronExpression
 from cronpal.field_parser import FieldParser
 from cronpal.models import CronExpression
 
+# Human-readable descriptions of the special strings
+SPECIAL_DESCRIPTIONS = {
+    "@yearly": "Run once a year at midnight on January 1st",
+    "@annually": "Run once a year at midnight on January 1st",
+    "@monthly": "Run once a month at midnight on the 1st",
+    "@weekly": "Run once a week at midnight on Sunday",
+    "@daily": "Run once a day at midnight",
+    "@midnight": "Run once a day at midnight",
+    "@hourly": "Run once an hour at the beginning of the hour",
+    "@reboot": "Run at system startup"
+}
+
+
+def _build_special_table() -> Dict[str, CronExpression]:
+    """
+    Parse every special string once into a prototype CronExpression.
+
+    Returns:
+        Dictionary mapping lowercase special strings to parsed expressions.
+    """
+    field_parser = FieldParser()
+    table = {}
+
+    for special_string, expanded in SPECIAL_STRINGS.items():
+        cron_expr = CronExpression(special_string)
+
+        # @reboot is a special case that doesn't have time fields
+        if special_string != "@reboot":
+            fields = expanded.split()
+            if len(fields) != 5:
+                raise InvalidCronExpression(
+                    f"Invalid expansion for {special_string}: {expanded}"
+                )
+
+            cron_expr.minute = field_parser.parse_minute(fields[0])
+            cron_expr.hour = field_parser.parse_hour(fields[1])
+            cron_expr.day_of_month = field_parser.parse_day_of_month(fields[2])
+            cron_expr.month = field_parser.parse_month(fields[3])
+            cron_expr.day_of_week = field_parser.parse_day_of_week(fields[4])
+
+        table[special_string.lower()] = cron_expr
+
+    return table
+
+
+# Pre-parsed special strings, keyed by lowercase name
+_SPECIAL_TABLE = _build_special_table()
+
 
 class SpecialStringParser:
     """Parser for special cron strings like @yearly, @daily, etc."""
@@ -23,7 +74,7 @@ class SpecialStringParser:
         Returns:
             True if it's a special string, False otherwise.
         """
-        return expression.strip().lower() in [s.lower() for s in SPECIAL_STRINGS.keys()]
+        return expression.strip().lower() in _SPECIAL_TABLE
 
     def parse(self, special_string: str) -> CronExpression:
         """
@@ -40,50 +91,16 @@ class SpecialStringParser:
         """
         special_string = special_string.strip()
 
-        # Check if it's a valid special string
-        if special_string not in SPECIAL_STRINGS:
-            # Try case-insensitive match
-            special_lower = special_string.lower()
-            matching_key = None
-            for key in SPECIAL_STRINGS.keys():
-                if key.lower() == special_lower:
-                    matching_key = key
-                    break
-
-            if not matching_key:
-                available = ", ".join(sorted(SPECIAL_STRINGS.keys()))
-                raise InvalidCronExpression(
-                    f"Unknown special string: '{special_string}'. "
-                    f"Available: {available}"
-                )
-            special_string = matching_key
-
-        # Get the expanded expression
-        expanded = SPECIAL_STRINGS[special_string]
-
-        # Create the CronExpression with the original special string
-        cron_expr = CronExpression(special_string)
-
-        # Handle @reboot specially - it doesn't expand to standard fields
-        if special_string == "@reboot":
-            # @reboot is a special case that doesn't have time fields
-            return cron_expr
-
-        # Parse the expanded expression fields
-        fields = expanded.split()
-        if len(fields) != 5:
+        prototype = _SPECIAL_TABLE.get(special_string.lower())
+        if prototype is None:
+            available = ", ".join(sorted(SPECIAL_STRINGS.keys()))
             raise InvalidCronExpression(
-                f"Invalid expansion for {special_string}: {expanded}"
+                f"Unknown special string: '{special_string}'. "
+                f"Available: {available}"
             )
 
-        # Parse each field using the field parser
-        cron_expr.minute = self.field_parser.parse_minute(fields[0])
-        cron_expr.hour = self.field_parser.parse_hour(fields[1])
-        cron_expr.day_of_month = self.field_parser.parse_day_of_month(fields[2])
-        cron_expr.month = self.field_parser.parse_month(fields[3])
-        cron_expr.day_of_week = self.field_parser.parse_day_of_week(fields[4])
-
-        return cron_expr
+        # Hand out a copy so callers can't modify the shared prototype
+        return copy.deepcopy(prototype)
 
     def get_description(self, special_string: str) -> str:
         """
@@ -95,21 +112,10 @@ class SpecialStringParser:
         Returns:
             A human-readable description.
         """
-        descriptions = {
-            "@yearly": "Run once a year at midnight on January 1st",
-            "@annually": "Run once a year at midnight on January 1st",
-            "@monthly": "Run once a month at midnight on the 1st",
-            "@weekly": "Run once a week at midnight on Sunday",
-            "@daily": "Run once a day at midnight",
-            "@midnight": "Run once a day at midnight",
-            "@hourly": "Run once an hour at the beginning of the hour",
-            "@reboot": "Run at system startup"
-        }
-
         # Normalize the string
         special_string = special_string.strip().lower()
-        for key, desc in descriptions.items():
-            if key.lower() == special_string:
-                return desc
+        description = SPECIAL_DESCRIPTIONS.get(special_string)
+        if description is not None:
+            return description
 
-        return f"Unknown special string: {special_string}"
\ No newline at end of file
+        return f"Unknown special string: {special_string}"
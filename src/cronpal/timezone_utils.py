@@ -1,11 +1,13 @@
 """Timezone utilities for cron expressions."""
 
+import functools
 from datetime import datetime
 from typing import List, Optional, Union
 
 import pytz
 
 
+@functools.lru_cache(maxsize=64)
 def get_timezone(tz_name: Optional[str] = None) -> pytz.tzinfo.BaseTzInfo:
     """
     Get a timezone object from a timezone name.
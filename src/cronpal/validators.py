@@ -1,21 +1,62 @@
 """Validation functions for cron expressions."""
 
-from typing import Dict, List, Optional
+import functools
+import re
+from typing import Dict, List, Optional, Tuple
 
 from cronpal.constants import SPECIAL_STRINGS
 from cronpal.exceptions import InvalidCronExpression, ValidationError
 
+# Characters allowed in numeric fields, and in fields that accept names
+_NUMERIC_CHARS = frozenset("0123456789*-/,")
+_NAMED_CHARS = _NUMERIC_CHARS | frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+# Patterns matching any character outside the allowed set (uppercased input)
+_INVALID_NUMERIC_RE = re.compile(r"[^0-9*\-/,]")
+_INVALID_NAMED_RE = re.compile(r"[^0-9*\-/,A-Z]")
+
+# Fields that accept month or weekday names
+_NAMED_FIELDS = frozenset(["month", "day_of_week"])
+
+# Special strings split into their expanded fields. @reboot can't be
+# expanded, so it is kept as a single field.
+_SPECIAL_FIELDS = {
+    name: (name,) if name == "@reboot" else tuple(expanded.split())
+    for name, expanded in SPECIAL_STRINGS.items()
+}
+
 
 def validate_expression_format(expression: str) -> List[str]:
     """
     Validate the basic format of a cron expression.
 
+    Kept for backwards compatibility; shares the cached split used by
+    parse_and_validate() but skips the per-field character checks.
+
     Args:
         expression: The cron expression string to validate.
 
     Returns:
         List of field strings if valid.
 
+    Raises:
+        InvalidCronExpression: If the expression format is invalid.
+    """
+    # Copy so callers can't mutate the cached result
+    return list(_split_expression(expression))
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_expression(expression: str) -> Tuple[str, ...]:
+    """
+    Validate the format of an expression and split it into fields (cached).
+
+    Args:
+        expression: The cron expression string to validate.
+
+    Returns:
+        Tuple of field strings if valid.
+
     Raises:
         InvalidCronExpression: If the expression format is invalid.
     """
@@ -29,29 +70,31 @@ def validate_expression_format(expression: str) -> List[str]:
 
     # Check for special strings
     if expression.startswith("@"):
-        if expression in SPECIAL_STRINGS:
+        fields = _SPECIAL_FIELDS.get(expression)
+        if fields is not None:
             # Return the expanded expression
-            if expression == "@reboot":
-                # Special case - cannot be expanded
-                return [expression]
-            return SPECIAL_STRINGS[expression].split()
+            return fields
         else:
             available = ", ".join(sorted(SPECIAL_STRINGS.keys()))
             raise InvalidCronExpression(
                 f"Unknown special string: '{expression}'. Available: {available}"
             )
 
-    # Split the expression into fields
-    fields = expression.split()
+    # Split the expression into fields. Stop after the fifth field; anything
+    # left over shows up as whitespace inside it.
+    fields = expression.split(None, 4)
+    field_count = len(fields)
+    if field_count == 5 and len(fields[4].split(None, 1)) > 1:
+        field_count = 4 + len(fields[4].split())
 
     # Standard cron has 5 fields (minute hour day month weekday)
-    if len(fields) != 5:
+    if field_count != 5:
         raise InvalidCronExpression(
-            f"Invalid number of fields: expected 5, got {len(fields)}. "
+            f"Invalid number of fields: expected 5, got {field_count}. "
             f"Format should be: <minute> <hour> <day> <month> <weekday>"
         )
 
-    return fields
+    return tuple(fields)
 
 
 def validate_field_characters(field: str, field_name: str) -> None:
@@ -65,21 +108,24 @@ def validate_field_characters(field: str, field_name: str) -> None:
     Raises:
         ValidationError: If invalid characters are found.
     """
-    valid_chars = set("0123456789*-/,")
-
-    # For month and day of week, also allow letters
-    if field_name in ["month", "day_of_week"]:
-        valid_chars.update(set("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    if field_name in _NAMED_FIELDS:
+        # For month and day of week, also allow letters
+        pattern = _INVALID_NAMED_RE
+        valid_chars = _NAMED_CHARS
+    else:
+        pattern = _INVALID_NUMERIC_RE
+        valid_chars = _NUMERIC_CHARS
 
     field_upper = field.upper()
-    invalid_chars = set(field_upper) - valid_chars
+    if pattern.search(field_upper) is None:
+        return
 
-    if invalid_chars:
-        char_list = ", ".join(f"'{c}'" for c in sorted(invalid_chars))
-        raise ValidationError(
-            f"Invalid characters in {field_name} field: {char_list}. "
-            f"Field value was: '{field}'"
-        )
+    invalid_chars = set(field_upper) - valid_chars
+    char_list = ", ".join(f"'{c}'" for c in sorted(invalid_chars))
+    raise ValidationError(
+        f"Invalid characters in {field_name} field: {char_list}. "
+        f"Field value was: '{field}'"
+    )
 
 
 def get_field_info() -> Dict[str, Dict[str, any]]:
@@ -98,25 +144,44 @@ def get_field_info() -> Dict[str, Dict[str, any]]:
     }
 
 
-def validate_expression(expression: str) -> bool:
+def parse_and_validate(expression: str) -> List[str]:
     """
-    Perform basic validation of a cron expression.
+    Validate a cron expression and split it into fields in one pass.
 
     Args:
         expression: The cron expression to validate.
 
     Returns:
-        True if valid.
+        List of field strings if valid.
 
     Raises:
         InvalidCronExpression: If validation fails.
         ValidationError: If field validation fails.
     """
-    fields = validate_expression_format(expression)
+    # Copy so callers can't mutate the cached result
+    return list(_parse_and_validate(expression))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_and_validate(expression: str) -> Tuple[str, ...]:
+    """
+    Validate a cron expression and split it into fields (cached).
+
+    Args:
+        expression: The cron expression to validate.
+
+    Returns:
+        Tuple of field strings if valid.
+
+    Raises:
+        InvalidCronExpression: If validation fails.
+        ValidationError: If field validation fails.
+    """
+    fields = _split_expression(expression)
 
     if len(fields) == 1 and fields[0] == "@reboot":
         # Special case for @reboot
-        return True
+        return fields
 
     field_names = ["minute", "hour", "day_of_month", "month", "day_of_week"]
     field_info = get_field_info()
@@ -131,4 +196,24 @@ def validate_expression(expression: str) -> bool:
                 f"{e} (Position {info['position']}, Valid range: {info['range']})"
             )
 
-    return True
\ No newline at end of file
+    return fields
+
+
+def validate_expression(expression: str) -> bool:
+    """
+    Perform basic validation of a cron expression.
+
+    Kept for backwards compatibility; delegates to parse_and_validate().
+
+    Args:
+        expression: The cron expression to validate.
+
+    Returns:
+        True if valid.
+
+    Raises:
+        InvalidCronExpression: If validation fails.
+        ValidationError: If field validation fails.
+    """
+    _parse_and_validate(expression)
+    return True
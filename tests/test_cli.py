@@ -30,12 +30,48 @@ def test_cli_execution():
     assert "cronpal" in result.stdout.lower()
 
 
+def test_cli_execution_fast_exit():
+    """Test that CRONPAL_FAST_EXIT keeps the output and exit code."""
+    import os
+
+    env = dict(os.environ, CRONPAL_FAST_EXIT="1")
+    result = subprocess.run(
+        [sys.executable, "-m", "cronpal.cli", "invalid"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=Path(__file__).parent.parent / "src"
+    )
+    assert result.returncode == 1
+    assert "Invalid number of fields" in result.stderr
+
+
 def test_version_flag():
     """Test the --version flag."""
     result = main(["--version"])
     assert result == 0
 
 
+def test_version_flag_skips_heavy_imports():
+    """Test --version doesn't import the scheduler, parsers or pytz."""
+    code = (
+        "import sys\n"
+        "from cronpal.cli import main\n"
+        "main(['--version'])\n"
+        "heavy = ['cronpal.scheduler', 'cronpal.pretty_printer',\n"
+        "         'cronpal.field_parser', 'cronpal.timezone_utils', 'pytz']\n"
+        "print(sorted(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent / "src"
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip().endswith("[]")
+
+
 def test_version_flag_short():
     """Test the -v flag."""
     result = main(["-v"])
@@ -788,4 +824,55 @@ def test_complete_expression_validation():
     assert "Hour field: 9-17" in output
     assert "Day of month field: 1,15" in output
     assert "Month field: *" in output
-    assert "Day of week field: MON-FRI" in output
\ No newline at end of file
+    assert "Day of week field: MON-FRI" in output
+
+
+def test_parsers_are_shared_between_calls():
+    """Test that the CLI reuses one parser instance of each kind."""
+    from cronpal.cli import _get_field_parser, _get_special_parser
+
+    assert _get_special_parser() is _get_special_parser()
+    assert _get_field_parser() is _get_field_parser()
+
+
+def test_verbose_day_names_with_sunday_as_seven():
+    """Test that day 7 is shown as Sunday in verbose output."""
+    import io
+    import contextlib
+
+    f = io.StringIO()
+    with contextlib.redirect_stdout(f):
+        result = main(["0 0 * * 5-7", "--verbose", "--no-color"])
+
+    assert result == 0
+    assert "Days: Sun, Fri, Sat" in f.getvalue()
+
+
+@pytest.mark.parametrize("days,minutes,direction,expected", [
+    (0, 1, "future", "in 1 minute"),
+    (0, 45, "future", "in 45 minutes"),
+    (0, 60, "future", "in 1 hour"),
+    (0, 150, "past", "2 hours ago"),
+    (1, 0, "future", "tomorrow"),
+    (1, 30, "past", "yesterday"),
+    (3, 0, "past", "3 days ago"),
+    (7, 0, "future", ""),
+])
+def test_humanize_delta(days, minutes, direction, expected):
+    """Test relative time descriptions for run listings."""
+    from cronpal.cli import _humanize_delta
+
+    assert _humanize_delta(days, minutes, direction) == expected
+
+
+def test_colors_disabled_when_not_a_terminal():
+    """Test that output written to a pipe or file has no color codes."""
+    import io
+    import contextlib
+
+    f = io.StringIO()
+    with contextlib.redirect_stdout(f):
+        result = main(["0 0 * * *", "--verbose"])
+
+    assert result == 0
+    assert "\x1b[" not in f.getvalue()
@@ -0,0 +1,137 @@
+"""Tests for CLI batch mode (--file and --stdin)."""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cronpal.cli import main
+
+
+def run_main(args, stdin=None):
+    """Run main() and capture its exit code, stdout and stderr."""
+    out = io.StringIO()
+    err = io.StringIO()
+    old_stdin = sys.stdin
+    if stdin is not None:
+        sys.stdin = io.StringIO(stdin)
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            result = main(args)
+    finally:
+        sys.stdin = old_stdin
+    return result, out.getvalue(), err.getvalue()
+
+
+class TestCLIBatch:
+    """Tests for checking many expressions in one run."""
+
+    def test_file_all_valid(self, tmp_path):
+        """Test a file where every expression is valid."""
+        path = tmp_path / "expressions.txt"
+        path.write_text("0 0 * * *\n*/15 9-17 * * MON-FRI\n@daily\n")
+
+        result, output, errors = run_main(["--file", str(path), "--no-color"])
+
+        assert result == 0
+        assert "Valid cron expression: 0 0 * * *" in output
+        assert "Valid cron expression: */15 9-17 * * MON-FRI" in output
+        assert "Valid cron expression: @daily" in output
+        assert errors == ""
+
+    def test_file_skips_blank_and_comment_lines(self, tmp_path):
+        """Test blank lines and comments are ignored."""
+        path = tmp_path / "expressions.txt"
+        path.write_text("# nightly\n\n0 0 * * *\n")
+
+        result, output, errors = run_main(["-f", str(path), "--no-color"])
+
+        assert result == 0
+        assert output.count("Valid cron expression") == 1
+
+    def test_file_with_invalid_expression(self, tmp_path):
+        """Test invalid lines are reported with their line number."""
+        path = tmp_path / "expressions.txt"
+        path.write_text("0 0 * * *\n60 0 * * *\n0 0 * *\n")
+
+        result, output, errors = run_main(["--file", str(path), "--no-color"])
+
+        assert result == 1
+        assert "Valid cron expression: 0 0 * * *" in output
+        assert "Line 2: 60 0 * * *" in errors
+        assert "Line 3: 0 0 * *" in errors
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file is reported as an error."""
+        path = tmp_path / "missing.txt"
+
+        result, output, errors = run_main(["--file", str(path), "--no-color"])
+
+        assert result == 1
+        assert "Cannot read" in errors
+
+    def test_stdin(self):
+        """Test reading expressions from stdin."""
+        result, output, errors = run_main(
+            ["--stdin", "--no-color"], stdin="0 0 * * *\n@hourly\n"
+        )
+
+        assert result == 0
+        assert "Valid cron expression: 0 0 * * *" in output
+        assert "Valid cron expression: @hourly" in output
+
+    def test_stdin_repeated_expressions(self):
+        """Test repeated expressions are each reported."""
+        result, output, errors = run_main(
+            ["--stdin", "--no-color"], stdin="0 0 * * *\n" * 3
+        )
+
+        assert result == 0
+        assert output.count("Valid cron expression: 0 0 * * *") == 3
+
+    def test_repeated_expressions_parsed_once(self):
+        """Test that repeated expressions reuse the cached parse."""
+        from cronpal.cli import _parse_cached
+
+        _parse_cached.cache_clear()
+        result, output, errors = run_main(
+            ["--stdin", "--no-color"], stdin="0 * * * *\n0 * * * *\n0 * * * *\n"
+        )
+
+        assert result == 0
+        assert output.count("Valid cron expression: 0 * * * *") == 3
+        info = _parse_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            ["0 0 * * *"],
+            ["--next", "5"],
+            ["--next", "0"],
+            ["--previous", "3"],
+            ["--pretty"],
+            ["--verbose"],
+            ["--timezone", "UTC"],
+        ],
+    )
+    def test_single_expression_args_rejected(self, extra):
+        """Test that options for a single expression are a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            run_main(["--stdin", "--no-color"] + extra, stdin="0 0 * * *\n")
+
+        assert exc_info.value.code == 2
+
+    def test_single_expression_args_named_in_error(self, capsys):
+        """Test that the usage error names every conflicting option."""
+        with pytest.raises(SystemExit):
+            main(["--stdin", "--next", "5", "--pretty"])
+
+        errors = capsys.readouterr().err
+        assert "--next, --pretty cannot be used with --file or --stdin" in errors
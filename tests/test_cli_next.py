@@ -297,4 +297,22 @@ class TestCLINextRuns:
 
         # Check date format (YYYY-MM-DD HH:MM:SS Weekday)
         assert "2" in output  # Year starts with 2
-        assert ":" in output  # Time separator
\ No newline at end of file
+        assert ":" in output  # Time separator
+
+    def test_next_runs_written_in_one_call(self):
+        """Test the run listing reaches stdout in a single write."""
+        import io
+        import contextlib
+
+        from cronpal.cli import _print_next_runs
+        from cronpal.color_utils import ColorConfig
+        from cronpal.field_parser import FieldParser
+
+        cron_expr = FieldParser().parse_all("*/5 * * * *")
+        f = io.StringIO()
+        with patch.object(f, "write", wraps=f.write) as write:
+            with contextlib.redirect_stdout(f):
+                _print_next_runs(cron_expr, 50, ColorConfig(use_colors=False))
+
+        assert write.call_count == 1
+        assert f.getvalue().count("\n") == 52
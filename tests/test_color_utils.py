@@ -12,6 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from cronpal.color_utils import (
     ColorConfig,
     ColorScheme,
+    Fore,
+    Style,
     format_cron_field,
     format_error_message,
     format_schedule_time,
@@ -20,6 +22,7 @@ from cronpal.color_utils import (
     get_color_config,
     reset_color_config,
     set_color_config,
+    _supports_unicode,
 )
 
 
@@ -49,6 +52,30 @@ class TestColorConfig:
         config = ColorConfig()
         assert config.use_colors is False
 
+    def test_force_color_env_variable(self, monkeypatch):
+        """Test FORCE_COLOR enables colors without a terminal."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.setenv("FORCE_COLOR", "1")
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+        config = ColorConfig()
+        assert config.use_colors is True
+
+    def test_clicolor_force_zero_ignored(self, monkeypatch):
+        """Test CLICOLOR_FORCE=0 does not force colors."""
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.delenv("FORCE_COLOR", raising=False)
+        monkeypatch.setenv("CLICOLOR_FORCE", "0")
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+        config = ColorConfig()
+        assert config.use_colors is False
+
+    def test_no_color_beats_force_color(self, monkeypatch):
+        """Test NO_COLOR takes precedence over FORCE_COLOR."""
+        monkeypatch.setenv("NO_COLOR", "1")
+        monkeypatch.setenv("FORCE_COLOR", "1")
+        config = ColorConfig()
+        assert config.use_colors is False
+
     def test_get_color_with_colors_disabled(self):
         """Test getting color when colors are disabled."""
         config = ColorConfig(use_colors=False)
@@ -60,6 +87,79 @@ class TestColorConfig:
         config = ColorConfig(use_colors=False)
         result = config.colorize("test", ColorScheme.SUCCESS)
         assert result == "test"
+        assert config.colorize("test", scheme=ColorScheme.ERROR) == "test"
+
+    def test_methods_are_identity_with_colors_disabled(self):
+        """Test format methods return text as is when colors are disabled."""
+        config = ColorConfig(use_colors=False)
+        for scheme in ColorScheme:
+            assert getattr(config, scheme.value)("text") == "text"
+
+    def test_get_codes_with_colors_disabled(self):
+        """Test style codes are empty when colors are disabled."""
+        config = ColorConfig(use_colors=False)
+        assert config.get_codes(ColorScheme.SUCCESS) == ("", "")
+
+    def test_get_codes_match_colorize(self):
+        """Test style codes wrap text the same way colorize does."""
+        config = ColorConfig(use_colors=True)
+        start, end = config.get_codes(ColorScheme.HEADER)
+        expected = config.colorize("text", ColorScheme.HEADER)
+        assert f"{start}text{end}" == expected
+
+    def test_methods_match_colorize_with_colors(self):
+        """Test each format method wraps text like colorize does."""
+        config = ColorConfig(use_colors=True)
+        for scheme in ColorScheme:
+            method = getattr(config, scheme.value)
+            assert method("text") == config.colorize("text", scheme)
+
+    def test_disabling_colors_after_init(self):
+        """Test setting use_colors to False turns off the format methods."""
+        config = ColorConfig(use_colors=True)
+        config.use_colors = False
+        for scheme in ColorScheme:
+            assert getattr(config, scheme.value)("text") == "text"
+            assert config.colorize("text", scheme) == "text"
+        assert config.get_codes(ColorScheme.ERROR) == ("", "")
+
+    def test_format_methods_not_replaced_on_instance(self):
+        """Test toggling colors keeps the class's format methods."""
+        config = ColorConfig(use_colors=False)
+        config.use_colors = True
+        config.use_colors = False
+        for name in [scheme.value for scheme in ColorScheme] + ["colorize"]:
+            assert name not in vars(config)
+
+    def test_enabling_colors_after_init(self):
+        """Test setting use_colors to True turns on the format methods."""
+        config = ColorConfig(use_colors=False)
+        config.use_colors = True
+        for scheme in ColorScheme:
+            expected = config.get_color(scheme) + "text" + Style.RESET_ALL
+            assert getattr(config, scheme.value)("text") == expected
+            assert config.colorize("text", scheme) == expected
+
+    def test_replacing_colors_after_init(self):
+        """Test assigning colors changes what the format methods use."""
+        config = ColorConfig(use_colors=True)
+        config.colors = {**config.colors, ColorScheme.SUCCESS: Fore.BLUE}
+        assert config.success("text") == config.colorize("text", ColorScheme.SUCCESS)
+        assert config.success("text").startswith(Fore.BLUE)
+
+    def test_colors_is_read_only(self):
+        """Test colors can't be changed in place behind the format methods."""
+        config = ColorConfig(use_colors=True)
+        with pytest.raises(TypeError):
+            config.colors[ColorScheme.INFO] = Fore.RED
+        assert config.info("text").startswith(Fore.CYAN)
+
+    def test_empty_color_leaves_text_unchanged(self):
+        """Test a scheme without a color doesn't wrap text in a reset."""
+        config = ColorConfig(use_colors=True)
+        config.colors = {**config.colors, ColorScheme.INFO: ""}
+        assert config.info("text") == "text"
+        assert config.colorize("text", ColorScheme.INFO) == "text"
 
     def test_success_method(self):
         """Test success formatting method."""
@@ -155,6 +255,14 @@ class TestGlobalColorConfig:
         new_config = get_color_config()
         assert new_config is not custom
 
+    def test_reset_color_config_recreates_default(self):
+        """Test resetting re-detects the default config."""
+        default = get_color_config()
+
+        reset_color_config()
+
+        assert get_color_config() is not default
+
 
 class TestFormatFunctions:
     """Tests for formatting utility functions."""
@@ -167,6 +275,17 @@ class TestFormatFunctions:
         result = format_cron_field("Minute", "*/15")
         assert "Minute: */15" in result
 
+    def test_format_with_explicit_config(self):
+        """Test an explicit config is used instead of the global one."""
+        set_color_config(ColorConfig(use_colors=True))
+        plain = ColorConfig(use_colors=False)
+
+        try:
+            assert format_cron_field("Minute", "0", config=plain) == "Minute: 0"
+            assert format_table_border("-", 3, config=plain) == "---"
+        finally:
+            reset_color_config()
+
     def test_format_cron_field_with_description(self):
         """Test cron field formatting with description."""
         reset_color_config()
@@ -236,6 +355,32 @@ class TestFormatFunctions:
         assert result == "2024-01-15 10:00:00"
 
 
+class TestSupportsUnicode:
+    """Tests for the status symbol encoding check."""
+
+    class _Stream:
+        def __init__(self, encoding):
+            self.encoding = encoding
+
+    def test_utf8_stream(self):
+        """Test UTF-8 streams support the symbols."""
+        assert _supports_unicode(self._Stream("UTF-8")) is True
+        assert _supports_unicode(self._Stream("utf8")) is True
+
+    def test_ascii_stream(self):
+        """Test ASCII streams fall back to plain text."""
+        assert _supports_unicode(self._Stream("ascii")) is False
+        assert _supports_unicode(self._Stream("ANSI_X3.4-1968")) is False
+
+    def test_stream_without_encoding(self):
+        """Test in-memory streams keep the symbols."""
+        assert _supports_unicode(self._Stream(None)) is True
+
+    def test_unknown_encoding(self):
+        """Test unknown encodings fall back to plain text."""
+        assert _supports_unicode(self._Stream("no-such-codec")) is False
+
+
 class TestColorSchemeEnum:
     """Tests for ColorScheme enum."""
 
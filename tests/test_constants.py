@@ -75,4 +75,10 @@ def test_yearly_and_annually_are_same():
 
 def test_daily_and_midnight_are_same():
     """Test that @daily and @midnight have the same value."""
-    assert SPECIAL_STRINGS["@daily"] == SPECIAL_STRINGS["@midnight"]
\ No newline at end of file
+    assert SPECIAL_STRINGS["@daily"] == SPECIAL_STRINGS["@midnight"]
+
+
+def test_special_strings_read_only():
+    """Test that the special strings table can't be modified."""
+    with pytest.raises(TypeError):
+        SPECIAL_STRINGS["@often"] = "* * * * *"
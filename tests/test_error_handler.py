@@ -87,6 +87,17 @@ class TestErrorHandler:
         assert "✗ Error" in message
         assert "Generic error" in message
 
+    def test_handle_error_subclass(self):
+        """Test subclasses use the handler of their base class."""
+
+        class CustomFieldError(FieldError):
+            pass
+
+        handler = ErrorHandler()
+        message = handler.handle_error(CustomFieldError("minute", "bad value"))
+
+        assert "Field error in minute" in message
+
     def test_handle_unexpected_error(self):
         """Test handling unexpected errors."""
         handler = ErrorHandler(verbose=True)
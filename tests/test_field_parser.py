@@ -8,9 +8,9 @@ import pytest
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from cronpal.exceptions import FieldError, ParseError
+from cronpal.exceptions import FieldError, InvalidCronExpression, ParseError
 from cronpal.field_parser import FieldParser
-from cronpal.models import FieldType
+from cronpal.models import FieldType, iter_mask, values_to_mask
 
 
 class TestParseMinute:
@@ -75,6 +75,13 @@ class TestParseMinute:
         with pytest.raises(FieldError, match="minute.*out of range"):
             self.parser.parse_minute("-1")
 
+    def test_parse_minute_out_of_range_message(self):
+        """Test the out of range message names the field and its range."""
+        with pytest.raises(FieldError) as exc_info:
+            self.parser.parse_minute("60")
+        assert str(exc_info.value) == "minute: minute value 60 out of range [0-59]"
+        assert exc_info.value.field_name == "minute"
+
     def test_parse_minute_invalid_range(self):
         """Test parsing invalid minute range."""
         with pytest.raises(FieldError, match="start.*>.*end"):
@@ -378,24 +385,31 @@ class TestFieldParserInternals:
         assert result == 59
 
     def test_parse_range_valid(self):
-        """Test _parse_range with valid range."""
-        result = self.parser._parse_range("10-20", self.minute_range, "minute")
-        assert result == set(range(10, 21))
+        """Test _parse_range_bounds with valid range."""
+        result = self.parser._parse_range_bounds("10-20", self.minute_range, "minute")
+        assert result == (10, 20)
 
     def test_parse_range_single_span(self):
-        """Test _parse_range with single value span."""
-        result = self.parser._parse_range("15-15", self.minute_range, "minute")
-        assert result == {15}
+        """Test _parse_range_bounds with single value span."""
+        result = self.parser._parse_range_bounds("15-15", self.minute_range, "minute")
+        assert result == (15, 15)
 
     def test_parse_step_every_n(self):
-        """Test _parse_step with every N pattern."""
-        result = self.parser._parse_step("*/10", self.minute_range, "minute")
-        assert result == {0, 10, 20, 30, 40, 50}
+        """Test _parse_step_mask with every N pattern."""
+        result = self.parser._parse_step_mask("*/10", self.minute_range, "minute")
+        assert result == values_to_mask({0, 10, 20, 30, 40, 50})
 
     def test_parse_step_range_with_step(self):
-        """Test _parse_step with range and step."""
-        result = self.parser._parse_step("5-25/5", self.minute_range, "minute")
-        assert result == {5, 10, 15, 20, 25}
+        """Test _parse_step_mask with range and step."""
+        result = self.parser._parse_step_mask("5-25/5", self.minute_range, "minute")
+        assert result == values_to_mask({5, 10, 15, 20, 25})
+
+    def test_parse_step_invalid_range(self):
+        """Test _parse_step_mask validates the bounds of a stepped range."""
+        with pytest.raises(ParseError, match=r"start \(30\) > end \(10\)"):
+            self.parser._parse_step_mask("30-10/5", self.minute_range, "minute")
+        with pytest.raises(ParseError, match="out of range"):
+            self.parser._parse_step_mask("0-60/5", self.minute_range, "minute")
 
     def test_parse_field_empty_string(self):
         """Test _parse_field with empty string."""
@@ -405,22 +419,40 @@ class TestFieldParserInternals:
     def test_parse_field_wildcard_only(self):
         """Test _parse_field with wildcard."""
         result = self.parser._parse_field("*", self.minute_range, "minute")
-        assert result == set(range(0, 60))
-        assert len(result) == 60
+        values = list(iter_mask(result))
+        assert values == list(range(0, 60))
+        assert len(values) == 60
+
+    def test_parse_field_single_number(self):
+        """Test _parse_field with a lone number."""
+        assert self.parser._parse_field("59", self.minute_range, "minute") == 1 << 59
+        with pytest.raises(ParseError, match="out of range"):
+            self.parser._parse_field("60", self.minute_range, "minute")
+
+    def test_parse_field_list_of_forms(self):
+        """Test _parse_field with each part form in one list."""
+        result = self.parser._parse_field(
+            "5,10-12,*/20,30-40/5,55/2", self.minute_range, "minute"
+        )
+        assert list(iter_mask(result)) == [
+            0, 5, 10, 11, 12, 20, 30, 35, 40, 55, 57, 59
+        ]
 
     def test_hour_range_boundaries(self):
         """Test hour range boundaries."""
         result = self.parser._parse_field("*", self.hour_range, "hour")
-        assert min(result) == 0
-        assert max(result) == 23
-        assert len(result) == 24
+        values = list(iter_mask(result))
+        assert min(values) == 0
+        assert max(values) == 23
+        assert len(values) == 24
 
     def test_day_range_boundaries(self):
         """Test day of month range boundaries."""
         result = self.parser._parse_field("*", self.day_range, "day")
-        assert min(result) == 1
-        assert max(result) == 31
-        assert len(result) == 31
+        values = list(iter_mask(result))
+        assert min(values) == 1
+        assert max(values) == 31
+        assert len(values) == 31
 
 
 class TestParseMonth:
@@ -711,4 +743,118 @@ class TestParseDayOfWeek:
     def test_parse_day_of_week_list_with_seven(self):
         """Test list with 7 (Sunday)."""
         field = self.parser.parse_day_of_week("1,3,5,7")
-        assert field.parsed_values == {0, 1, 3, 5}
\ No newline at end of file
+        assert field.parsed_values == {0, 1, 3, 5}
+
+
+class TestParseByType:
+    """Tests for parsing a field by its type."""
+
+    def test_parse_matches_named_methods(self):
+        """Test parse gives the same field as the parse_* methods."""
+        parser = FieldParser()
+        assert parser.parse(FieldType.MINUTE, "*/15") == parser.parse_minute("*/15")
+        assert parser.parse(FieldType.DAY_OF_WEEK, "SUN") == parser.parse_day_of_week("SUN")
+
+    def test_parse_invalid_value(self):
+        """Test parse raises FieldError naming the field."""
+        parser = FieldParser()
+        with pytest.raises(FieldError, match="day of month"):
+            parser.parse(FieldType.DAY_OF_MONTH, "32")
+
+
+class TestParseCache:
+    """Tests for caching parsed fields."""
+
+    def test_repeated_field_uses_cache(self):
+        """Test a repeated named field is parsed once."""
+        from cronpal.field_parser import _parse_typed_field
+
+        parser = FieldParser()
+        _parse_typed_field.cache_clear()
+
+        first = parser.parse_day_of_week("MON-FRI")
+        second = parser.parse_day_of_week("MON-FRI")
+
+        assert first is not second
+        assert first.parsed_values == second.parsed_values == {1, 2, 3, 4, 5}
+        assert _parse_typed_field.cache_info().hits == 1
+
+    def test_cache_is_shared_across_parsers(self):
+        """Test the cache is keyed on field type and value, not the parser."""
+        from cronpal.field_parser import _parse_typed_field
+
+        _parse_typed_field.cache_clear()
+
+        FieldParser().parse_minute("*/5")
+        FieldParser().parse(FieldType.MINUTE, "*/5")
+        FieldParser().parse_hour("*/5")
+
+        info = _parse_typed_field.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+
+    def test_wildcard_uses_precomputed_mask(self):
+        """Test a wildcard field matches the field type's full mask."""
+        from cronpal.field_parser import _parse_typed_field
+        from cronpal.models import WILDCARD_MASKS
+
+        for field_type in FieldType:
+            expected = WILDCARD_MASKS[field_type]
+            if field_type is FieldType.DAY_OF_WEEK:
+                # Sunday is only kept as 0
+                expected &= ~(1 << 7)
+            assert _parse_typed_field(field_type, "*") == expected
+
+
+class TestIsNegativeNumber:
+    """Tests for detecting negative numbers."""
+
+    def test_negative_numbers(self):
+        """Test signed digit strings are negative numbers."""
+        parser = FieldParser()
+        assert parser._is_negative_number("-1")
+        assert parser._is_negative_number("-30")
+
+    def test_not_negative_numbers(self):
+        """Test ranges and other strings are not negative numbers."""
+        parser = FieldParser()
+        assert not parser._is_negative_number("-")
+        assert not parser._is_negative_number("1-5")
+        assert not parser._is_negative_number("-1-5")
+        assert not parser._is_negative_number("-a")
+        assert not parser._is_negative_number("5")
+
+
+class TestParseAll:
+    """Tests for parsing a complete expression."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = FieldParser()
+
+    def test_parse_all_fields(self):
+        """Test that every field is parsed."""
+        cron_expr = self.parser.parse_all("*/15 9-17 1,15 JAN MON-FRI")
+        assert cron_expr.raw_expression == "*/15 9-17 1,15 JAN MON-FRI"
+        assert cron_expr.minute.parsed_values == {0, 15, 30, 45}
+        assert cron_expr.hour.parsed_values == set(range(9, 18))
+        assert cron_expr.day_of_month.parsed_values == {1, 15}
+        assert cron_expr.month.parsed_values == {1}
+        assert cron_expr.day_of_week.parsed_values == {1, 2, 3, 4, 5}
+        assert cron_expr.is_valid()
+
+    def test_parse_all_wrong_field_count(self):
+        """Test that a wrong number of fields is rejected."""
+        with pytest.raises(InvalidCronExpression, match="expected 5, got 3"):
+            self.parser.parse_all("1 2 3")
+
+    def test_parse_all_invalid_field(self):
+        """Test that an out of range value is rejected."""
+        with pytest.raises(FieldError):
+            self.parser.parse_all("60 * * * *")
+
+    def test_parse_all_reboot(self):
+        """Test that @reboot has no time fields."""
+        cron_expr = self.parser.parse_all("@reboot")
+        assert cron_expr.minute is None
+        assert not cron_expr.is_valid()
@@ -1,5 +1,7 @@
 """Tests for the cron expression models."""
 
+import copy
+import pickle
 import sys
 from pathlib import Path
 
@@ -14,6 +16,14 @@ from cronpal.models import (
     FieldRange,
     FieldType,
     FIELD_RANGES,
+    PatternKind,
+    WILDCARD_MASKS,
+    iter_mask,
+    next_set_bit,
+    prev_set_bit,
+    range_mask,
+    step_mask,
+    values_to_mask,
 )
 
 
@@ -34,6 +44,17 @@ def test_field_range_creation():
     assert range_obj.field_type == FieldType.MINUTE
 
 
+def test_field_range_is_immutable():
+    """Test FieldRange can't be changed and copies share the instance."""
+    range_obj = FieldRange(0, 59, FieldType.MINUTE)
+    with pytest.raises(AttributeError):
+        range_obj.min_value = 1
+
+    assert copy.deepcopy(range_obj) is range_obj
+    assert pickle.loads(pickle.dumps(range_obj)) == range_obj
+    assert hash(range_obj) == hash(FieldRange(0, 59, FieldType.MINUTE))
+
+
 def test_cron_field_creation():
     """Test CronField creation."""
     field_range = FieldRange(0, 59, FieldType.MINUTE)
@@ -91,6 +112,150 @@ def test_cron_field_matches():
     assert field.matches(45) is True
     assert field.matches(5) is False
     assert field.matches(60) is False
+    assert field.matches(-1) is False
+
+
+def test_cron_field_mask():
+    """Test CronField stores parsed values as a bitmask."""
+    field_range = FieldRange(0, 59, FieldType.MINUTE)
+    field = CronField("0,15,30,45", FieldType.MINUTE, field_range)
+    assert field.mask is None
+
+    field.parsed_values = {0, 15, 30, 45}
+    assert field.mask == (1 << 0) | (1 << 15) | (1 << 30) | (1 << 45)
+
+    field.mask = 0b110
+    assert field.parsed_values == {1, 2}
+
+    field = CronField("1,2", FieldType.MINUTE, field_range, mask=0b110)
+    assert field.parsed_values == {1, 2}
+
+
+def test_cron_field_match_count():
+    """Test match_count counts the set bits and follows the mask."""
+    field_range = FieldRange(0, 59, FieldType.MINUTE)
+    field = CronField("*/15", FieldType.MINUTE, field_range)
+    assert field.match_count is None
+
+    field.parsed_values = {0, 15, 30, 45}
+    assert field.match_count == 4
+
+    field.mask = 1 << 7
+    assert field.match_count == 1
+
+
+def test_cron_field_sorted_values():
+    """Test sorted_values is ascending and follows the mask."""
+    field_range = FieldRange(0, 59, FieldType.MINUTE)
+    field = CronField("45,0,30", FieldType.MINUTE, field_range)
+    assert field.sorted_values is None
+
+    field.parsed_values = {45, 0, 30}
+    assert field.sorted_values == (0, 30, 45)
+
+    field.mask = 1 << 7
+    assert field.sorted_values == (7,)
+
+
+@pytest.mark.parametrize("raw_value,values,pattern", [
+    ("*", range(60), (PatternKind.WILDCARD, ())),
+    ("*/15", [0, 15, 30, 45], (PatternKind.STEP, (15,))),
+    ("5-50/20", [5, 25, 45], (PatternKind.STEP_FROM, (20, 5))),
+    ("10/60", [10], (PatternKind.STEP_FROM, (1, 10))),
+    ("9-17", range(9, 18), (PatternKind.RANGE, (9, 17))),
+    ("5-5", [5], (PatternKind.SINGLE, (5,))),
+    ("30", [30], (PatternKind.SINGLE, (30,))),
+    ("1-3,7", [1, 2, 3, 7], (PatternKind.LIST, ())),
+    ("1,2,3", [1, 2, 3], (PatternKind.LIST, ())),
+])
+def test_cron_field_pattern(raw_value, values, pattern):
+    """Test classifying a field's pattern."""
+    field_range = FieldRange(0, 59, FieldType.MINUTE)
+    field = CronField(raw_value, FieldType.MINUTE, field_range, values)
+    assert field.pattern == pattern
+
+
+def test_cron_field_pattern_follows_changes():
+    """Test the cached pattern is redone when the field changes."""
+    field_range = FieldRange(0, 59, FieldType.MINUTE)
+    field = CronField("5", FieldType.MINUTE, field_range)
+    assert field.pattern is None
+
+    field.parsed_values = {5}
+    assert field.pattern == (PatternKind.SINGLE, (5,))
+
+    field.raw_value = "5-6"
+    field.parsed_values = {5, 6}
+    assert field.pattern == (PatternKind.RANGE, (5, 6))
+
+
+def test_values_to_mask():
+    """Test converting values to a bitmask."""
+    assert values_to_mask([]) == 0
+    assert values_to_mask([0]) == 1
+    assert values_to_mask({1, 3, 5}) == 0b101010
+
+
+def test_range_mask():
+    """Test building a bitmask for an inclusive range."""
+    assert range_mask(0, 59) == values_to_mask(range(60))
+    assert range_mask(1, 12) == values_to_mask(range(1, 13))
+    assert range_mask(5, 5) == 1 << 5
+    assert range_mask(6, 5) == 0
+
+
+def test_step_mask_matches_loop():
+    """Test the closed-form step mask against stepping value by value."""
+    for start in range(0, 8):
+        for end in range(start, 60, 7):
+            for step in range(1, 62, 3):
+                expected = values_to_mask(range(start, end + 1, step))
+                assert step_mask(start, end, step) == expected
+
+
+def test_wildcard_masks():
+    """Test each wildcard mask covers its field's full range."""
+    for field_type, field_range in FIELD_RANGES.items():
+        expected = values_to_mask(
+            range(field_range.min_value, field_range.max_value + 1)
+        )
+        assert WILDCARD_MASKS[field_type] == expected
+
+
+def test_step_mask():
+    """Test building a bitmask for a stepped range."""
+    assert step_mask(0, 59, 15) == values_to_mask({0, 15, 30, 45})
+    assert step_mask(1, 31, 10) == values_to_mask({1, 11, 21, 31})
+    assert step_mask(5, 30, 100) == 1 << 5
+    assert step_mask(0, 59, 1) == range_mask(0, 59)
+    assert step_mask(10, 5, 2) == 0
+
+
+def test_iter_mask():
+    """Test iterating a bitmask yields sorted values."""
+    assert list(iter_mask(0)) == []
+    assert list(iter_mask(0b101010)) == [1, 3, 5]
+    assert list(iter_mask(values_to_mask({59, 0, 30}))) == [0, 30, 59]
+
+
+def test_next_set_bit():
+    """Test finding the next value set in a bitmask."""
+    mask = values_to_mask({5, 20, 40})
+    assert next_set_bit(mask, 0) == 5
+    assert next_set_bit(mask, 5) == 5
+    assert next_set_bit(mask, 6) == 20
+    assert next_set_bit(mask, 41) is None
+    assert next_set_bit(0, 0) is None
+
+
+def test_prev_set_bit():
+    """Test finding the previous value set in a bitmask."""
+    mask = values_to_mask({5, 20, 40})
+    assert prev_set_bit(mask, 59) == 40
+    assert prev_set_bit(mask, 40) == 40
+    assert prev_set_bit(mask, 39) == 20
+    assert prev_set_bit(mask, 4) is None
+    assert prev_set_bit(mask, -1) is None
 
 
 def test_cron_expression_creation():
@@ -120,6 +285,26 @@ def test_cron_expression_with_fields():
     assert expr.day_of_month is None
 
 
+def test_cron_models_use_slots():
+    """Test CronField and CronExpression don't carry an instance __dict__."""
+    field = CronField("0", FieldType.MINUTE, FIELD_RANGES[FieldType.MINUTE])
+    expr = CronExpression("0 0 * * *", minute=field)
+
+    assert not hasattr(field, "__dict__")
+    assert not hasattr(expr, "__dict__")
+    with pytest.raises(AttributeError):
+        expr.unknown = 1
+
+
+def test_cron_expression_equality():
+    """Test CronExpression compares by value."""
+    field = CronField("0", FieldType.MINUTE, FIELD_RANGES[FieldType.MINUTE])
+    other = CronField("0", FieldType.MINUTE, FIELD_RANGES[FieldType.MINUTE])
+
+    assert CronExpression("0 0 * * *", minute=field) == CronExpression("0 0 * * *", minute=other)
+    assert CronExpression("0 0 * * *") != CronExpression("0 1 * * *")
+
+
 def test_cron_expression_is_valid_incomplete():
     """Test is_valid() with incomplete expression."""
     expr = CronExpression("0 0 * * *")
@@ -138,6 +323,10 @@ def test_cron_expression_is_valid_complete():
     )
     assert expr.is_valid() is True
 
+    # Every field is checked, not just the first
+    expr.day_of_week = None
+    assert expr.is_valid() is False
+
 
 def test_cron_expression_str():
     """Test CronExpression string representation."""
@@ -145,6 +334,14 @@ def test_cron_expression_str():
     assert str(expr) == "*/15 0 1,15 * *"
 
 
+def test_cron_expression_str_is_raw_expression():
+    """Test str() hands back the stored expression without rebuilding it."""
+    raw = "*/15 0 1,15 * *"
+    expr = CronExpression(raw)
+    expr.minute = CronField("*/15", FieldType.MINUTE, FIELD_RANGES[FieldType.MINUTE])
+    assert str(expr) is raw
+
+
 def test_cron_expression_matches_time():
     """Test CronExpression matches_time method."""
     expr = CronExpression("0,15,30,45 * * * *")
@@ -165,6 +362,21 @@ def test_cron_expression_matches_time():
     assert expr.matches_time(59) is False
 
 
+def test_cron_expression_matches_time_all_fields():
+    """Test matches_time checks each given field that is set."""
+    expr = CronExpression("30 9 1 6 *")
+    expr.minute = CronField("30", FieldType.MINUTE, FIELD_RANGES[FieldType.MINUTE], {30})
+    expr.hour = CronField("9", FieldType.HOUR, FIELD_RANGES[FieldType.HOUR], {9})
+    expr.day_of_month = CronField("1", FieldType.DAY_OF_MONTH, FIELD_RANGES[FieldType.DAY_OF_MONTH], {1})
+
+    assert expr.matches_time(30, 9, 1, 6) is True
+    assert expr.matches_time(30, 10, 1) is False
+    assert expr.matches_time(30, 9, 2) is False
+    # No month field is set, so any month matches
+    assert expr.matches_time(30, 9, 1, 12) is True
+    assert expr.matches_time(31, 9) is False
+
+
 def test_field_ranges_constants():
     """Test FIELD_RANGES constant values."""
     assert FIELD_RANGES[FieldType.MINUTE].min_value == 0
@@ -1,5 +1,6 @@
 """Tests for the argument parser module."""
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -8,7 +9,7 @@ import pytest
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from cronpal.parser import create_parser
+from cronpal.parser import create_parser, parse_simple_args
 
 
 def test_create_parser():
@@ -87,4 +88,103 @@ def test_help_text():
     assert "cronpal" in help_text
     assert "Parse and analyze cron expressions" in help_text
     assert "Examples:" in help_text
-    assert "Cron Expression Format:" in help_text
\ No newline at end of file
+    assert "Cron Expression Format:" in help_text
+
+
+def test_parse_equals_form_falls_back():
+    """Test --option=value is handled by the full parser."""
+    parser = create_parser()
+    args = parser.parse_args(["0 0 * * *", "--next=4"])
+    assert args.next == 4
+    assert args.expression == "0 0 * * *"
+
+
+def test_parse_invalid_int_exits():
+    """Test invalid option values still raise argparse errors."""
+    parser = create_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(["0 0 * * *", "--next", "abc"])
+
+
+def test_parse_unknown_option_exits():
+    """Test unknown options still raise argparse errors."""
+    parser = create_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(["0 0 * * *", "--bogus"])
+
+
+def test_parse_help_exits():
+    """Test --help prints help and exits."""
+    parser = create_parser()
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["--help"])
+    assert exc_info.value.code == 0
+
+
+def test_parse_batch_flags():
+    """Test parsing --file and --stdin."""
+    parser = create_parser()
+    args = parser.parse_args(["--file", "crontab.txt"])
+    assert args.file == "crontab.txt"
+    assert args.stdin is False
+
+    args = parser.parse_args(["--stdin"])
+    assert args.stdin is True
+    assert args.file is None
+
+
+def test_parse_simple_args():
+    """Test plain command lines are parsed without argparse."""
+    args = parse_simple_args(["0 0 * * *", "-n", "3", "--pretty"])
+    assert args.expression == "0 0 * * *"
+    assert args.next == 3
+    assert args.pretty is True
+    assert args.version is False
+
+
+def test_parse_simple_args_needs_full_parser():
+    """Test help and unusual forms are left to the full parser."""
+    assert parse_simple_args(["--help"]) is None
+    assert parse_simple_args(["--next=3"]) is None
+    assert parse_simple_args(["0 0 * * *", "extra"]) is None
+
+
+def test_argparse_spec_is_shared():
+    """Test argparse parsers are built from one shared spec."""
+    from cronpal.parser import _argparse_spec
+
+    first = create_parser()
+    second = create_parser()
+    assert first.format_help() == second.format_help()
+    assert first._get_argparse_parser() is not second._get_argparse_parser()
+    assert _argparse_spec.cache_info().currsize == 1
+
+
+def test_added_arguments_stay_on_their_parser():
+    """Test adding an argument applies to that parser only."""
+    parser = create_parser()
+    parser.add_argument("--extra", action="store_true")
+    parser.set_defaults(pretty=True)
+
+    args = parser.parse_args(["0 0 * * *", "--extra"])
+    assert args.extra is True
+    assert parser.parse_args(["0 0 * * *"]).pretty is True
+    assert "--extra" not in create_parser().format_help()
+
+
+def test_plain_args_skip_argparse_imports():
+    """Test parsing plain arguments doesn't import argparse or textwrap."""
+    code = (
+        "import sys\n"
+        "from cronpal.parser import create_parser\n"
+        "create_parser().parse_args(['0 0 * * *', '-n', '3'])\n"
+        "print(sorted(m for m in ['argparse', 'textwrap'] if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent / "src"
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "[]"
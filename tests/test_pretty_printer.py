@@ -91,6 +91,15 @@ class TestPrettyPrinterTable:
         assert "MON" in result
         assert "Monday" in result
 
+    def test_print_table_truncates_long_description(self):
+        """Test long descriptions are cut to fit the table."""
+        expr = create_cron_expression("0 0 * FEB,SEP,OCT,NOV,DEC *")
+        printer = PrettyPrinter(expr, use_colors=False)
+
+        result = printer.print_table()
+
+        assert "February, September, October, November,... │" in result
+
 
 class TestPrettyPrinterSimple:
     """Tests for simple printing functionality."""
@@ -288,9 +297,108 @@ class TestPrettyPrinterSummary:
         assert "days 1, 15" in result
 
 
+class TestPrettyPrinterInstances:
+    """Tests for PrettyPrinter instances."""
+
+    def test_uses_slots(self):
+        """Test printers don't carry an instance __dict__."""
+        printer = PrettyPrinter(create_cron_expression("0 0 * * *"))
+
+        assert not hasattr(printer, "__dict__")
+        with pytest.raises(AttributeError):
+            printer.unknown = 1
+
+
+class TestPrettyPrinterCache:
+    """Tests for caching rendered output."""
+
+    def test_equal_expressions_share_output(self):
+        """Test printers for equal expressions reuse the rendered output."""
+        first = PrettyPrinter(create_cron_expression("0 9 * * MON"), use_colors=False)
+        second = PrettyPrinter(create_cron_expression("0 9 * * MON"), use_colors=False)
+
+        assert first.print_table() is second.print_table()
+        assert first.get_summary() == "Runs every Monday at 09:00"
+
+    def test_changed_field_is_rendered_again(self):
+        """Test changing a field doesn't return stale output."""
+        expr = create_cron_expression("0 9 * * *")
+        printer = PrettyPrinter(expr, use_colors=False)
+        assert printer.get_summary() == "Runs daily at 09:00"
+
+        expr.hour = FieldParser().parse_hour("10")
+        assert printer.get_summary() == "Runs daily at 10:00"
+
+    def test_changed_colors_are_rendered_again(self):
+        """Test customizing colors after a render doesn't return stale output."""
+        from cronpal.color_utils import ColorScheme, Fore
+
+        printer = PrettyPrinter(create_cron_expression("0 9 * * *"))
+        assert printer.print_simple().startswith(Fore.BLUE)
+
+        printer.color_config.colors = {
+            **printer.color_config.colors, ColorScheme.HEADER: Fore.RED
+        }
+        assert printer.print_simple().startswith(Fore.RED)
+
+    def test_global_color_config_is_rendered_again(self):
+        """Test a config set with set_color_config doesn't get stale output."""
+        from cronpal.color_utils import (
+            ColorConfig,
+            ColorScheme,
+            Fore,
+            reset_color_config,
+            set_color_config,
+        )
+
+        expr = create_cron_expression("0 9 * * *")
+        PrettyPrinter(expr).print_simple()
+
+        config = ColorConfig(use_colors=True)
+        config.colors = {**config.colors, ColorScheme.HEADER: Fore.RED}
+        set_color_config(config)
+        try:
+            output = PrettyPrinter(expr, use_colors=False).print_simple()
+        finally:
+            reset_color_config()
+        assert output.startswith(Fore.RED)
+
+
 class TestPrettyPrinterHelpers:
     """Tests for helper functions."""
 
+    @pytest.mark.parametrize("expr_str,summary", [
+        ("* * * * *", "Runs every minute"),
+        ("30 * * * *", "Runs every hour at minute 30"),
+        ("0 9 * * *", "Runs daily at 09:00"),
+        ("0 9 * * 1", "Runs every Monday at 09:00"),
+        ("0 9 15 * *", "Runs on day 15 of every month at 09:00"),
+        ("0 9 15 6 *", "Runs on June 15 at 09:00"),
+        ("*/5 * * * *", "Runs at selected times"),
+        ("0 9 15 * 1", "Runs at 09:00 on day 15 on Monday"),
+    ])
+    def test_summary_by_schedule_kind(self, expr_str, summary):
+        """Test each common schedule, and a near miss, gets its summary."""
+        printer = PrettyPrinter(create_cron_expression(expr_str))
+
+        assert printer.get_summary() == summary
+
+    def test_get_signature(self):
+        """Test each field is classified as wildcard, single or neither."""
+        from cronpal.pretty_printer import _SINGLE, _WILDCARD, _field_code, _signature
+
+        printer = PrettyPrinter(create_cron_expression("0 9-17 * 6 *"))
+        signature = printer._get_signature()
+
+        assert signature == _signature(_SINGLE, 0, _WILDCARD, _SINGLE, _WILDCARD)
+        assert [_field_code(signature, i) for i in range(5)] == [_SINGLE, 0, _WILDCARD, _SINGLE, _WILDCARD]
+
+    def test_summary_missing_fields(self):
+        """Test expressions with missing fields are not a common schedule."""
+        printer = PrettyPrinter(CronExpression("* * * * *"))
+
+        assert printer.get_summary() == "Complex schedule"
+
     def test_is_range(self):
         """Test range detection."""
         expr = create_cron_expression("0 9-17 * * *")
@@ -304,6 +412,25 @@ class TestPrettyPrinterHelpers:
         assert printer._is_range({1, 3, 5}) is False
         assert printer._is_range({1}) is False
 
+    def test_mask_helpers(self):
+        """Test bitmask helpers used to describe fields."""
+        from cronpal.pretty_printer import _mask_bounds, _mask_is_range, _mask_step
+
+        assert _mask_bounds(0b101000) == (3, 5)
+        assert _mask_is_range(0b111000) is True
+        assert _mask_is_range(0b101000) is False
+        assert _mask_is_range(0b1000) is False
+        assert _mask_step(1 | 1 << 15 | 1 << 30) == 15
+        assert _mask_step(1 << 4) == 1
+
+    def test_is_range_sorted_tuple(self):
+        """Test range detection on a field's sorted values."""
+        printer = PrettyPrinter(create_cron_expression("0 9-17 * * *"))
+
+        assert printer._is_range((9, 10, 11)) is True
+        assert printer._is_range((9, 11, 12)) is False
+        assert printer._is_range({59, 0, 1}) is False
+
     def test_is_step(self):
         """Test step pattern detection."""
         expr = create_cron_expression("*/15 * * * *")
@@ -316,6 +443,16 @@ class TestPrettyPrinterHelpers:
         # Non-step pattern
         assert printer._is_step({1, 2, 4}, 0, 59) is False
 
+    def test_is_step_edges(self):
+        """Test step detection on short and offset sequences."""
+        printer = PrettyPrinter(create_cron_expression("* * * * *"))
+
+        assert printer._is_step({5, 25, 45}, 0, 59) is True
+        assert printer._is_step({5, 25, 45, 50}, 0, 59) is False
+        assert printer._is_step({3, 4}, 0, 59) is True
+        assert printer._is_step({3}, 0, 59) is False
+        assert printer._is_step(set(), 0, 59) is False
+
     def test_get_step_value(self):
         """Test getting step value."""
         expr = create_cron_expression("*/10 * * * *")
@@ -395,6 +532,24 @@ class TestPrettyPrinterHelpers:
         assert "1 (Monday)" in result
         assert "5 (Friday)" in result
 
+    def test_format_value_list_sorts_any_collection(self):
+        """Test values are listed in order whatever container they come in."""
+        printer = PrettyPrinter(create_cron_expression("0 0 * * *"))
+
+        from cronpal.models import FieldType
+
+        assert printer._format_value_list((30, 0, 15), FieldType.MINUTE) == "0, 15, 30"
+        assert printer._format_value_list([3, 1, 2], FieldType.MONTH) == "1 (January), 2 (February), 3 (March)"
+
+    def test_format_value_list_out_of_range_names(self):
+        """Test values without a name are labelled with their number."""
+        printer = PrettyPrinter(create_cron_expression("0 0 * * *"))
+
+        from cronpal.models import FieldType
+
+        assert printer._format_value_list({12, 13}, FieldType.MONTH) == "12 (December), 13 (13)"
+        assert printer._format_value_list({6, 7}, FieldType.DAY_OF_WEEK) == "6 (Saturday), 7 (7)"
+
 
 class TestPrettyPrinterCLI:
     """Tests for pretty printer CLI integration."""
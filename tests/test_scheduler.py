@@ -12,7 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from cronpal.exceptions import CronPalError
 from cronpal.field_parser import FieldParser
 from cronpal.models import CronExpression
-from cronpal.scheduler import CronScheduler
+from cronpal.scheduler import CronScheduler, _month_layout
 
 
 def create_cron_expression(expr_str: str) -> CronExpression:
@@ -46,6 +46,18 @@ class TestCronScheduler:
         with pytest.raises(CronPalError, match="Invalid or incomplete"):
             CronScheduler(expr)
 
+    def test_matches_time(self):
+        """Test matching single datetimes against the fields."""
+        expr = create_cron_expression("30 9 13 * FRI")
+        scheduler = CronScheduler(expr, "UTC")
+        tz = scheduler.timezone
+
+        # Day of month and day of week are both restricted, so either matches
+        assert scheduler._matches_time(tz.localize(datetime(2024, 1, 13, 9, 30)))
+        assert scheduler._matches_time(tz.localize(datetime(2024, 1, 12, 9, 30)))
+        assert not scheduler._matches_time(tz.localize(datetime(2024, 1, 11, 9, 30)))
+        assert not scheduler._matches_time(tz.localize(datetime(2024, 1, 13, 9, 31)))
+
     def test_every_minute(self):
         """Test expression that runs every minute."""
         expr = create_cron_expression("* * * * *")
@@ -310,4 +322,15 @@ class TestCronScheduler:
 
         # Next Sunday is January 14
         assert next_run == datetime(2024, 1, 14, 0, 0, 0)
-        assert next_run.weekday() == 6  # Sunday in Python
\ No newline at end of file
+        assert next_run.weekday() == 6  # Sunday in Python
+
+
+def test_month_layout():
+    """Test the cached month layout gives the days and first weekday."""
+    # February 2024 has 29 days and starts on a Thursday
+    valid_days, first_weekday = _month_layout(2024, 2)
+    assert valid_days == sum(1 << day for day in range(1, 30))
+    assert first_weekday == 4
+
+    # September 2024 starts on a Sunday
+    assert _month_layout(2024, 9)[1] == 0
@@ -239,6 +239,44 @@ class TestCronSchedulerTimezone:
         assert runs[1].hour == 4
         assert runs[2].hour == 0
 
+    def test_iter_next_runs_matches_get_next_runs(self):
+        """Test iterating next runs gives the same runs lazily."""
+        expr = create_cron_expression("0 */6 * * *")
+        scheduler = CronScheduler(expr, "Australia/Sydney")
+
+        start = pytz.timezone("Australia/Sydney").localize(
+            datetime(2024, 1, 15, 3, 0, 0)
+        )
+
+        runs = scheduler.iter_next_runs(4, start)
+
+        assert not isinstance(runs, list)
+        assert list(runs) == scheduler.get_next_runs(4, start)
+
+    def test_iter_previous_runs_matches_get_previous_runs(self):
+        """Test iterating previous runs gives the same runs lazily."""
+        expr = create_cron_expression("30 */4 * * *")
+        scheduler = CronScheduler(expr, "Europe/Paris")
+
+        start = pytz.timezone("Europe/Paris").localize(
+            datetime(2024, 1, 15, 10, 0, 0)
+        )
+
+        runs = scheduler.iter_previous_runs(3, start)
+
+        assert not isinstance(runs, list)
+        assert list(runs) == scheduler.get_previous_runs(3, start)
+
+    def test_iter_runs_invalid_count(self):
+        """Test invalid counts are rejected before iterating."""
+        expr = create_cron_expression("0 0 * * *")
+        scheduler = CronScheduler(expr, "UTC")
+
+        with pytest.raises(ValueError, match="Count must be at least 1"):
+            scheduler.iter_next_runs(0)
+        with pytest.raises(ValueError, match="Count must be at least 1"):
+            scheduler.iter_previous_runs(0)
+
     def test_weekday_calculation_with_timezone(self):
         """Test that weekday calculations work correctly with timezones."""
         expr = create_cron_expression("0 0 * * MON")  # Midnight on Mondays
@@ -53,6 +53,19 @@ class TestGetTimezone:
         assert tz is not None
         # Should be either local timezone or UTC
 
+    def test_get_timezone_is_cached(self):
+        """Test repeated lookups reuse the cached timezone."""
+        get_timezone.cache_clear()
+        first = get_timezone("Europe/Paris")
+        assert get_timezone("Europe/Paris") is first
+        assert get_timezone.cache_info().hits == 1
+
+    def test_get_timezone_invalid_not_cached(self):
+        """Test invalid names keep raising on every call."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unknown timezone"):
+                get_timezone("Invalid/Timezone")
+
 
 class TestConvertToTimezone:
     """Tests for convert_to_timezone function."""
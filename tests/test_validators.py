@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from cronpal.exceptions import InvalidCronExpression, ValidationError
 from cronpal.validators import (
+    parse_and_validate,
     validate_expression,
     validate_expression_format,
     validate_field_characters,
@@ -44,6 +45,11 @@ class TestValidateExpressionFormat:
         with pytest.raises(InvalidCronExpression, match="Invalid number of fields"):
             validate_expression_format("0 0 * * * *")
 
+    def test_too_many_fields_reports_count(self):
+        """Test the error counts every extra field."""
+        with pytest.raises(InvalidCronExpression, match="expected 5, got 7"):
+            validate_expression_format("0 0 * * *  1\t2")
+
     def test_special_string_yearly(self):
         """Test @yearly special string."""
         result = validate_expression_format("@yearly")
@@ -153,4 +159,38 @@ class TestValidateExpression:
     def test_invalid_characters(self):
         """Test expression with invalid characters."""
         with pytest.raises(ValidationError):
-            validate_expression("0 0 * * $")
\ No newline at end of file
+            validate_expression("0 0 * * $")
+
+
+class TestParseAndValidate:
+    """Tests for parse_and_validate function."""
+
+    def test_returns_fields(self):
+        """Test valid expression returns its fields."""
+        assert parse_and_validate("*/15 0-23 1,15 * MON-FRI") == [
+            "*/15", "0-23", "1,15", "*", "MON-FRI"
+        ]
+
+    def test_special_string(self):
+        """Test special strings return their expanded fields."""
+        assert parse_and_validate("@daily") == ["0", "0", "*", "*", "*"]
+
+    def test_reboot(self):
+        """Test @reboot returns a single field."""
+        assert parse_and_validate("@reboot") == ["@reboot"]
+
+    def test_invalid_expression_format(self):
+        """Test invalid expression format."""
+        with pytest.raises(InvalidCronExpression):
+            parse_and_validate("0 0 0")
+
+    def test_invalid_characters(self):
+        """Test expression with invalid characters."""
+        with pytest.raises(ValidationError, match="Position 5"):
+            parse_and_validate("0 0 * * $")
+
+    def test_result_is_a_copy(self):
+        """Test mutating the result doesn't affect later calls."""
+        fields = parse_and_validate("0 0 * * *")
+        fields[0] = "5"
+        assert parse_and_validate("0 0 * * *")[0] == "0"